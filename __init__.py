@@ -7,11 +7,26 @@
 """
 
 from .lib import Article  # noqa
+from .lib import AsyncClient  # noqa
 from .lib import Attachment  # noqa
+from .lib import Base64File  # noqa
 from .lib import Client  # noqa
+from .lib import CompactArticle  # noqa
+from .lib import CompactTicket  # noqa
 from .lib import DynamicField  # noqa
+from .lib import HistogramRecorder  # noqa
+from .lib import JSONCodec  # noqa
+from .lib import LRUCache  # noqa
+from .lib import MetricsRecorder  # noqa
+from .lib import OrjsonCodec  # noqa
+from .lib import RateLimiter  # noqa
+from .lib import RequestGovernor  # noqa
+from .lib import SearchQuery  # noqa
+from .lib import SessionProvider  # noqa
 from .lib import SessionStore  # noqa
 from .lib import Ticket  # noqa
+from .lib import TicketCache  # noqa
+from .lib import TicketNumberCache  # noqa
 
 # Set default logging handler to avoid "No handler found" warnings.
 import logging
@@ -0,0 +1,658 @@
+""" benchmark.py
+
+Benchmarks for PyOTRS (offline - no OTRS/Znuny instance required)
+
+Usage::
+
+    python -m pyotrs.benchmark memory --tickets 20000
+    python -m pyotrs.benchmark codec --tickets 500 --attachment-kb 256
+    python -m pyotrs.benchmark overhead --calls 100000
+    python -m pyotrs.benchmark server --calls 200 --threads 8 --latency 0.005
+    python -m pyotrs.benchmark links --tickets 500 --threads 8 --latency 0.005
+
+"""
+
+import argparse
+import base64
+import functools
+import gc
+import gzip
+import json
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import yaml
+except ImportError:  # pragma: no cover
+    yaml = None
+
+from pyotrs.lib import (
+    JSON_CODECS,
+    LINK_CONNECTOR_CONFIG_DEFAULT,
+    TICKET_CONNECTOR_CONFIG_DEFAULT,
+    ArgumentInvalidError,
+    Article,
+    Attachment,
+    Client,
+    CompactTicket,
+    LRUCache,
+    Ticket,
+    _json_body,
+    get_json_codec,
+)
+
+CONNECTOR_FILES = tuple(os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+                        for name in ("GenericTicketConnectorREST.yml",
+                                     "GenericLinkConnectorREST.yml"))
+WEBSERVICE_PATH = "/otrs/nph-genericinterface.pl/Webservice/"
+
+STATES = ("new", "open", "closed successful", "pending reminder")
+QUEUES = ("Raw", "Junk", "Misc", "Postmaster", "SOC::Alerts")
+
+
+def sample_ticket(tid, articles=2, dynamic_fields=3):
+    """build the data of a ticket as returned by TicketGet (Znuny 6/7)
+
+    Args:
+        tid (int): Ticket ID
+        articles (int): number of Articles
+        dynamic_fields (int): number of DynamicFields
+
+    Returns:
+        **dict**: ticket data
+
+    """
+    created = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(1700000000 + tid * 60))
+    dct = {
+        "Age": 24040576 + tid, "ArchiveFlag": "n", "ChangeBy": "1", "Changed": created,
+        "CreateBy": "1", "Created": created, "CustomerID": "example.com",
+        "CustomerUserID": "customer@example.com", "EscalationResponseTime": "0",
+        "EscalationSolutionTime": "0", "EscalationTime": "0", "EscalationUpdateTime": "0",
+        "GroupID": "1", "Lock": "unlock", "LockID": "1", "Owner": "root@localhost",
+        "OwnerID": "1", "Priority": "3 normal", "PriorityColor": "#cdcdcd", "PriorityID": "3",
+        "Queue": QUEUES[tid % len(QUEUES)], "QueueID": str(tid % len(QUEUES) + 1),
+        "RealTillTimeNotUsed": "0", "Responsible": "root@localhost", "ResponsibleID": "1",
+        "SLA": "", "SLAID": "", "Service": "", "ServiceID": "",
+        "State": STATES[tid % len(STATES)], "StateID": str(tid % len(STATES) + 1),
+        "StateType": "open", "TicketID": str(tid), "TicketNumber": f"2024{tid:012d}",
+        "Title": f"Alert {tid}: suspicious process detected", "Type": "Unclassified",
+        "TypeID": 1, "UnlockTimeout": "0", "UntilTime": 0,
+    }
+    dct["DynamicField"] = [{"Name": f"Field{num}", "Value": f"value{num}"}
+                           for num in range(dynamic_fields)]
+    dct["Article"] = [{
+        "ArticleID": str(tid * 10 + num), "ArticleNumber": str(num + 1), "Bcc": "", "Cc": "",
+        "Body": f"Article {num} of ticket {tid}\n", "ChangeBy": "1", "ChangeTime": created,
+        "Charset": "utf-8", "CommunicationChannelID": "1", "ContentCharset": "utf-8",
+        "ContentType": "text/plain; charset=utf-8", "CreateBy": "1", "CreateTime": created,
+        "From": "alerts@example.com", "InReplyTo": "", "IncomingTime": "1700000000",
+        "IsVisibleForCustomer": "1", "MessageID": f"<{tid}.{num}@example.com>",
+        "MimeType": "text/plain", "References": "", "ReplyTo": "", "SenderType": "system",
+        "SenderTypeID": "2", "Subject": f"Alert {tid}", "TicketID": str(tid), "TimeUnit": 0,
+        "To": "soc@example.com",
+    } for num in range(articles)]
+    return dct
+
+
+def measure_memory(ticket_class, response_data):
+    """measure the memory held by ticket objects created from decoded response data
+
+    Args:
+        ticket_class (type): **Ticket** or **CompactTicket**
+        response_data (bytes): JSON encoded list of tickets
+
+    Returns:
+        **int**: bytes allocated for the tickets (after the response data was released)
+
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        tickets = [ticket_class(item) for item in json.loads(response_data)]
+        for ticket in tickets:  # make sure lazy parsed data is included
+            ticket.articles  # noqa: B018
+            ticket.dynamic_fields  # noqa: B018
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del tickets
+    return size
+
+
+def bench_memory(args):
+    """compare the memory used by Ticket and CompactTicket objects"""
+    response_data = json.dumps([sample_ticket(tid, args.articles, args.dynamic_fields)
+                                for tid in range(1, args.tickets + 1)]).encode("utf-8")
+
+    results = {cls.__name__: measure_memory(cls, response_data)
+               for cls in (Ticket, CompactTicket)}
+
+    print(f"{args.tickets} tickets, {args.articles} articles and "
+          f"{args.dynamic_fields} dynamic fields each")
+    for name, size in results.items():
+        print(f"{name:<15}{size / 2 ** 20:10.1f} MiB{size / args.tickets:10.0f} B/ticket")
+    print(f"reduction: {1 - results['CompactTicket'] / results['Ticket']:.0%}")
+    return results
+
+
+def sample_ticket_get_response(tickets, attachment_kb=0):
+    """build a TicketGetList response with articles and (optionally) an attachment each
+
+    Args:
+        tickets (int): number of tickets
+        attachment_kb (int): size of the (random) attachment in the first article in KiB
+
+    Returns:
+        **dict**: TicketGetList response
+
+    """
+    content = base64.b64encode(os.urandom(attachment_kb * 1024)).decode("ascii")
+    result = []
+    for tid in range(1, tickets + 1):
+        ticket = sample_ticket(tid)
+        if attachment_kb:
+            ticket["Article"][0]["Attachment"] = [{"Content": content,
+                                                   "ContentType": "application/octet-stream",
+                                                   "Filename": f"collection-{tid}.zip",
+                                                   "FilesizeRaw": str(attachment_kb * 1024)}]
+        result.append(ticket)
+    return {"Ticket": result}
+
+
+def time_call(func, arg, repeat):
+    """return the best time of repeat calls of func(arg) in seconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_codec(args):
+    """compare the JSON codecs encoding and decoding TicketGetList responses"""
+    response = sample_ticket_get_response(args.tickets, args.attachment_kb)
+    size = len(json.dumps(response).encode("utf-8"))
+
+    print(f"{args.tickets} tickets, {args.attachment_kb} KiB attachment each: "
+          f"{size / 2 ** 20:.1f} MiB JSON")
+
+    results = {}
+    for name in JSON_CODECS:
+        try:
+            codec = get_json_codec(name)
+        except ArgumentInvalidError as err:
+            print(f"{name:<10}skipped: {err}")
+            continue
+
+        data = codec.dumps(response)
+        encode = time_call(codec.dumps, response, args.repeat)
+        decode = time_call(codec.loads, data, args.repeat)
+        results[name] = (encode, decode)
+        print(f"{name:<10}encode {size / encode / 2 ** 20:8.0f} MiB/s"
+              f"   decode {size / decode / 2 ** 20:8.0f} MiB/s")
+    return results
+
+
+def bench_overhead(args):
+    """measure the pure Python overhead per call of the Client (no HTTP requests are sent)"""
+    client = Client(baseurl="https://otrs.example.com")
+    client.session_id_store.value = "some_session_id"
+
+    calls = {
+        "TicketGet": (client._payload_ticket_get(7, articles=True), 7),
+        "TicketSearch": (client._payload_ticket_search(Title="Alert*"), None),
+        "TicketUpdate": (client._payload_ticket_update(7, State="closed"), 7),
+        "LinkAdd": (client._payload_link_add(1, 2), None),
+    }
+
+    results = {}
+    for operation, (payload, data_id) in calls.items():
+        prepare = time_call(lambda n: [client._prepare(operation, payload, data_id)
+                                       for _ in range(n)], args.calls, args.repeat)
+        encode = time_call(lambda n: [_json_body(payload, client.json_codec)
+                                      for _ in range(n)], args.calls, args.repeat)
+        results[operation] = (prepare / args.calls, encode / args.calls)
+        print(f"{operation:<15}prepare {prepare / args.calls * 1e6:6.2f} us/call"
+              f"   encode {encode / args.calls * 1e6:6.2f} us/call")
+    return results
+
+
+def load_routes(file_path):
+    """read the routes of a Web Service from its exported YAML configuration
+
+    Without PyYAML the routes of the default Client configuration are used.
+
+    Args:
+        file_path (str): e.g. GenericTicketConnectorREST.yml (the file name is the Web Service
+            name)
+
+    Returns:
+        **tuple**: (**str** Web Service name, **list** of (operation, HTTP method, route))
+
+    """
+    name = os.path.splitext(os.path.basename(file_path))[0]
+
+    if yaml is None:
+        defaults = {TICKET_CONNECTOR_CONFIG_DEFAULT["Name"]: TICKET_CONNECTOR_CONFIG_DEFAULT,
+                    LINK_CONNECTOR_CONFIG_DEFAULT["Name"]: LINK_CONNECTOR_CONFIG_DEFAULT}
+        return name, [(operation, config["RequestMethod"], config["Route"])
+                      for operation, config in defaults[name]["Config"].items()]
+
+    with open(file_path) as f:
+        config = yaml.safe_load(f)
+
+    mapping = config["Provider"]["Transport"]["Config"]["RouteOperationMapping"]
+    return name, [(operation, method, settings["Route"])
+                  for operation, settings in mapping.items()
+                  for method in settings["RequestMethod"]]
+
+
+class FakeGenericInterface:
+    """local stand-in for the GenericInterface of OTRS/Znuny (Ticket and Link Connector)
+
+    Serves the routes of the YAML files with sample data (see *sample_ticket*) over HTTP/1.1
+    with keep-alive on 127.0.0.1. Any Session ID is accepted.
+
+    Args:
+        latency (float): seconds every response is delayed (simulated server time)
+        articles (int): number of Articles per ticket
+        attachment_kb (int): size of an attachment in the first Article (if requested)
+        search_results (int): maximum number of Ticket IDs returned by TicketSearch
+        linked (int): number of tickets linked to a cluster - ticket 1 is linked to the
+            tickets 2 to 5, ticket 2 to the tickets 6 to 9 and so on (defaults to 0)
+        process (bool): serve from a child process, so the server does not compete with the
+            client for the GIL (defaults to True)
+        config_files (tuple): exported Web Service configurations (defaults to the shipped
+            GenericTicketConnectorREST.yml and GenericLinkConnectorREST.yml)
+
+    """
+
+    def __init__(self, latency=0.0, articles=2, attachment_kb=0, search_results=100,
+                 linked=0, process=True, config_files=CONNECTOR_FILES):
+        self.settings = {"latency": latency, "articles": articles,
+                         "attachment_kb": attachment_kb, "search_results": search_results,
+                         "linked": linked, "config_files": tuple(config_files)}
+        self.process = process
+        self.port = None
+        self._server = None
+        self._worker = None
+
+        self.routes = []
+        for file_path in config_files:
+            name, routes = load_routes(file_path)
+            for operation, method, route in routes:
+                pattern = re.sub(r":(\w+)", r"(?P<\1>[^/]+)", route)
+                self.routes.append((method, re.compile(f"{WEBSERVICE_PATH}{name}{pattern}$"),
+                                    operation))
+
+        self._attachment = base64.b64encode(os.urandom(attachment_kb * 1024)).decode("ascii")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.baseurl}>"
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    @property
+    def baseurl(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def start(self):
+        """start serving (in a child process or a thread)"""
+        if self.process:
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            self._worker = multiprocessing.Process(target=_serve, args=(self.settings, sender),
+                                                   daemon=True)
+            self._worker.start()
+            self.port = receiver.recv()
+        else:
+            self._server = self.create_server()
+            self.port = self._server.server_address[1]
+            self._worker = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._worker.start()
+
+    def stop(self):
+        """stop serving"""
+        if self.process:
+            self._worker.terminate()
+        else:
+            self._server.shutdown()
+            self._server.server_close()
+        self._worker.join()
+
+    def create_server(self, port=0):
+        server = ThreadingHTTPServer(("127.0.0.1", port), _GenericInterfaceHandler)
+        server.daemon_threads = True
+        server.stand_in = self
+        return server
+
+    def match(self, method, path):
+        """find the operation of a request
+
+        Returns:
+            **tuple** or **None**: (operation, route arguments)
+
+        """
+        for route_method, pattern, operation in self.routes:
+            if route_method == method:
+                match = pattern.match(path)
+                if match:
+                    return operation, match.groupdict()
+        return None
+
+    def respond(self, operation, route_args, params):
+        """build the JSON response of an operation
+
+        Returns:
+            **bytes**: response body
+
+        """
+        if operation == "TicketGet":
+            return self._tickets([route_args["TicketID"]], params)
+        if operation == "TicketGetList":
+            return self._tickets(str(params["TicketID"]).split(","), params)
+
+        if operation == "SessionCreate":
+            result = {"SessionID": "stand-in", "AccessToken": "stand-in"}
+        elif operation == "SessionGet":
+            data = [{"Key": "UserLogin", "Value": "stand-in"}]
+            result = {"SessionData": data, "AccessTokenData": data}
+        elif operation == "TicketSearch":
+            limit = min(int(params.get("Limit", self.settings["search_results"])),
+                        self.settings["search_results"])
+            result = {"TicketID": [str(tid) for tid in range(1, limit + 1)]}
+        elif operation in ("TicketCreate", "TicketUpdate"):
+            tid = int(route_args.get("TicketID", 1))
+            result = {"TicketID": str(tid), "TicketNumber": f"2024{tid:012d}"}
+            if "Article" in params:
+                result["ArticleID"] = str(tid * 10)
+        elif operation == "TicketHistoryGet":
+            result = {"TicketHistory": [{"TicketID": route_args["TicketID"], "History": [
+                {"HistoryType": "NewTicket", "Name": "created"}]}]}
+        elif operation == "LinkList":
+            result = {"LinkList": self._links(int(params["Key"])) or ""}
+        elif operation == "PossibleLinkList":
+            result = {"PossibleLinkList": [{"Object1": "Ticket", "Object2": "Ticket",
+                                            "Type": "Normal"}]}
+        elif operation == "PossibleObjectsList":
+            result = {"PossibleObject": ["Ticket"]}
+        elif operation == "PossibleTypesList":
+            result = {"PossibleType": ["Normal", "ParentChild"]}
+        else:  # LinkAdd, LinkDelete, LinkDeleteAll
+            result = {"Success": 1}
+        return json.dumps(result).encode("utf-8")
+
+    def _links(self, tid):
+        linked = self.settings["linked"]
+        if not 1 <= tid <= linked:
+            return []
+        links = [{"Object": "Ticket", "Key": str(key), "Type": "Normal", "Direction": "Target"}
+                 for key in range(4 * tid - 2, min(4 * tid + 1, linked) + 1)]
+        if tid > 1:
+            links.append({"Object": "Ticket", "Key": str((tid - 2) // 4 + 1), "Type": "Normal",
+                          "Direction": "Source"})
+        return links
+
+    def _tickets(self, ticket_ids, params):
+        articles = self.settings["articles"] if str(params.get("AllArticles")) == "1" else 0
+        attachments = str(params.get("Attachments")) == "1"
+        return b"".join((b'{"Ticket":[',
+                         b",".join(self._ticket(int(tid), articles, attachments)
+                                   for tid in ticket_ids),
+                         b"]}"))
+
+    @functools.lru_cache(maxsize=4096)  # noqa: B019
+    def _ticket(self, tid, articles, attachments):
+        ticket = sample_ticket(tid, articles)
+        if attachments and articles and self.settings["attachment_kb"]:
+            ticket["Article"][0]["Attachment"] = [{
+                "Content": self._attachment, "ContentType": "application/octet-stream",
+                "Filename": f"collection-{tid}.zip",
+                "FilesizeRaw": str(self.settings["attachment_kb"] * 1024)}]
+        return json.dumps(ticket).encode("utf-8")
+
+
+def _serve(settings, sender):
+    """serve a FakeGenericInterface (in a child process) and send the port to the parent"""
+    server = FakeGenericInterface(process=False, **settings).create_server()
+    sender.send(server.server_address[1])
+    server.serve_forever()
+
+
+class _GenericInterfaceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body are written separately
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):  # noqa: N802
+        self._handle("GET")
+
+    def do_POST(self):  # noqa: N802
+        self._handle("POST")
+
+    def do_PATCH(self):  # noqa: N802
+        self._handle("PATCH")
+
+    def do_DELETE(self):  # noqa: N802
+        self._handle("DELETE")
+
+    def _handle(self, method):
+        stand_in = self.server.stand_in
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        elif self.headers.get("Content-Encoding") == "deflate":
+            body = zlib.decompress(body)
+        if body:
+            params.update(json.loads(body))
+
+        match = stand_in.match(method, url.path)
+        if match is None:
+            self.send_error(404)
+            return
+
+        if stand_in.settings["latency"]:
+            time.sleep(stand_in.settings["latency"])
+
+        data = stand_in.respond(match[0], match[1], params)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def server_calls(client, args):
+    """the benchmarked calls: operation -> function of the call number"""
+    attachment = Attachment.create_basic(
+        Content=base64.b64encode(os.urandom(args.attachment_kb * 1024)).decode("ascii"),
+        ContentType="application/octet-stream", Filename="collection.zip")
+    size = args.list_size
+
+    return {
+        "TicketGet": lambda num: client.ticket_get_by_id(num + 1, articles=True,
+                                                         attachments=True),
+        "TicketGetList": lambda num: client.ticket_get_by_list(
+            list(range(num * size + 1, num * size + size + 1)), articles=True),
+        "TicketSearch": lambda num: client.ticket_search(Title="Alert*"),
+        "TicketUpdate": lambda num: client.ticket_update(
+            num + 1, article=Article({"Subject": "enriched", "Body": "results attached"}),
+            attachments=[attachment] if args.attachment_kb else None, State="open"),
+    }
+
+
+def run_calls(client, call, calls, mode, threads):
+    """call call(num) calls times in one of the modes "sync", "pooled" or "concurrent"
+
+    Returns:
+        **tuple**: (**float** seconds, **list** of latencies)
+
+    """
+    def timed(num):
+        start = time.perf_counter()
+        call(num)
+        latency = time.perf_counter() - start
+        if mode == "sync":
+            client.close()  # no keep-alive: every call opens a new connection
+        return latency
+
+    start = time.perf_counter()
+    if mode == "concurrent":
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            latencies = list(executor.map(timed, range(calls)))
+    else:
+        latencies = [timed(num) for num in range(calls)]
+    return time.perf_counter() - start, latencies
+
+
+def percentile(values, percent):
+    """percentile of values (nearest rank)"""
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, round(len(ordered) * percent / 100) - 1))]
+
+
+def bench_server(args):
+    """compare sync, pooled and concurrent calls against a local stand-in GenericInterface"""
+    print(f"{args.calls} calls per operation, {args.latency * 1000:.1f} ms server latency, "
+          f"{args.attachment_kb} KiB attachments, {args.threads} threads (concurrent)")
+    print(f"{'operation':<15}{'mode':<12}{'ops/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+          f"{'peak KiB':>10}")
+
+    results = {}
+    with FakeGenericInterface(latency=args.latency, articles=args.articles,
+                              attachment_kb=args.attachment_kb,
+                              process=not args.in_process) as server:
+        client = Client(baseurl=server.baseurl, pool_maxsize=args.threads)
+        client.session_id_store.value = "stand-in"
+        calls = server_calls(client, args)
+
+        for operation in args.operations:
+            for mode in args.modes:
+                call = calls[operation]
+                run_calls(client, call, min(args.calls, 5), mode, args.threads)  # warm up
+                elapsed, latencies = run_calls(client, call, args.calls, mode, args.threads)
+
+                # memory in a separate (shorter) run - tracing slows down the calls
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    run_calls(client, call, min(args.calls, 10), mode, args.threads)
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+
+                results[(operation, mode)] = {"ops": args.calls / elapsed,
+                                              "p50": percentile(latencies, 50),
+                                              "p99": percentile(latencies, 99),
+                                              "peak": peak}
+                print(f"{operation:<15}{mode:<12}{args.calls / elapsed:10.0f}"
+                      f"{percentile(latencies, 50) * 1000:10.2f}"
+                      f"{percentile(latencies, 99) * 1000:10.2f}{peak / 1024:10.0f}")
+        client.close()
+    return results
+
+
+def bench_links(args):
+    """compare serial and concurrent link graph fetches against a local stand-in server"""
+    print(f"cluster of {args.tickets} linked tickets, {args.latency * 1000:.1f} ms server latency")
+    print(f"{'mode':<12}{'tickets':>10}{'seconds':>10}")
+
+    results = {}
+    with FakeGenericInterface(latency=args.latency, linked=args.tickets,
+                              process=not args.in_process) as server:
+        client = Client(baseurl=server.baseurl, pool_maxsize=args.threads)
+        client.session_id_store.value = "stand-in"
+        link_cache = LRUCache(maxsize=args.tickets)
+
+        runs = (("serial", 1, None), ("concurrent", args.threads, link_cache),
+                ("cached", args.threads, link_cache))
+        for mode, max_in_flight, cache in runs:
+            start = time.perf_counter()
+            graph = client.link_graph(1, max_tickets=args.tickets, max_in_flight=max_in_flight,
+                                      link_cache=cache)
+            elapsed = time.perf_counter() - start
+            results[mode] = {"tickets": len(graph), "seconds": elapsed}
+            print(f"{mode:<12}{len(graph):10d}{elapsed:10.3f}")
+        client.close()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PyOTRS offline benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    memory = subparsers.add_parser("memory", help=bench_memory.__doc__)
+    memory.add_argument("--tickets", type=int, default=20000)
+    memory.add_argument("--articles", type=int, default=2)
+    memory.add_argument("--dynamic-fields", type=int, default=3)
+    memory.set_defaults(func=bench_memory)
+
+    codec = subparsers.add_parser("codec", help=bench_codec.__doc__)
+    codec.add_argument("--tickets", type=int, default=500)
+    codec.add_argument("--attachment-kb", type=int, default=64)
+    codec.add_argument("--repeat", type=int, default=5)
+    codec.set_defaults(func=bench_codec)
+
+    overhead = subparsers.add_parser("overhead", help=bench_overhead.__doc__)
+    overhead.add_argument("--calls", type=int, default=100000)
+    overhead.add_argument("--repeat", type=int, default=5)
+    overhead.set_defaults(func=bench_overhead)
+
+    server = subparsers.add_parser("server", help=bench_server.__doc__)
+    server.add_argument("--calls", type=int, default=200)
+    server.add_argument("--threads", type=int, default=8)
+    server.add_argument("--latency", type=float, default=0.005,
+                        help="simulated server time in seconds")
+    server.add_argument("--articles", type=int, default=2)
+    server.add_argument("--attachment-kb", type=int, default=64)
+    server.add_argument("--list-size", type=int, default=20,
+                        help="tickets per TicketGetList request")
+    server.add_argument("--operations", nargs="+",
+                        default=["TicketGet", "TicketGetList", "TicketSearch", "TicketUpdate"],
+                        choices=["TicketGet", "TicketGetList", "TicketSearch", "TicketUpdate"])
+    server.add_argument("--modes", nargs="+", default=["sync", "pooled", "concurrent"],
+                        choices=["sync", "pooled", "concurrent"])
+    server.add_argument("--in-process", action="store_true",
+                        help="serve from a thread instead of a child process")
+    server.set_defaults(func=bench_server)
+
+    links = subparsers.add_parser("links", help=bench_links.__doc__)
+    links.add_argument("--tickets", type=int, default=500)
+    links.add_argument("--threads", type=int, default=8)
+    links.add_argument("--latency", type=float, default=0.005,
+                       help="simulated server time in seconds")
+    links.add_argument("--in-process", action="store_true",
+                       help="serve from a thread instead of a child process")
+    links.set_defaults(func=bench_links)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# EOF
@@ -5,19 +5,46 @@ PyOTRS lib
 This code implements the PyOTRS library to provide access to the OTRS API (REST)
 """
 
+import asyncio
 import base64
+import collections
+import collections.abc
+import contextlib
+import copy
 import datetime
+import functools
+import gzip
+import itertools
 import json
 import logging
+import math
 import mimetypes
 import os
+import re
+import sys
+import threading
 import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlencode
 
 import deprecation
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .version import __version__
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
 log = logging.getLogger(__name__)
 
 TICKET_CONNECTOR_CONFIG_DEFAULT = {
@@ -128,6 +155,608 @@ class HTTPError(PyOTRSError):
     pass
 
 
+def _bounded_map(func, items, max_in_flight):
+    """call func for every item on up to max_in_flight threads
+
+    Items are submitted lazily (never more than max_in_flight at a time) and results are
+    yielded as soon as they are available - not necessarily in the order of items.
+
+    Args:
+        func (callable): function called with one item
+        items (iterable): items to process
+        max_in_flight (int): maximum number of concurrent calls
+
+    Returns:
+        **generator**: results of func
+
+    """
+    if max_in_flight < 1:
+        raise ArgumentInvalidError("max_in_flight must be at least 1")
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="pyotrs") as executor:
+        pending = {executor.submit(func, item) for item in itertools.islice(items, max_in_flight)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                # keep the pipeline busy while the consumer handles this result
+                for item in itertools.islice(items, 1):
+                    pending.add(executor.submit(func, item))
+                yield future.result()
+
+
+def _prefetch_map(func, items, prefetch):
+    """call func for every item in background threads, up to prefetch items ahead
+
+    Results are yielded in the order of items. While the consumer handles one result the
+    next *prefetch* calls are already running.
+
+    Args:
+        func (callable): function called with one item
+        items (iterable): items to process
+        prefetch (int): number of calls running ahead of the consumer
+
+    Returns:
+        **generator**: results of func
+
+    """
+    if prefetch < 1:
+        raise ArgumentInvalidError("prefetch must be at least 1")
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="pyotrs") as executor:
+        pending = collections.deque(executor.submit(func, item)
+                                    for item in itertools.islice(items, prefetch))
+        while pending:
+            result = pending.popleft().result()
+            for item in itertools.islice(items, 1):
+                pending.append(executor.submit(func, item))
+            yield result
+
+
+class RateLimiter:
+    """PyOTRS RateLimiter class - token bucket limiting the rate of requests (thread safe)
+
+    Args:
+        rate (float): requests per second
+        burst (int): number of requests that may be sent at once after being idle
+            (defaults to 1)
+
+    """
+
+    def __init__(self, rate, burst=1):
+        if not rate or rate <= 0:
+            raise ArgumentInvalidError("rate must be greater than 0")
+        if burst < 1:
+            raise ArgumentInvalidError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.rate}/s (burst {self.burst})>"
+
+    def acquire(self):
+        """wait until a request may be sent
+
+        Waiting callers reserve their token first, so they are served in order and the lock
+        is not held while sleeping.
+
+        Returns:
+            **float**: seconds waited
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if delay:
+            time.sleep(delay)
+        return delay
+
+
+class RequestGovernor:
+    """PyOTRS RequestGovernor class - limits rate and concurrency of requests (thread safe)
+
+    Limits apply to all requests of the Clients sharing the governor (see
+    *Client(governor=...)*) - including those of an *AsyncClient*, whose worker threads wait
+    for a free slot. A request has to pass the limits of its operation (if configured) and
+    the limits for all operations.
+
+    Args:
+        rate (float): requests per second for all operations (defaults to None - no limit)
+        burst (int): requests that may be sent at once after being idle (defaults to 1)
+        max_concurrency (int): requests in flight for all operations (defaults to None - no
+            limit)
+        operations (dict): limits per operation: name of the operation -> **dict** with the
+            keys "rate", "burst" and/or "max_concurrency"; e.g.
+            {"TicketSearch": {"max_concurrency": 2}, "TicketUpdate": {"rate": 5}}
+
+    """
+
+    def __init__(self, rate=None, burst=1, max_concurrency=None, operations=None):
+        self.rate = rate
+        self.max_concurrency = max_concurrency
+        self._limits = self._create_limits(rate, burst, max_concurrency)
+        self._operation_limits = {name: self._create_limits(**limits)
+                                  for name, limits in (operations or {}).items()}
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__}: rate={self.rate}, "
+                f"max_concurrency={self.max_concurrency}>")
+
+    @staticmethod
+    def _create_limits(rate=None, burst=1, max_concurrency=None):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ArgumentInvalidError("max_concurrency must be at least 1")
+
+        return (RateLimiter(rate, burst) if rate is not None else None,
+                threading.BoundedSemaphore(max_concurrency) if max_concurrency else None)
+
+    @contextlib.contextmanager
+    def slot(self, operation=None):
+        """wait until a request for operation may be sent and hold the slot while it runs
+
+        Args:
+            operation (str): Name of the OTRS WebService operation
+
+        Returns:
+            **float**: seconds waited for the slot (as value of the context manager)
+
+        """
+        limits = [self._limits]
+        if operation in self._operation_limits:
+            limits.insert(0, self._operation_limits[operation])
+
+        start = time.perf_counter()
+        acquired = []
+        try:
+            # concurrency first: a rate token is only used when the request can be sent
+            for _rate, semaphore in limits:
+                if semaphore is not None:
+                    semaphore.acquire()
+                    acquired.append(semaphore)
+            for rate, _semaphore in limits:
+                if rate is not None:
+                    rate.acquire()
+
+            delay = time.perf_counter() - start
+            stats = self._start(operation, delay)
+            try:
+                yield delay
+            finally:
+                with self._stats_lock:
+                    stats.in_flight -= 1
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+    def _start(self, operation, delay):
+        with self._stats_lock:
+            stats = self._stats.get(operation)
+            if stats is None:
+                stats = self._stats[operation] = _GovernorStats()
+            stats.requests += 1
+            if delay > 0.001:
+                stats.queued += 1
+            stats.delay_total += delay
+            stats.delay_max = max(stats.delay_max, delay)
+            stats.in_flight += 1
+            stats.in_flight_max = max(stats.in_flight_max, stats.in_flight)
+        return stats
+
+    def metrics(self):
+        """queueing metrics per operation since creation (or *reset_metrics*)
+
+        Returns:
+            **dict**: Name of the operation -> **dict** with "requests", "queued" (requests
+            that waited more than 1 ms), "delay_total", "delay_max" and "delay_avg" (seconds
+            waited for a slot), "in_flight" and "in_flight_max"
+
+        """
+        with self._stats_lock:
+            return {operation: stats.as_dict() for operation, stats in self._stats.items()}
+
+    def reset_metrics(self):
+        """reset the metrics (requests in flight are still counted)"""
+        with self._stats_lock:
+            for stats in self._stats.values():
+                in_flight = stats.in_flight
+                stats.__init__()
+                stats.in_flight = stats.in_flight_max = in_flight
+
+
+class _GovernorStats:
+    """queueing metrics of one operation (see *RequestGovernor.metrics*)"""
+    __slots__ = ("requests", "queued", "delay_total", "delay_max", "in_flight",
+                 "in_flight_max")
+
+    def __init__(self):
+        self.requests = 0
+        self.queued = 0
+        self.delay_total = 0.0
+        self.delay_max = 0.0
+        self.in_flight = 0
+        self.in_flight_max = 0
+
+    def as_dict(self):
+        dct = {name: getattr(self, name) for name in self.__slots__}
+        dct["delay_avg"] = self.delay_total / self.requests if self.requests else 0.0
+        return dct
+
+
+class MetricsRecorder:
+    """PyOTRS MetricsRecorder class - receives the measurements of a Client
+
+    Subclass it and override *record* or pass a callback. A Client with a recorder (see
+    *Client(recorder=...)*) records these metrics per operation:
+
+        * wall: seconds from sending the request until the response was validated
+        * http: seconds of the HTTP request - incl. connection setup and reading the response
+        * ttfb: seconds until the response headers arrived (connection setup and server time)
+        * encode: seconds for JSON encoding (and compressing) the request body
+        * decode: seconds for JSON decoding the response
+        * parse: seconds for creating the Ticket objects (TicketGet, TicketGetList)
+        * request_bytes: size of the request body (of the query string for GET)
+        * response_bytes: size of the (decompressed) response body
+        * errors: 1 for every request that failed (HTTP or API error)
+
+    Args:
+        callback (callable): called with (operation, metric, value) for every measurement
+            (defaults to None)
+
+    .. note::
+        *record* is called from all threads sending requests and has to be thread safe.
+
+    """
+
+    def __init__(self, callback=None):
+        self.callback = callback
+
+    def record(self, operation, metric, value):
+        """record one measurement
+
+        Args:
+            operation (str): Name of the OTRS WebService operation
+            metric (str): Name of the metric (e.g. "wall")
+            value (float): measured value (seconds, bytes or count)
+
+        """
+        if self.callback is not None:
+            self.callback(operation, metric, value)
+
+
+class HistogramRecorder(MetricsRecorder):
+    """PyOTRS HistogramRecorder class - keeps histograms of all measurements in memory
+
+    Values are counted in logarithmic buckets (4 per power of 2) so percentiles are
+    estimated with an error of at most 19%.
+
+    Args:
+        callback (callable): see *MetricsRecorder* (defaults to None)
+
+    """
+
+    def __init__(self, callback=None):
+        super().__init__(callback)
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {len(self._histograms)} histograms>"
+
+    def record(self, operation, metric, value):
+        super().record(operation, metric, value)
+        with self._lock:
+            histogram = self._histograms.get((operation, metric))
+            if histogram is None:
+                histogram = self._histograms[(operation, metric)] = _Histogram()
+            histogram.add(value)
+
+    def clear(self):
+        """remove all measurements"""
+        with self._lock:
+            self._histograms.clear()
+
+    def percentile(self, operation, metric, percent):
+        """estimate a percentile of a metric
+
+        Args:
+            operation (str): Name of the OTRS WebService operation
+            metric (str): Name of the metric
+            percent (float): e.g. 50 for the median
+
+        Returns:
+            **float** or **None**: estimated value (None if nothing was recorded)
+
+        """
+        with self._lock:
+            histogram = self._histograms.get((operation, metric))
+            return histogram.percentile(percent) if histogram else None
+
+    def snapshot(self):
+        """all histograms
+
+        Returns:
+            **dict**: operation -> metric -> **dict** with "count", "sum", "min", "max",
+            "p50", "p95", "p99" and "buckets" (upper bound -> count)
+
+        """
+        result = {}
+        with self._lock:
+            for (operation, metric), histogram in sorted(self._histograms.items(),
+                                                         key=lambda item: str(item[0])):
+                result.setdefault(operation, {})[metric] = histogram.as_dict()
+        return result
+
+    def report(self):
+        """all histograms as text table (count, average and percentiles)
+
+        Returns:
+            **str**
+
+        """
+        lines = [f"{'operation':<22}{'metric':<16}{'count':>8}{'avg':>12}{'p50':>12}"
+                 f"{'p95':>12}{'p99':>12}{'max':>12}"]
+        for operation, metrics in self.snapshot().items():
+            for metric, stats in metrics.items():
+                values = [stats["sum"] / stats["count"], stats["p50"], stats["p95"],
+                          stats["p99"], stats["max"]]
+                lines.append(f"{str(operation):<22}{metric:<16}{stats['count']:>8}"
+                             + "".join(f"{value:>12.6g}" for value in values))
+        return "\n".join(lines)
+
+
+class _Histogram:
+    """logarithmic histogram of one metric (see *HistogramRecorder*)"""
+    __slots__ = ("count", "sum", "min", "max", "buckets")
+
+    RESOLUTION = 4  # buckets per power of 2
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self.buckets = {}
+
+    def add(self, value):
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        key = math.floor(math.log2(value) * self.RESOLUTION) if value > 0 else None
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def _upper_bound(self, key):
+        return 0.0 if key is None else 2 ** ((key + 1) / self.RESOLUTION)
+
+    def _sorted_buckets(self):
+        return sorted(self.buckets.items(),
+                      key=lambda item: -math.inf if item[0] is None else item[0])
+
+    def percentile(self, percent):
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for key, count in self._sorted_buckets():
+            seen += count
+            if seen >= rank:
+                return min(max(self._upper_bound(key), self.min), self.max)
+        return self.max
+
+    def as_dict(self):
+        return {"count": self.count, "sum": self.sum, "min": self.min, "max": self.max,
+                "p50": self.percentile(50), "p95": self.percentile(95),
+                "p99": self.percentile(99),
+                "buckets": {self._upper_bound(key): count
+                            for key, count in self._sorted_buckets()}}
+
+
+class RequestContext(collections.namedtuple("RequestContext", ["operation",
+                                                               "http_method",
+                                                               "url",
+                                                               "payload",
+                                                               "data_id",
+                                                               "result_type"])):
+    """PyOTRS RequestContext - immutable description of one request to the OTRS API
+
+    Args:
+        operation (str): Name of the OTRS WebService operation (e.g. "TicketGet")
+        http_method (str): HTTP method (e.g. "GET")
+        url (str): The complete URL where the request will be send to
+        payload (dict): payload of the request
+        data_id (int): ID used in the route (e.g. TicketID) or None
+        result_type (str): key of the result in the response JSON (e.g. "Ticket")
+
+    """
+    __slots__ = ()
+
+
+class OperationRoute(collections.namedtuple("OperationRoute", ["http_method",
+                                                               "url",
+                                                               "result_type",
+                                                               "connector",
+                                                               "route",
+                                                               "route_arg"])):
+    """PyOTRS OperationRoute - precompiled request settings of one OTRS WebService operation
+
+    Args:
+        http_method (str): HTTP method (e.g. "GET")
+        url (str): The complete URL - or the part before the ID if the route has an argument
+            (None if the route is unknown)
+        result_type (str): key of the result in the response JSON (e.g. "Ticket")
+        connector (str): Name of the Web Service (e.g. "GenericTicketConnectorREST")
+        route (str): Route (without argument) as configured (e.g. "/Ticket/")
+        route_arg (str): Name of the route argument ("TicketID" or "SessionID") or None
+
+    """
+    __slots__ = ()
+
+
+class ClientResponse:
+    """PyOTRS ClientResponse class - result of one request sent by *Client.execute*
+
+    Args:
+        context (RequestContext): the request that was sent
+        status_code (int): HTTP status code
+        result_json (dict): decoded JSON response
+        result: result of the operation (e.g. list of Ticket objects for TicketGet)
+        success (bool): whether the operation was successful
+        elapsed (float): seconds from sending the request until the response was validated
+
+    """
+
+    def __init__(self, context, status_code, result_json, result, success, elapsed):
+        self.context = context
+        self.status_code = status_code
+        self.result_json = result_json
+        self.result = result
+        self.success = success
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.context.operation} ({self.status_code})>"
+
+    @property
+    def operation(self):
+        return self.context.operation
+
+
+class TicketUpdateResult:
+    """PyOTRS TicketUpdateResult class - outcome of one update of *Client.ticket_update_bulk*
+
+    Args:
+        ticket_id (int): Ticket ID
+        success (bool): whether the ticket was updated
+        result_json (dict): decoded JSON response (None if the request failed)
+        error (Exception): the error if the request failed (otherwise None)
+        elapsed (float): seconds from sending the request until the response was validated
+
+    """
+
+    def __init__(self, ticket_id, success, result_json=None, error=None, elapsed=0.0):
+        self.ticket_id = ticket_id
+        self.success = success
+        self.result_json = result_json
+        self.error = error
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        state = "ok" if self.success else "failed"
+        return f"<{self.__class__.__name__}: {self.ticket_id} ({state})>"
+
+
+class _PerThreadAttribute:
+    """descriptor storing a Client attribute separately for every thread"""
+
+    def __init__(self, default=None, factory=None):
+        self.default = default
+        self.factory = factory
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj._thread_state, self.name)
+        except AttributeError:
+            value = self.factory() if self.factory else self.default
+            setattr(obj._thread_state, self.name, value)
+            return value
+
+    def __set__(self, obj, value):
+        setattr(obj._thread_state, self.name, value)
+
+
+_key_version = [0]  # incremented by every change of an indexed key in place
+
+
+def _key_changed():
+    """outdate all lookup indexes (see *_IndexedList*)"""
+    _key_version[0] += 1
+
+
+class _IndexedList(list):
+    """list with a lookup index (key -> first matching item)
+
+    The index is built on the first lookup and dropped by every list mutation and by every
+    rename in place (*DynamicField.name*, *Attachment.Filename* - see *_key_changed*).
+    Changing "ArticleID" in *Article.fields* is not tracked: assign the articles of the
+    Ticket again after doing so.
+    """
+
+    __slots__ = ("_key", "_index", "_version")
+
+    def __init__(self, iterable=(), key=None):
+        super().__init__(iterable)
+        self._key = key
+        self._index = None
+        self._version = None
+
+    def lookup(self, value):
+        """return the first item with key value or None"""
+        if self._index is None or self._version != _key_version[0]:
+            self._build_index()
+        return self._index.get(value)
+
+    def _build_index(self):
+        self._version = _key_version[0]  # before reading the keys - a rename meanwhile counts
+        index = {}
+        for item in self:
+            index.setdefault(self._key(item), item)
+        self._index = index
+
+
+def _invalidating(name):
+    method = getattr(list, name)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._index = None
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend",
+              "insert", "pop", "remove", "clear", "sort", "reverse"):
+    setattr(_IndexedList, _name, _invalidating(_name))
+del _name
+
+
+def _attachment_dct(dct, content=True):
+    """shallow copy of the data of an Attachment - optionally without Content"""
+    if content:
+        return dict(dct)
+    return {key: value for key, value in dct.items() if key != "Content"}
+
+
+def _dynamic_field_dct(dct):
+    """the data of a DynamicField as returned by *DynamicField.to_dct*"""
+    return {"Name": dct["Name"], "Value": dct["Value"]}
+
+
+def _article_id_key(article):
+    return article.field_get("ArticleID")
+
+
+def _dynamic_field_key(dynamic_field):
+    return dynamic_field.name
+
+
+def _attachment_key(attachment):
+    return getattr(attachment, "Filename", None)
+
+
 class Article:
     """PyOTRS Article class """
 
@@ -143,15 +772,19 @@ class Article:
 
         self.fields = fields
 
-        self.attachments = self._parse_attachments()
-        self.fields.pop("Attachment", None)
+        # Attachments and DynamicFields are parsed on first access
+        self._raw_attachments = self.fields.pop("Attachment", None)
+        self._attachments = None
 
-        self.dynamic_fields = self._parse_dynamic_fields()
-        self.fields.pop("DynamicField", None)
+        self._raw_dynamic_fields = self.fields.pop("DynamicField", None)
+        self._dynamic_fields = None
 
     def __repr__(self):
         if self.aid != 0:
-            _len = len(self.attachments)
+            if self._attachments is None:
+                _len = len(self._raw_attachments or [])
+            else:
+                _len = len(self._attachments)
             if _len == 0:
                 return f"<ArticleID: {self.aid}>"
             elif _len == 1:
@@ -179,12 +812,21 @@ class Article:
         dct = {}
 
         if attachments:
-            if self.attachments:
+            if self._attachments is None:
+                # not parsed yet - serialize the raw data without creating objects
+                if self._raw_attachments:
+                    dct.update({"Attachment": [_attachment_dct(x, attachment_cont) for x in
+                                               self._raw_attachments]})
+            elif self.attachments:
                 dct.update({"Attachment": [x.to_dct(content=attachment_cont) for x in
                                            self.attachments]})
 
         if dynamic_fields:
-            if self.dynamic_fields:
+            if self._dynamic_fields is None:
+                if self._raw_dynamic_fields:
+                    dct.update({"DynamicField": [_dynamic_field_dct(x) for x in
+                                                 self._raw_dynamic_fields]})
+            elif self.dynamic_fields:
                 dct.update({"DynamicField": [x.to_dct() for x in self.dynamic_fields]})
 
         if self.fields:
@@ -192,9 +834,62 @@ class Article:
 
         return dct
 
+    @staticmethod
+    def _raw_to_dct(raw, attachments=True, attachment_cont=True, dynamic_fields=True):
+        """represent the raw data of an Article as dict (same result as *to_dct*)"""
+        dct = {}
+
+        if attachments and raw.get("Attachment"):
+            dct.update({"Attachment": [_attachment_dct(x, attachment_cont) for x in
+                                       raw["Attachment"]]})
+
+        if dynamic_fields and raw.get("DynamicField"):
+            dct.update({"DynamicField": [_dynamic_field_dct(x) for x in raw["DynamicField"]]})
+
+        dct.update((key, value) for key, value in raw.items()
+                   if key not in ("Attachment", "DynamicField"))
+        return dct
+
+    @property
+    def attachments(self):
+        """**list** of **Attachment** objects (parsed on first access)"""
+        if self._attachments is None:
+            self._attachments = _IndexedList(self._parse_attachments(), _attachment_key)
+            self._raw_attachments = None
+        return self._attachments
+
+    @attachments.setter
+    def attachments(self, value):
+        self._attachments = _IndexedList(value or (), _attachment_key)
+        self._raw_attachments = None
+
+    @attachments.deleter
+    def attachments(self):
+        del self._attachments
+        self._raw_attachments = None
+
+    @property
+    def dynamic_fields(self):
+        """**list** of **DynamicField** objects (parsed on first access)"""
+        if self._dynamic_fields is None:
+            self._dynamic_fields = _IndexedList(self._parse_dynamic_fields(),
+                                                _dynamic_field_key)
+            self._raw_dynamic_fields = None
+        return self._dynamic_fields
+
+    @dynamic_fields.setter
+    def dynamic_fields(self, value):
+        self._dynamic_fields = _IndexedList(value or (), _dynamic_field_key)
+        self._raw_dynamic_fields = None
+
+    @dynamic_fields.deleter
+    def dynamic_fields(self):
+        del self._dynamic_fields
+        self._raw_dynamic_fields = None
+
     def _parse_attachments(self):
         """parse Attachment from Ticket and return as **list** of **Attachment** objects"""
-        lst = self.fields.get("Attachment")
+        lst = self._raw_attachments
         if lst:
             return [Attachment(item) for item in lst]
         else:
@@ -202,7 +897,7 @@ class Article:
 
     def _parse_dynamic_fields(self):
         """parse DynamicField from Ticket and return as **list** of **DynamicField** objects"""
-        lst = self.fields.get("DynamicField")
+        lst = self._raw_dynamic_fields
         if lst:
             return [DynamicField.from_dct(item) for item in lst]
         else:
@@ -218,11 +913,7 @@ class Article:
             **Attachment** or **None**
 
         """
-        result = [x for x in self.attachments if x.Filename == f"{a_filename}"]
-        if result:
-            return result[0]
-        else:
-            return None
+        return self.attachments.lookup(f"{a_filename}")
 
     def dynamic_field_get(self, df_name):
         """dynamic_field_get
@@ -234,12 +925,7 @@ class Article:
             **DynamicField** or **None**
 
         """
-
-        result = [x for x in self.dynamic_fields if x.name == f"{df_name}"]
-        if result:
-            return result[0]
-        else:
-            return None
+        return self.dynamic_fields.lookup(f"{df_name}")
 
     def field_get(self, f_name):
         return self.fields.get(f_name)
@@ -300,10 +986,62 @@ class Article:
 
 
 class Attachment:
-    """PyOTRS Attachment class """
+    """PyOTRS Attachment class
+
+    Content, ContentType and Filename are stored in slots. Other keys of the OTRS data
+    (e.g. FilesizeRaw) are available as attributes too - they are kept in a dict which is
+    only created if there are any.
+    """
+
+    __slots__ = ("Content", "ContentType", "_filename", "_extra")
 
     def __init__(self, dct):
-        self.__dict__ = dct
+        self._extra = None
+        for key, value in dct.items():
+            if key == "Filename":
+                self._filename = value
+            else:
+                setattr(self, key, value)
+
+    def __getattr__(self, name):
+        # only called if there is no such slot (or it is not set)
+        extra = None if name.startswith("_") else self._extra
+        if extra is None or name not in extra:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute "
+                                 f"'{name}'")
+        return extra[name]
+
+    def __setattr__(self, name, value):
+        try:
+            object.__setattr__(self, name, value)
+        except AttributeError:
+            if name.startswith("_"):
+                raise
+            if self._extra is None:
+                self._extra = {}
+            self._extra[name] = value
+
+    def __delattr__(self, name):
+        try:
+            object.__delattr__(self, name)
+        except AttributeError:
+            if name.startswith("_") or not self._extra or name not in self._extra:
+                raise
+            del self._extra[name]
+
+    @property
+    def Filename(self):  # noqa: N802
+        return self._filename
+
+    @Filename.setter
+    def Filename(self, value):  # noqa: N802
+        self._filename = value
+        _key_changed()
+
+    @Filename.deleter
+    def Filename(self):  # noqa: N802
+        del self._filename
+        _key_changed()
 
     def __repr__(self):
         if hasattr(self, 'Filename'):
@@ -317,15 +1055,17 @@ class Attachment:
             content (bool): if True will include, otherwise exclude: "Content" (default: True)
 
         Returns:
-            **dict**: Attachment represented as dict.
+            **dict**: Attachment represented as dict (a shallow copy - the Attachment is not
+            modified and the Content is not copied).
 
         """
-        dct = self.__dict__
-        if content:
-            return dct
-        else:
-            dct.pop("Content")
-            return dct
+        dct = {}
+        for key in ("Content", "ContentType", "Filename"):
+            if (content or key != "Content") and hasattr(self, key):
+                dct[key] = getattr(self, key)
+        if self._extra:
+            dct.update(self._extra)
+        return dct
 
     @classmethod
     def create_basic(cls, Content=None, ContentType=None, Filename=None):  # noqa: N803
@@ -346,31 +1086,37 @@ class Attachment:
                            'Filename': Filename})
 
     @classmethod
-    def create_from_file(cls, file_path):
+    def create_from_file(cls, file_path, stream=False):
         """save Attachment to a folder on disc
 
         Args:
             file_path (str): The full path to the file from which an Attachment should be created.
+            stream (bool): if True the file is not read now - Content is a **Base64File** which
+                is read and base64 encoded in chunks while the request is sent (default: False)
 
         Returns:
             **Attachment**: An Attachment object.
 
         """
-        with open(file_path, 'rb') as f:
-            content = f.read()
+        if stream:
+            content = Base64File(file_path)
+        else:
+            with open(file_path, 'rb') as f:
+                content = base64.b64encode(f.read()).decode('utf-8')
 
         content_type = mimetypes.guess_type(file_path)[0]
         if not content_type:
             content_type = "application/octet-stream"
-        return Attachment({'Content': base64.b64encode(content).decode('utf-8'),
+        return Attachment({'Content': content,
                            'ContentType': content_type,
                            'Filename': os.path.basename(file_path)})
 
-    def save_to_dir(self, folder="/tmp"):
+    def save_to_dir(self, folder="/tmp", chunk_size=1048576):
         """save Attachment to a folder on disc
 
         Args:
             folder (str): The directory where this attachment should be saved to.
+            chunk_size (int): number of base64 characters decoded at once (default: 1 MiB)
 
         Returns:
             **bool**: True
@@ -381,7 +1127,11 @@ class Attachment:
 
         file_path = os.path.join(os.path.abspath(folder), self.Filename)
         with open(file_path, 'wb') as f:
-            f.write(base64.b64decode(self.Content))
+            if isinstance(self.Content, Base64File):
+                for chunk in self.Content.raw_chunks():
+                    f.write(chunk)
+            else:
+                _b64decode_to_file(self.Content, f, chunk_size)
 
         return True
 
@@ -396,59 +1146,467 @@ class Attachment:
         return Attachment.create_basic("YmFyCg==", "text/plain", "dümmy.txt")
 
 
-class DynamicField:
-    """PyOTRS DynamicField class
+class Base64File:
+    """PyOTRS Base64File class - base64 encoded content of a file (encoded when sent)
+
+    Used as Content of an **Attachment** (see *Attachment.create_from_file*): the file is
+    read and base64 encoded in chunks directly into the request body, so the size of the
+    file does not bound the memory used.
 
     Args:
-        name (str): Name of OTRS DynamicField (required)
-        value (str): Value of OTRS DynamicField
-        search_operator (str): Search operator (defaults to: "Equals")
-            Valid options are:
-            "Equals", "Like", "GreaterThan", "GreaterThanEquals",
-            "SmallerThan", "SmallerThanEquals"
-        search_patterns (list): List of patterns (str or datetime) to search for
+        file_path (str): path of the file
+        chunk_size (int): bytes read at once, rounded down to a multiple of 3
+            (defaults to 786432 - 768 KiB)
 
     """
 
-    SEARCH_OPERATORS = ("Equals", "Like", "GreaterThan", "GreaterThanEquals",
-                        "SmallerThan", "SmallerThanEquals",)
+    def __init__(self, file_path, chunk_size=786432):
+        if chunk_size < 3:
+            raise ArgumentInvalidError("chunk_size must be at least 3")
 
-    def __init__(self, name, value=None, search_patterns=None, search_operator="Equals"):
-        self.name = name
-        self.value = value
+        self.file_path = file_path
+        self.chunk_size = chunk_size - chunk_size % 3
 
-        if not isinstance(search_patterns, list):
-            self.search_patterns = [search_patterns]
-        else:
-            self.search_patterns = search_patterns
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.file_path}>"
 
-        if search_operator not in DynamicField.SEARCH_OPERATORS:
-            raise NotImplementedError(f"Invalid Operator: \"{search_operator}\"")
-        self.search_operator = search_operator
+    def __len__(self):
+        """length of the base64 encoded content"""
+        return 4 * -(-os.path.getsize(self.file_path) // 3)
 
-    def __repr__(self):
-        return f"<{self.__class__.__name__}: {self.name}: {self.value}>"
+    def raw_chunks(self):
+        """yield the content of the file in chunks (**bytes**)"""
+        with open(self.file_path, 'rb') as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
 
-    @classmethod
-    def from_dct(cls, dct):
-        """create DynamicField from dct
+    def chunks(self):
+        """yield the base64 encoded content in chunks (**bytes**)"""
+        for chunk in self.raw_chunks():
+            yield base64.b64encode(chunk)
 
-        Args:
-            dct (dict):
 
-        Returns:
-            **DynamicField**: A DynamicField object.
+def _b64decode_to_file(content, f, chunk_size=1048576):
+    """decode base64 content (str or bytes) in chunks and write it to the file object f"""
+    carry = content[:0]
+    for pos in range(0, len(content), chunk_size):
+        # whitespace (e.g. line breaks) would shift the 4 character blocks of base64
+        chunk = carry + carry[:0].join(content[pos:pos + chunk_size].split())
+        cut = len(chunk) - len(chunk) % 4
+        f.write(base64.b64decode(chunk[:cut]))
+        carry = chunk[cut:]
 
-        """
-        return cls(name=dct["Name"], value=dct["Value"])
+    if carry:
+        f.write(base64.b64decode(carry))
 
-    def to_dct(self):
-        """represent DynamicField as dict
 
-        Returns:
-            **dict**: DynamicField as dict.
+class _StreamingBody:
+    """file like request body of bytes and **Base64File** parts (read in chunks)
 
-        """
+    Provides __len__ so requests sends a Content-Length header instead of using chunked
+    transfer encoding, tell/seek(0) allow urllib3 to rewind the body for retries.
+    """
+
+    def __init__(self, parts):
+        self._parts = parts
+        self._length = sum(len(part) for part in parts)
+        self.seek(0)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(65536)
+            if not chunk:
+                return
+            yield chunk
+
+    def _chunks(self):
+        for part in self._parts:
+            if isinstance(part, Base64File):
+                yield from part.chunks()
+            else:
+                yield part
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._iterator, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if offset != 0 or whence != os.SEEK_SET:
+            raise OSError("streaming body can only be rewound to the start")
+
+        self._iterator = self._chunks()
+        self._buffer = bytearray()
+        self._position = 0
+        return 0
+
+
+class _TicketListParser:
+    """incremental parser for TicketGet/TicketGetList response bodies
+
+    Returns every element of the top level "Ticket" array as soon as it is complete, so
+    only one ticket (plus one chunk) is buffered. The rest of the document (e.g. "Error")
+    is kept with an empty "Ticket" array and decoded by *close*.
+
+    Args:
+        loads (callable): decodes a JSON document (bytes) - e.g. *JSONCodec.loads*
+        array_key (bytes): key of the array (defaults to b"Ticket")
+
+    """
+
+    _TOKEN = re.compile(rb'["\[\]{}]')
+    _STRING_END = re.compile(rb'["\\]')
+
+    def __init__(self, loads, array_key=b"Ticket"):
+        self.loads = loads
+        self.array_key = array_key
+
+        self._buffer = bytearray()
+        self._pos = 0  # scan position in _buffer
+        self._depth = 0
+        self._string_start = None  # set while inside a string
+        self._last_key = None
+        self._in_array = False
+        self._element_start = None
+        self._other = bytearray()  # document without the array elements
+        self._other_start = 0  # start of not yet copied part of _buffer (None in array)
+
+    def feed(self, data):
+        """add data and return the list of elements (decoded) completed by it"""
+        buf = self._buffer
+        buf += data
+        pos = self._pos
+        elements = []
+
+        while True:
+            if self._string_start is not None:
+                match = self._STRING_END.search(buf, pos)
+                if match is None:
+                    pos = len(buf)
+                    break
+                if buf[match.start()] == 0x5c:  # backslash - skip the escaped character
+                    if match.start() + 1 >= len(buf):
+                        pos = match.start()
+                        break
+                    pos = match.start() + 2
+                    continue
+
+                pos = match.end()
+                if self._depth == 1:
+                    self._last_key = bytes(buf[self._string_start + 1:match.start()])
+                self._string_start = None
+                continue
+
+            match = self._TOKEN.search(buf, pos)
+            if match is None:
+                pos = len(buf)
+                break
+
+            token = buf[match.start()]
+            pos = match.end()
+            if token == 0x22:  # "
+                self._string_start = match.start()
+            elif token in (0x7b, 0x5b):  # { [
+                self._depth += 1
+                if self._depth == 2 and token == 0x5b and self._last_key == self.array_key:
+                    self._in_array = True
+                    self._other += buf[self._other_start:pos]
+                    self._other_start = None
+                elif self._depth == 3 and self._in_array and self._element_start is None:
+                    self._element_start = match.start()
+            else:  # } ]
+                self._depth -= 1
+                if self._depth == 2 and self._element_start is not None:
+                    elements.append(self.loads(bytes(buf[self._element_start:pos])))
+                    self._element_start = None
+                elif self._depth == 1 and self._in_array:
+                    self._in_array = False
+                    self._other_start = match.start()
+
+        # drop what is not needed anymore
+        keep = pos
+        for start in (self._element_start, self._string_start):
+            if start is not None:
+                keep = min(keep, start)
+        if self._other_start is not None:
+            self._other += buf[self._other_start:keep]
+            self._other_start = 0
+
+        del buf[:keep]
+        self._pos = pos - keep
+        if self._element_start is not None:
+            self._element_start -= keep
+        if self._string_start is not None:
+            self._string_start -= keep
+        return elements
+
+    def close(self):
+        """decode the rest of the document (with an empty array)
+
+        Raises:
+            ResponseParseError
+
+        Returns:
+            **dict**: the decoded document
+
+        """
+        if self._other_start is not None:
+            self._other += self._buffer[self._other_start:]
+        try:
+            return self.loads(bytes(self._other))
+        except ValueError as err:
+            raise ResponseParseError(f"Invalid JSON in response: {err}")
+
+
+class JSONCodec:
+    """PyOTRS JSONCodec class - encodes request and decodes response bodies (stdlib json)
+
+    Subclasses can use faster JSON libraries (see **OrjsonCodec** and *get_json_codec*).
+    """
+
+    name = "json"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.name}>"
+
+    def dumps(self, obj, default=None):
+        """encode obj as JSON
+
+        Args:
+            obj: object to encode
+            default (callable): called for objects which can not be encoded
+
+        Returns:
+            **str** or **bytes**: JSON document
+
+        """
+        return json.dumps(obj, default=default)
+
+    def loads(self, data):
+        """decode a JSON document (**str** or **bytes**)"""
+        return json.loads(data)
+
+    def decode_response(self, response):
+        """decode the JSON body of a **requests.Response**"""
+        return response.json()
+
+
+class OrjsonCodec(JSONCodec):
+    """PyOTRS OrjsonCodec class - JSON codec using orjson (encodes to bytes)"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ArgumentInvalidError("orjson is not installed")
+
+    def dumps(self, obj, default=None):
+        return orjson.dumps(obj, default=default)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def decode_response(self, response):
+        # decode the raw bytes - no intermediate str
+        return orjson.loads(response.content)
+
+
+JSON_CODECS = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_json_codec(name="auto"):
+    """get a JSON codec by name
+
+    Args:
+        name (str): "json", "orjson" or "auto" (orjson if installed, otherwise json)
+
+    Raises:
+        ArgumentInvalidError
+
+    Returns:
+        **JSONCodec**
+
+    """
+    if name == "auto":
+        name = OrjsonCodec.name if orjson is not None else JSONCodec.name
+
+    if name not in JSON_CODECS:
+        raise ArgumentInvalidError(f"Unknown JSON codec: {name}")
+    return JSON_CODECS[name]()
+
+
+COMPRESSIONS = ("gzip", "deflate")
+
+_HTTP_METHODS = frozenset(("DELETE", "GET", "HEAD", "PATCH", "POST", "PUT"))
+
+# ErrorCode suffixes of operations called with an expired or otherwise invalid Session ID
+_SESSION_ERROR_CODES = (".AuthFail", ".SessionInvalid")
+
+
+def _compress_body(body, compression, threshold=1024, level=6):
+    """compress a request body (if it is at least threshold bytes)
+
+    Args:
+        body (str or bytes): request body
+        compression (str): "gzip" or "deflate"
+        threshold (int): minimum size in bytes
+        level (int): compression level (1 - fast ... 9 - small)
+
+    Returns:
+        **tuple**: (body, **str** Content-Encoding or **None** if not compressed)
+
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    if len(body) < threshold:
+        return body, None
+
+    if compression == "gzip":
+        return gzip.compress(body, compresslevel=level, mtime=0), "gzip"
+    return zlib.compress(body, level), "deflate"
+
+
+def _json_body(payload, codec=None):
+    """encode payload as JSON request body
+
+    Args:
+        payload (dict)
+        codec (JSONCodec): codec used for encoding (defaults to stdlib json)
+
+    Returns:
+        **str**, **bytes** or **_StreamingBody**: the JSON document - streamed if payload
+        contains **Base64File** objects
+
+    """
+    codec = codec or JSONCodec()
+    streamed = []
+    marker = f"pyotrs-stream-{os.urandom(8).hex()}"
+
+    def default(obj):
+        if isinstance(obj, Base64File):
+            streamed.append(obj)
+            return f"{marker}{len(streamed) - 1}{marker}"
+        raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+    body = codec.dumps(payload, default=default)
+    if not streamed:
+        return body
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    # body.split gives: [json, index, json, index, ..., json]
+    parts = []
+    for pos, piece in enumerate(body.split(marker.encode("ascii"))):
+        parts.append(streamed[int(piece)] if pos % 2 else piece)
+    return _StreamingBody(parts)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_naive_datetime(value):
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _format_search_datetime(value):
+    """format a datetime as expected by TicketSearch (cached for naive datetimes)"""
+    if value.tzinfo is None:
+        return _format_naive_datetime(value)
+    # aware datetimes of different time zones can be equal - so they are not cached
+    return value.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _search_values(kwargs):
+    """TicketSearch arguments with datetime objects formatted"""
+    return {key: _format_search_datetime(value) if isinstance(value, datetime.datetime)
+            else value for key, value in kwargs.items()}
+
+
+class DynamicField:
+    """PyOTRS DynamicField class
+
+    Args:
+        name (str): Name of OTRS DynamicField (required)
+        value (str): Value of OTRS DynamicField
+        search_operator (str): Search operator (defaults to: "Equals")
+            Valid options are:
+            "Equals", "Like", "GreaterThan", "GreaterThanEquals",
+            "SmallerThan", "SmallerThanEquals"
+        search_patterns (list): List of patterns (str or datetime) to search for
+
+    """
+
+    SEARCH_OPERATORS = ("Equals", "Like", "GreaterThan", "GreaterThanEquals",
+                        "SmallerThan", "SmallerThanEquals",)
+
+    __slots__ = ("_name", "value", "search_patterns", "search_operator")
+
+    def __init__(self, name, value=None, search_patterns=None, search_operator="Equals"):
+        self._name = name
+        self.value = value
+
+        if not isinstance(search_patterns, list):
+            self.search_patterns = [search_patterns]
+        else:
+            self.search_patterns = search_patterns
+
+        if search_operator not in DynamicField.SEARCH_OPERATORS:
+            raise NotImplementedError(f"Invalid Operator: \"{search_operator}\"")
+        self.search_operator = search_operator
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.name}: {self.value}>"
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        _key_changed()
+
+    @classmethod
+    def from_dct(cls, dct):
+        """create DynamicField from dct
+
+        Args:
+            dct (dict):
+
+        Returns:
+            **DynamicField**: A DynamicField object.
+
+        """
+        return cls(name=dct["Name"], value=dct["Value"])
+
+    def to_dct(self):
+        """represent DynamicField as dict
+
+        Returns:
+            **dict**: DynamicField as dict.
+
+        """
         return {"Name": self.name, "Value": self.value}
 
     def to_dct_search(self):
@@ -461,7 +1619,7 @@ class DynamicField:
         _lst = []
         for item in self.search_patterns:
             if isinstance(item, datetime.datetime):
-                item = item.strftime("%Y-%m-%d %H:%M:%S")
+                item = _format_search_datetime(item)
             _lst.append(item)
 
         return {f"DynamicField_{self.name}": {self.search_operator: _lst}}
@@ -487,6 +1645,59 @@ class DynamicField:
         return DynamicField.from_dct({'Name': 'lastname', 'Value': 'Doe'})
 
 
+class SearchQuery:
+    """PyOTRS SearchQuery class - TicketSearch arguments compiled once for many searches
+
+    The search patterns of the DynamicFields and the fixed arguments are converted once;
+    only the arguments that vary (e.g. a time window) are added for each search.
+
+    Args:
+        dynamic_fields (list): DynamicField objects (or one DynamicField) to search for
+        **kwargs: fixed TicketSearch arguments (see *Client.ticket_search*)
+
+    .. code-block:: python
+
+        query = SearchQuery([DynamicField("Severity", search_patterns=["high"])],
+                            StateType="open", Queues=["SOC::Alerts"])
+        for newer, older in windows:
+            client.ticket_search(query=query, TicketCreateTimeNewerDate=newer,
+                                 TicketCreateTimeOlderDate=older)
+
+    .. note::
+        The compiled arguments are shared by all payloads - do not modify them.
+
+    """
+
+    __slots__ = ("fields",)
+
+    def __init__(self, dynamic_fields=None, **kwargs):
+        fields = {}
+        if isinstance(dynamic_fields, DynamicField):
+            dynamic_fields = [dynamic_fields]
+        for df in dynamic_fields or ():
+            fields.update(df.to_dct_search())
+        fields.update(_search_values(kwargs))
+        self.fields = fields
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {', '.join(self.fields)}>"
+
+    def payload(self, **kwargs):
+        """the TicketSearch arguments of this query and kwargs (without Session ID)
+
+        Args:
+            **kwargs: TicketSearch arguments for this search - override fixed ones
+
+        Returns:
+            **dict**: TicketSearch arguments
+
+        """
+        payload = dict(self.fields)
+        if kwargs:
+            payload.update(_search_values(kwargs))
+        return payload
+
+
 class Ticket:
     """PyOTRS Ticket class
 
@@ -504,11 +1715,13 @@ class Ticket:
         self.fields.update(dct)
 
         self.tid = int(self.fields.get("TicketID", 0))
-        self.articles = self._parse_articles()
-        self.fields.pop("Article", None)
 
-        self.dynamic_fields = self._parse_dynamic_fields()
-        self.fields.pop("DynamicField", None)
+        # Articles and DynamicFields are parsed on first access
+        self._raw_articles = self.fields.pop("Article", None)
+        self._articles = None
+
+        self._raw_dynamic_fields = self.fields.pop("DynamicField", None)
+        self._dynamic_fields = None
 
     def __repr__(self):
         if self.tid:
@@ -516,14 +1729,51 @@ class Ticket:
         else:
             return f"<{self.__class__.__name__}>"
 
+    @property
+    def articles(self):
+        """**list** of **Article** objects (parsed on first access)"""
+        if self._articles is None:
+            self._articles = _IndexedList(self._parse_articles(), _article_id_key)
+            self._raw_articles = None
+        return self._articles
+
+    @articles.setter
+    def articles(self, value):
+        self._articles = _IndexedList(value or (), _article_id_key)
+        self._raw_articles = None
+
+    @articles.deleter
+    def articles(self):
+        del self._articles
+        self._raw_articles = None
+
+    @property
+    def dynamic_fields(self):
+        """**list** of **DynamicField** objects (parsed on first access)"""
+        if self._dynamic_fields is None:
+            self._dynamic_fields = _IndexedList(self._parse_dynamic_fields(),
+                                                _dynamic_field_key)
+            self._raw_dynamic_fields = None
+        return self._dynamic_fields
+
+    @dynamic_fields.setter
+    def dynamic_fields(self, value):
+        self._dynamic_fields = _IndexedList(value or (), _dynamic_field_key)
+        self._raw_dynamic_fields = None
+
+    @dynamic_fields.deleter
+    def dynamic_fields(self):
+        del self._dynamic_fields
+        self._raw_dynamic_fields = None
+
     def _parse_articles(self):
         """parse Article from Ticket and return as **list** of **Article** objects"""
-        lst = self.fields.get("Article", [])
+        lst = self._raw_articles or []
         return [Article(item) for item in lst]
 
     def _parse_dynamic_fields(self):
         """parse DynamicField from Ticket and return as **list** of **DynamicField** objects"""
-        lst = self.fields.get("DynamicField", [])
+        lst = self._raw_dynamic_fields or []
         return [DynamicField.from_dct(item) for item in lst]
 
     def to_dct(self,
@@ -558,7 +1808,15 @@ class Ticket:
 
         if articles:
             try:
-                if self.articles:
+                if self._articles is None and self._raw_articles:
+                    # not parsed yet - serialize the raw data without creating objects
+                    dct.update({"Article": [
+                        Article._raw_to_dct(x,
+                                            attachments=article_attachments,
+                                            attachment_cont=article_attachment_cont,
+                                            dynamic_fields=article_dynamic_fields)
+                        for x in self._raw_articles]})
+                elif self.articles:
                     dct.update({"Article": [x.to_dct(attachments=article_attachments,
                                                      attachment_cont=article_attachment_cont,
                                                      dynamic_fields=article_dynamic_fields)
@@ -568,7 +1826,10 @@ class Ticket:
 
         if dynamic_fields:
             try:
-                if self.dynamic_fields:
+                if self._dynamic_fields is None and self._raw_dynamic_fields:
+                    dct.update({"DynamicField": [_dynamic_field_dct(x) for x in
+                                                 self._raw_dynamic_fields]})
+                elif self.dynamic_fields:
                     dct.update({"DynamicField": [x.to_dct() for x in self.dynamic_fields]})
             except AttributeError:
                 pass
@@ -585,8 +1846,7 @@ class Ticket:
             **Article** or **None**
 
         """
-        result = [x for x in self.articles if x.field_get("ArticleID") == str(aid)]
-        return result[0] if result else None
+        return self.articles.lookup(str(aid))
 
     def dynamic_field_get(self, df_name):
         """dynamic_field_get
@@ -598,8 +1858,7 @@ class Ticket:
             **DynamicField** or **None**
 
         """
-        result = [x for x in self.dynamic_fields if x.name == df_name]
-        return result[0] if result else None
+        return self.dynamic_fields.lookup(df_name)
 
     def field_get(self, f_name):
         return self.fields.get(f_name)
@@ -704,7 +1963,7 @@ class Ticket:
         for key, value in dct.items():
             dct.update({key: value})
 
-        return Ticket(dct)
+        return cls(dct)
 
     @classmethod
     def _dummy(cls):
@@ -740,6 +1999,170 @@ class Ticket:
         }
 
 
+_MISSING = object()
+
+# common fields of TicketGet responses (Znuny 6/7)
+_TICKET_FIELD_KEYS = {key: pos for pos, key in enumerate((
+    "Age", "ArchiveFlag", "ChangeBy", "Changed", "CreateBy", "Created", "CustomerID",
+    "CustomerUserID", "EscalationResponseTime", "EscalationSolutionTime", "EscalationTime",
+    "EscalationUpdateTime", "GroupID", "Lock", "LockID", "Owner", "OwnerID", "Priority",
+    "PriorityColor", "PriorityID", "Queue", "QueueID", "RealTillTimeNotUsed", "Responsible",
+    "ResponsibleID", "SLA", "SLAID", "Service", "ServiceID", "State", "StateID", "StateType",
+    "TicketID", "TicketNumber", "TimeUnit", "Title", "Type", "TypeID", "UnlockTimeout",
+    "UntilTime",
+))}
+
+# common fields of Articles in TicketGet responses (Znuny 6/7)
+_ARTICLE_FIELD_KEYS = {key: pos for pos, key in enumerate((
+    "ArticleID", "ArticleNumber", "Bcc", "Body", "Cc", "ChangeBy", "ChangeTime", "Charset",
+    "CommunicationChannelID", "ContentCharset", "ContentType", "CreateBy", "CreateTime",
+    "From", "InReplyTo", "IncomingTime", "IsVisibleForCustomer", "MessageID", "MimeType",
+    "References", "ReplyTo", "SenderType", "SenderTypeID", "Subject", "TicketID", "TimeUnit",
+    "To",
+))}
+
+
+class _CompactFields(collections.abc.MutableMapping):
+    """mapping storing values in a list aligned to a key table shared by many objects
+
+    Keys which are not part of the key table are kept in a (per object) dict. Short string
+    values are interned, so e.g. the "State" of many tickets is stored only once.
+    """
+
+    __slots__ = ("_keys", "_values", "_extra")
+
+    INTERN_MAX_LENGTH = 64
+
+    def __init__(self, keys, dct=()):
+        self._keys = keys
+        self._values = [_MISSING] * len(keys)
+        self._extra = None
+        self.update(dct)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    def __getitem__(self, key):
+        pos = self._keys.get(key)
+        if pos is not None:
+            value = self._values[pos]
+            if value is not _MISSING:
+                return value
+        elif self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        pos = self._keys.get(key)
+        if pos is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+            return
+
+        if type(value) is str and len(value) <= self.INTERN_MAX_LENGTH:
+            value = sys.intern(value)
+        self._values[pos] = value
+
+    def __delitem__(self, key):
+        pos = self._keys.get(key)
+        if pos is not None and self._values[pos] is not _MISSING:
+            self._values[pos] = _MISSING
+        elif pos is None and self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        for key, pos in self._keys.items():
+            if self._values[pos] is not _MISSING:
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return (len(self._values) - self._values.count(_MISSING) +
+                (len(self._extra) if self._extra else 0))
+
+
+class CompactArticle(Article):
+    """PyOTRS CompactArticle class - memory saving Article (see **CompactTicket**)"""
+
+    FIELD_KEYS = _ARTICLE_FIELD_KEYS
+
+    def __init__(self, dct):
+        super().__init__(dct)
+        self.fields = _CompactFields(self.FIELD_KEYS, self.fields)
+
+        # parse now - the objects are smaller than the raw response data
+        self.attachments = self._parse_attachments()
+        self.dynamic_fields = self._parse_dynamic_fields()
+
+
+class CompactTicket(Ticket):
+    """PyOTRS CompactTicket class - memory saving Ticket
+
+    Same API as **Ticket**, but the fields are stored aligned to a key table shared by all
+    tickets (FIELD_KEYS), short string values are interned and Articles are
+    **CompactArticle** objects. Intended for keeping many tickets in memory, use it with
+    *Client(ticket_class=CompactTicket)*.
+
+    .. note::
+        *fields* is a mapping but not a **dict**.
+
+    """
+
+    FIELD_KEYS = _TICKET_FIELD_KEYS
+
+    def __init__(self, dct):
+        super().__init__(dct)
+        self.fields = _CompactFields(self.FIELD_KEYS, self.fields)
+
+        # parse now - the objects are smaller than the raw response data
+        self.articles = self._parse_articles()
+        self.dynamic_fields = self._parse_dynamic_fields()
+
+    def _parse_articles(self):
+        """parse Article from Ticket and return as **list** of **CompactArticle** objects"""
+        lst = self._raw_articles or []
+        return [CompactArticle(item) for item in lst]
+
+
+def _acquire_file_lock(lock_path, timeout):
+    """acquire an advisory (exclusive) lock on lock_path (created if missing)
+
+    Returns:
+        **int**: file descriptor to pass to *_release_file_lock*
+
+    Raises:
+        TimeoutError
+
+    """
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return fd
+        except BlockingIOError:
+            if time.monotonic() > deadline:
+                os.close(fd)
+                raise TimeoutError(f"Timeout waiting for lock: {lock_path}") from None
+            time.sleep(0.05)
+
+
+def _release_file_lock(fd):
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _utc_epoch(value):
+    """seconds since epoch of a naive UTC datetime (as used by SessionStore)"""
+    return (value - datetime.datetime(1970, 1, 1)).total_seconds()
+
+
 class SessionStore:
     """Session ID: persistently store to and retrieve from to file
 
@@ -816,13 +2239,14 @@ class SessionStore:
 
         """
         self.value = new_value
+        created = int(time.time())
 
         if os.path.isfile(self.file_path):
             if not SessionStore._validate_file_owner_and_permissions(self.file_path):
                 raise OSError("File exists but is not ok (wrong owner/permissions)!")
 
         with open(self.file_path, 'w') as f:
-            f.write(json.dumps({'created': str(int(time.time())),
+            f.write(json.dumps({'created': str(created),
                                 'session_id': self.value,
                                 'is_legacy': self.is_legacy}))
         os.chmod(self.file_path, 384)  # 384 is '0600'
@@ -831,6 +2255,8 @@ class SessionStore:
         if not SessionStore._validate_file_owner_and_permissions(self.file_path):
             raise OSError("Race condition: Something happened to file during the run!")
 
+        self.created = datetime.datetime.utcfromtimestamp(created)
+        self.expires = self.created + datetime.timedelta(seconds=self.timeout)
         return True
 
     def delete(self):
@@ -879,40 +2305,533 @@ class SessionStore:
         return True
 
 
-class Client:
-    """PyOTRS Client class - includes Session handling
+class SessionProvider:
+    """PyOTRS SessionProvider class - in process cache for validated Session IDs
+
+    Used by *Client.session_restore_or_create* (see *Client(session_provider=...)*). A Session
+    ID is validated (SessionGet) once when it is loaded from the SessionStore file and then
+    reused - without reading the file or validating it again - until *refresh_margin*
+    seconds before it expires. The cache is shared by all SessionProvider objects (and so by
+    all Clients) of a process.
+
+    Reading and creating a Session ID is done while holding an advisory lock on
+    "<session file>.lock", so when a Session ID expires only one of many processes sharing
+    the session file creates a new one, the others wait and use it.
 
     Args:
-        baseurl (str): Base URL for OTRS System, no trailing slash e.g. http://otrs.example.com
-        username (str): Username
-        password (str): Password
-        session_id_file (str): Session ID path on disc, used to persistently store Session ID
-        session_timeout (int): Session Timeout configured in OTRS (usually 28800 seconds = 8h)
-        session_validation_ticket_id (int): Ticket ID of an existing ticket - used to perform
-            several check - e.g. validate log in (defaults to 1)
-        webservice_config_ticket (dict): OTRS REST Web Service Name - Ticket Connector
-        webservice_config_faq (dict): OTRS REST Web Service Name - FAQ Connector (FAQ code was
-            deprecated in 0.4.0 and removed in 1.0.0 - parameter stays for compatibility)
-        webservice_config_link (dict): OTRS REST Web Service Name - Link Connector
-        proxies (dict): Proxy settings - refer to requests docs for
-            more information - default to no proxies
-        https_verify (bool): Should HTTPS certificates be verified (defaults to True)
-        ca_cert_bundle (str): file path - if specified overrides python/system default for
-            Root CA bundle that will be used.
-        auth (tuple): e.g. ("user", "pass") - see requests documentation ("auth") for details
-        client_auth_cert (str): file path containing both certificate and key (unencrypted) in
-            PEM format to use for TLS client authentication (passed to requests as "cert")
-        customer_user (bool): flag to indicate that the username is for a "CustomerUser"
-           (defaults to False)
-        user_agent (str): optional HTTP UserAgent string
-        webservice_path (str): OTRS REST Web Service Path part - defaults to
-            "/otrs/nph-genericinterface.pl/Webservice/"
+        refresh_margin (int): seconds before expiry a cached Session ID is not used anymore
+            (defaults to 300)
+        lock_timeout (float): seconds to wait for the lock file (defaults to 60)
+
+    """
+
+    _cache = {}  # file path -> (session id, is_legacy, expires, created) - both as epoch
+    _cache_lock = threading.Lock()
+    _path_locks = {}  # file path -> threading.Lock (serializes the threads of a process)
+
+    def __init__(self, refresh_margin=300, lock_timeout=60):
+        self.refresh_margin = refresh_margin
+        self.lock_timeout = lock_timeout
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {len(self._cache)} cached>"
+
+    def get(self, file_path):
+        """get a cached Session ID which is not about to expire
+
+        Returns:
+            **tuple** or **None**: (**str** Session ID, **bool** is_legacy, **float** expires,
+            **float** created) - created is None if unknown
+
+        """
+        with self._cache_lock:
+            entry = self._cache.get(file_path)
+        if entry and entry[2] - self.refresh_margin > time.time():
+            return entry
+        return None
+
+    def set(self, file_path, session_id, is_legacy, expires, created=None):
+        """cache a validated Session ID (expires and created as seconds since epoch)"""
+        with self._cache_lock:
+            self._cache[file_path] = (session_id, is_legacy, expires, created)
+
+    def invalidate(self, file_path):
+        """remove a Session ID (e.g. after the server rejected it) from the cache"""
+        with self._cache_lock:
+            self._cache.pop(file_path, None)
+
+    def restore_or_create(self, client):
+        """set a valid Session ID on client - cached, restored from file or newly created
+
+        Args:
+            client (Client): the Client
+
+        Raises:
+            SessionCreateError
+
+        Returns:
+            **bool**: **True**
+
+        """
+        store = client.session_id_store
+
+        if self._use_cached(client):
+            return True
+
+        with self._path_lock(store.file_path), self._file_lock(store.file_path):
+            # another thread or process might have created a new one meanwhile
+            if self._use_cached(client) or self._restore(client):
+                return True
+
+            self._create(client)
+            return True
+
+    def renew(self, client, stale_session_id):
+        """replace the stale Session ID of client - unless another thread or process did
+
+        The session file is read again while holding the lock, so of many processes sharing
+        it only the first one creates a new Session ID, the others use it.
+
+        Args:
+            client (Client): the Client
+            stale_session_id (str): the Session ID to be replaced
+
+        Raises:
+            SessionCreateError
+
+        Returns:
+            **str**: the (new) Session ID
+
+        """
+        store = client.session_id_store
+        with self._path_lock(store.file_path), self._file_lock(store.file_path):
+            entry = self.get(store.file_path)
+            if entry and entry[0] == stale_session_id:
+                self.invalidate(store.file_path)
+
+            if not (self._use_cached(client) or self._restore(client, stale_session_id)):
+                self._create(client)
+            return store.value
+
+    def _use_cached(self, client):
+        store = client.session_id_store
+        entry = self.get(store.file_path)
+        if not entry:
+            return False
+
+        store.value, store.is_legacy, expires, created = entry
+        store.expires = datetime.datetime.utcfromtimestamp(expires)
+        store.created = datetime.datetime.utcfromtimestamp(created) if created else None
+        client.use_legacy_sessions = store.is_legacy
+        return True
+
+    def _restore(self, client, stale_session_id=None):
+        """use the (validated) Session ID of the session file - unless it is stale_session_id"""
+        store = client.session_id_store
+        session_id = store.read()
+        if not session_id or session_id == stale_session_id or not store.expires:
+            return False
+
+        expires = _utc_epoch(store.expires)
+        if expires - self.refresh_margin <= time.time():
+            return False
+
+        client.use_legacy_sessions = store.is_legacy
+        if not client.session_get(session_id):
+            return False
+
+        store.value = session_id
+        self.set(store.file_path, session_id, store.is_legacy, expires,
+                 _utc_epoch(store.created))
+        log.info(f"Using valid Session ID from ({store.file_path})")
+        return True
+
+    def _create(self, client):
+        """create a new Session ID and save it to the session file"""
+        store = client.session_id_store
+        if not client.session_create():
+            raise SessionCreateError("Failed to create a Session ID!")
+
+        session_id = client.result_json[client._session_key]
+        if not store.write(session_id):
+            raise OSError("Failed to save Session ID to file!")
+        self.set(store.file_path, session_id, store.is_legacy, _utc_epoch(store.expires),
+                 _utc_epoch(store.created))
+        log.info(f"Saved new Session ID to file: {store.file_path}")
+
+    @classmethod
+    def _path_lock(cls, file_path):
+        """the (process wide) lock of file_path"""
+        with cls._cache_lock:
+            return cls._path_locks.setdefault(file_path, threading.Lock())
+
+    @contextlib.contextmanager
+    def _file_lock(self, file_path):
+        """hold an advisory (exclusive) lock on file_path + ".lock" (no-op on Windows)"""
+        if fcntl is None:
+            yield
+            return
+
+        try:
+            fd = _acquire_file_lock(f"{file_path}.lock", self.lock_timeout)
+        except TimeoutError as err:
+            raise SessionCreateError(str(err)) from None
+        try:
+            yield
+        finally:
+            _release_file_lock(fd)
+
+
+class LRUCache:
+    """PyOTRS LRUCache class - thread safe least recently used cache with time to live
+
+    Args:
+        maxsize (int): maximum number of entries - the least recently used entry is evicted
+            when a new one is added (defaults to 1024)
+        ttl (float): seconds an entry is valid, None means no expiry (defaults to None)
+
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        if maxsize < 1:
+            raise ArgumentInvalidError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = collections.OrderedDict()  # key -> (value, expires)
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {len(self)}/{self.maxsize}>"
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key, default=None):
+        """get a (not expired) value
+
+        Args:
+            key: key of the entry
+            default: returned if there is no valid entry (defaults to None)
+
+        Returns:
+            cached value or default
+
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+
+            value, expires = item
+            if expires is not None and expires <= time.time():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires=None):
+        """add or replace an entry
+
+        Args:
+            key: key of the entry
+            value: value to cache
+            expires (float): optional expiry as seconds since epoch (defaults to now + ttl)
+
+        """
+        if expires is None and self.ttl is not None:
+            expires = time.time() + self.ttl
+
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        """remove an entry (if present)"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+
+class TicketNumberCache(LRUCache):
+    """PyOTRS TicketNumberCache class - caches Ticket Number to Ticket ID resolution
+
+    Used by *Client.ticket_get_by_number* to skip the TicketSearch for known ticket numbers.
+    With a *file_path* the entries are also shared with other processes (e.g. several
+    scripts resolving the same ticket number) through a JSON file (rw for user only). The
+    file is updated while holding an advisory lock on "<file_path>.lock".
+
+    Args:
+        maxsize (int): maximum number of entries kept in memory (defaults to 1024)
+        ttl (float): seconds an entry is valid, None means no expiry (defaults to 3600)
+        file_path (str): optional path of a file shared between processes
+        lock_timeout (float): seconds to wait for the lock file - the file is not updated
+            if the lock can not be acquired (defaults to 10)
+
+    """
+
+    def __init__(self, maxsize=1024, ttl=3600, file_path=None, lock_timeout=10):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.file_path = file_path
+        self.lock_timeout = lock_timeout
+
+    def get(self, key, default=None):
+        value = super().get(key)
+        if value is None and self.file_path:
+            entry = self._read_file().get(key)
+            if entry and (entry[1] is None or entry[1] > time.time()):
+                value = entry[0]
+                super().set(key, value, expires=entry[1])
+        return default if value is None else value
+
+    def set(self, key, value, expires=None):
+        super().set(key, value, expires=expires)
+        if self.file_path:
+            expires = self._data[key][1]
+
+            def add(entries):
+                entries[key] = [value, expires]
+                return True
+            self._update_file(add)
+
+    def invalidate(self, key):
+        super().invalidate(key)
+        if self.file_path:
+            self._update_file(lambda entries: entries.pop(key, None) is not None)
+
+    def clear(self):
+        super().clear()
+        if self.file_path:
+            self._update_file(lambda entries: entries.clear() or True)
+
+    def _update_file(self, update):
+        """read, update and write the entries of the file (locked against other processes)
+
+        Args:
+            update (callable): called with the entries (dict), returns whether they changed
+
+        """
+        with self._lock:
+            fd = None
+            if fcntl is not None:
+                try:
+                    fd = _acquire_file_lock(f"{self.file_path}.lock", self.lock_timeout)
+                except TimeoutError as err:
+                    log.warning(f"TicketNumberCache file not updated: {err}")
+                    return
+            try:
+                entries = self._read_file()
+                if update(entries):
+                    self._write_file(entries)
+            finally:
+                if fd is not None:
+                    _release_file_lock(fd)
+
+    def _read_file(self):
+        """read all (not expired) entries from file - ignores missing or invalid files"""
+        if not os.path.isfile(self.file_path):
+            return {}
+
+        if not SessionStore._validate_file_owner_and_permissions(self.file_path):
+            return {}
+
+        try:
+            with open(self.file_path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+
+        now = time.time()
+        return {key: entry for key, entry in entries.items()
+                if isinstance(entry, list) and len(entry) == 2 and
+                (entry[1] is None or entry[1] > now)}
+
+    def _write_file(self, entries):
+        """write entries to file (atomically replaced, rw for user only)"""
+        tmp_path = f"{self.file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(entries, f)
+        os.chmod(tmp_path, 384)  # 384 is '0600'
+        os.replace(tmp_path, self.file_path)
+
+
+class TicketCache(LRUCache):
+    """PyOTRS TicketCache class - read-through cache for TicketGet/TicketGetList
+
+    Stores the raw ticket data keyed on TicketID and the requested flags (articles,
+    attachments, dynamic_fields, html_body_as_attachment). The raw data is copied when it is
+    stored and when it is returned, so callers can not modify the cached data.
+
+    Args:
+        maxsize (int): maximum number of entries (defaults to 1024)
+        ttl (float): seconds an entry is considered fresh (defaults to 60)
+        revalidate (bool): keep stale entries and check with a (lightweight) TicketSearch
+            whether the "Changed" time of the ticket is still the same before using them,
+            otherwise stale entries are dropped (defaults to True)
+
+    """
+
+    def __init__(self, maxsize=1024, ttl=60, revalidate=True):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.revalidate = revalidate
+
+    def get(self, key, default=None):
+        value = super().get(key)
+        return default if value is None else copy.deepcopy(value)
+
+    def set(self, key, value, expires=None):
+        super().set(key, copy.deepcopy(value), expires=expires)
+
+    @staticmethod
+    def key(ticket_id, articles=False, attachments=False, dynamic_fields=True,
+            html_body_as_attachment=False):
+        """build the cache key for a ticket and the requested flags"""
+        return (str(ticket_id), bool(articles), bool(attachments), bool(dynamic_fields),
+                bool(html_body_as_attachment))
+
+    def lookup(self, key):
+        """get an entry including stale ones (if revalidate is enabled)
+
+        Args:
+            key (tuple): key of the entry (see *key*)
+
+        Returns:
+            **tuple** or **None**: (**dict** copy of the raw ticket, **bool** fresh) or None
+
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            value, expires = item
+            fresh = expires is None or expires > time.time()
+            if not fresh and not self.revalidate:
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+        return copy.deepcopy(value), fresh
+
+    def invalidate_ticket(self, ticket_id):
+        """remove all entries of a ticket (e.g. after it was updated)"""
+        ticket_id = str(ticket_id)
+        with self._lock:
+            for key in [key for key in self._data if key[0] == ticket_id]:
+                del self._data[key]
+
+
+class Client:
+    """PyOTRS Client class - includes Session handling
+
+    Args:
+        baseurl (str): Base URL for OTRS System, no trailing slash e.g. http://otrs.example.com
+        username (str): Username
+        password (str): Password
+        session_id_file (str): Session ID path on disc, used to persistently store Session ID
+        session_timeout (int): Session Timeout configured in OTRS (usually 28800 seconds = 8h)
+        session_validation_ticket_id (int): Ticket ID of an existing ticket - used to perform
+            several check - e.g. validate log in (defaults to 1)
+        webservice_config_ticket (dict): OTRS REST Web Service Name - Ticket Connector
+        webservice_config_faq (dict): OTRS REST Web Service Name - FAQ Connector (FAQ code was
+            deprecated in 0.4.0 and removed in 1.0.0 - parameter stays for compatibility)
+        webservice_config_link (dict): OTRS REST Web Service Name - Link Connector
+        proxies (dict): Proxy settings - refer to requests docs for
+            more information - default to no proxies
+        https_verify (bool): Should HTTPS certificates be verified (defaults to True)
+        ca_cert_bundle (str): file path - if specified overrides python/system default for
+            Root CA bundle that will be used.
+        auth (tuple): e.g. ("user", "pass") - see requests documentation ("auth") for details
+        client_auth_cert (str): file path containing both certificate and key (unencrypted) in
+            PEM format to use for TLS client authentication (passed to requests as "cert")
+        customer_user (bool): flag to indicate that the username is for a "CustomerUser"
+           (defaults to False)
+        user_agent (str): optional HTTP UserAgent string
+        webservice_path (str): OTRS REST Web Service Path part - defaults to
+            "/otrs/nph-genericinterface.pl/Webservice/"
         use_legacy_sessions (bool): if True, use sessions compatibility for OTRS < V8
         request_timeout (float or tuple): optional How many seconds to wait for the server
             to send data before giving up, as a float, or a (connect timeout, read timeout) tuple
+        pool_connections (int): number of connection pools (hosts) to cache (defaults to 10)
+        pool_maxsize (int): maximum number of keep-alive connections kept per pool - should be
+            at least the number of threads sharing this Client (defaults to 10)
+        max_retries (int): how often a request is retried on connection errors and on HTTP
+            status 500, 502, 503 and 504 (defaults to 0 - no retries)
+        retry_backoff_factor (float): backoff factor for retries; the n-th retry waits
+            backoff_factor * (2 ** (n - 1)) seconds (defaults to 0.5)
+        ticket_number_cache (TicketNumberCache): optional cache for resolving Ticket Numbers
+            to Ticket IDs in *ticket_get_by_number* (defaults to None - no caching)
+        ticket_cache (TicketCache): optional read-through cache used by *ticket_get_by_id*
+            and *ticket_get_by_list* (defaults to None - no caching)
+        ticket_class (type): class used for tickets of TicketGet/TicketGetList responses,
+            e.g. **CompactTicket** (defaults to **Ticket**)
+        json_codec (JSONCodec or str): codec for request/response bodies or its name - "json",
+            "orjson" or "auto" for orjson if installed (defaults to None - stdlib json)
+        compression (str): "gzip" or "deflate" to compress request bodies and to ask for
+            compressed responses (defaults to None - no request compression)
+        compression_threshold (int): only request bodies of at least this many bytes are
+            compressed (defaults to 1024)
+        compression_level (int): 1 (fastest) to 9 (smallest) (defaults to 6)
+        session_provider (SessionProvider): caches the validated Session ID in process and
+            coordinates creating new ones between processes in *session_restore_or_create*
+            (defaults to None)
+        session_refresh (float): fraction of *session_timeout* after which a background
+            thread creates a new Session ID - started by *session_restore_or_create*
+            (e.g. 0.75; defaults to None - no background refresh)
+        session_retry (bool): if a request fails because the Session ID expired or was
+            invalidated, create a new one and send the request once more (defaults to False)
+        governor (RequestGovernor): limits the rate and concurrency of the requests - share
+            one between Clients to limit all requests of a process (defaults to None)
+        recorder (MetricsRecorder): receives timings and sizes of every request - e.g. a
+            *HistogramRecorder* (defaults to None)
+
+    .. note::
+        All requests are sent over one persistent HTTP session (connection pool with
+        keep-alive) that is owned by the Client. Call *close()* when done or use the Client
+        as a context manager.
+
+    .. note::
+        With *compression* the web server has to decode the request bodies, e.g. Apache
+        with mod_deflate: "SetInputFilter DEFLATE" for the nph-genericinterface.pl location.
+        Streamed attachments (see **Base64File**) are not compressed.
+
+    .. note::
+        Following urllib3 defaults, requests using POST or PATCH (e.g. TicketCreate or
+        TicketUpdate) are only retried if the connection could not be established - never
+        after they might have reached OTRS.
+
+    .. note::
+        The per-call attributes (e.g. *operation*, *result*, *result_json*) are kept
+        separately for every thread, so one Client can be shared by many threads. Use
+        *execute()* to get a *ClientResponse* object per call instead.
 
     """
 
+    # per-call attributes
+    operation = _PerThreadAttribute()
+    result = _PerThreadAttribute(factory=list)
+    result_json = _PerThreadAttribute()
+    _result_type = _PerThreadAttribute()
+    _result_error = _PerThreadAttribute(default=False)
+    _result_status_code = _PerThreadAttribute()
+    _result_content = _PerThreadAttribute()
+    _request = _PerThreadAttribute()
+    _request_start = _PerThreadAttribute()
+    _url = _PerThreadAttribute()
+
     def __init__(self,
                  baseurl=None,
                  username=None,
@@ -932,8 +2851,25 @@ class Client:
                  user_agent=None,
                  webservice_path="/otrs/nph-genericinterface.pl/Webservice/",
                  use_legacy_sessions=False,
-                 request_timeout=None
+                 request_timeout=None,
+                 pool_connections=10,
+                 pool_maxsize=10,
+                 max_retries=0,
+                 retry_backoff_factor=0.5,
+                 ticket_number_cache=None,
+                 ticket_cache=None,
+                 ticket_class=None,
+                 json_codec=None,
+                 compression=None,
+                 compression_threshold=1024,
+                 compression_level=6,
+                 session_provider=None,
+                 session_refresh=None,
+                 session_retry=False,
+                 governor=None,
+                 recorder=None
                  ):
+        self._thread_state = threading.local()
 
         if not baseurl:
             raise ArgumentMissingError("baseurl")
@@ -982,6 +2918,8 @@ class Client:
         webservice_config.update(webservice_config_link['Config'])
         self.ws_config = webservice_config
 
+        self.operations = self.compile_operations()
+
         if not proxies:
             self.proxies = {"http": "", "https": "", "no": ""}
         else:
@@ -1004,6 +2942,39 @@ class Client:
         self.client_auth_cert = client_auth_cert
         self.request_timeout = request_timeout
 
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.retry_backoff_factor = retry_backoff_factor
+        self.http_session = self._create_http_session()
+
+        self.ticket_number_cache = ticket_number_cache
+        self.ticket_cache = ticket_cache
+        self.ticket_class = ticket_class or Ticket
+
+        if json_codec is None or isinstance(json_codec, str):
+            json_codec = get_json_codec(json_codec or JSONCodec.name)
+        self.json_codec = json_codec
+
+        if compression is not None and compression not in COMPRESSIONS:
+            raise ArgumentInvalidError(f"compression must be one of: {', '.join(COMPRESSIONS)}")
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self.compression_level = compression_level
+
+        self.session_provider = session_provider
+
+        if session_refresh is not None and not 0 < session_refresh < 1:
+            raise ArgumentInvalidError("session_refresh must be between 0 and 1")
+        self.session_refresh = session_refresh
+        self.session_retry = session_retry
+        self._session_lock = threading.Lock()
+        self._session_refresh_stop = threading.Event()
+        self._session_refresh_thread = None
+
+        self.governor = governor
+        self.recorder = recorder
+
         self.customer_user = customer_user
 
         self.user_agent = user_agent
@@ -1019,6 +2990,66 @@ class Client:
         self.result_json = None
         self.result = []
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """close the HTTP session and all pooled connections (and stop the session refresh)
+
+        .. note::
+            The Client can still be used afterwards - new connections will be opened on demand.
+
+        """
+        self.stop_session_refresh()
+        self.http_session.close()
+
+    @property
+    def baseurl(self):
+        """**str**: Base URL of the OTRS instance (assigning it recompiles *self.operations*)"""
+        return self._baseurl
+
+    @baseurl.setter
+    def baseurl(self, value):
+        self._baseurl = value
+        self._recompile_operations()
+
+    @property
+    def webservice_path(self):
+        """**str**: Path of the Web Services (assigning it recompiles *self.operations*)"""
+        return self._webservice_path
+
+    @webservice_path.setter
+    def webservice_path(self, value):
+        self._webservice_path = value
+        self._recompile_operations()
+
+    def _recompile_operations(self):
+        """recompile *self.operations* (once __init__ has compiled them the first time)"""
+        if getattr(self, "operations", None) is not None:
+            self.operations = self.compile_operations()
+
+    def _create_http_session(self):
+        """create the persistent HTTP session (connection pool) used for all requests
+
+        Returns:
+            **requests.Session**: session with pooled (keep-alive) adapters for http and https
+
+        """
+        retries = Retry(total=self.max_retries,
+                        backoff_factor=self.retry_backoff_factor,
+                        status_forcelist=(500, 502, 503, 504),
+                        raise_on_status=False)
+
+        session = requests.Session()
+        for prefix in ("http://", "https://"):
+            session.mount(prefix, HTTPAdapter(pool_connections=self.pool_connections,
+                                              pool_maxsize=self.pool_maxsize,
+                                              max_retries=retries))
+        return session
+
     """
     Returns the correct session key to look for/send based
     on the current session compatibility level
@@ -1033,6 +3064,21 @@ class Client:
         else:
             return 'AccessToken'
 
+    def _session_payload(self):
+        """start a payload with the Session ID of this Client
+
+        Raises:
+            SessionNotCreated
+
+        Returns:
+            **dict**: payload containing only the Session ID (or AccessToken)
+
+        """
+        if not self.session_id_store.value:
+            raise SessionNotCreated("Call session_create() or "
+                                    "session_restore_or_create() first")
+        return {self._session_key: self.session_id_store.value}
+
     """
     GenericInterface::Operation::Session::SessionCreate
         * session_check_is_valid
@@ -1086,21 +3132,8 @@ class Client:
             Uses HTTP Method: POST
 
         """
-        if self.use_legacy_sessions:
-            self.operation = "SessionCreate"
-        else:
-            self.operation = "AccessTokenCreate"
-
-        if self.customer_user:
-            payload = {
-                "CustomerUserLogin": self.username,
-                "Password": self.password
-            }
-        else:
-            payload = {
-                "UserLogin": self.username,
-                "Password": self.password
-            }
+        self.operation = self._session_create_operation
+        payload = self._payload_session_create()
 
         response = self._send_request(payload)
         try:
@@ -1117,6 +3150,26 @@ class Client:
         self.session_id_store.value = self.result_json[self._session_key]
         return True
 
+    @property
+    def _session_create_operation(self):
+        if self.use_legacy_sessions:
+            return "SessionCreate"
+        else:
+            return "AccessTokenCreate"
+
+    def _payload_session_create(self):
+        """build the payload for SessionCreate/AccessTokenCreate"""
+        if self.customer_user:
+            return {
+                "CustomerUserLogin": self.username,
+                "Password": self.password
+            }
+        else:
+            return {
+                "UserLogin": self.username,
+                "Password": self.password
+            }
+
     def session_get(self, session_id=None):
         """get/check/validate a Session ID
 
@@ -1128,14 +3181,17 @@ class Client:
 
         """
         self.operation = "SessionGet"
+        payload = self._payload_session_get(session_id)
+
+        response = self._send_request(payload, data_id=session_id)
+        return self._parse_and_validate_response(response)
 
+    def _payload_session_get(self, session_id):
+        """build the payload for SessionGet"""
         if not session_id:
             raise ArgumentMissingError("session_id")
 
-        payload = {self._session_key: session_id}
-
-        response = self._send_request(payload, data_id=session_id)
-        return self._parse_and_validate_response(response)
+        return {self._session_key: session_id}
 
     def session_restore_or_create(self):
         """Try to restore Session ID from file otherwise create new one and save to file
@@ -1150,9 +3206,18 @@ class Client:
         .. note::
             Session ID is **saved persistently** to file: *self.session_id_store.file_path*
 
+        .. note::
+            With a *session_provider* a cached Session ID is used without reading the file or
+            validating it (see **SessionProvider**).
+
         Returns:
             **bool**: **True** if successful, otherwise **False**.
         """
+        if self.session_provider is not None:
+            result = self.session_provider.restore_or_create(self)
+            self.start_session_refresh()
+            return result
+
         # try to read session_id from file
         self.session_id_store.value = self.session_id_store.read()
 
@@ -1163,6 +3228,7 @@ class Client:
             if self.session_get(self.session_id_store.value):
                 log.info("Using valid Session ID "
                          f"from ({self.session_id_store.file_path})")
+                self.start_session_refresh()
                 return True
 
         # got no (valid) session_id; clean store
@@ -1178,26 +3244,143 @@ class Client:
         else:
             log.info("Saved new Session ID to file: "
                      f"{self.session_id_store.file_path}")
+            self.start_session_refresh()
             return True
 
-    @deprecation.deprecated(deprecated_in="0.10.0", removed_in="2.0", current_version=__version__,
-                            details="This method uses session_check_is_valid which was "
-                                    "implemented with a \"dirty\" workaround and should not be "
-                                    "called anymore. Use Client.session_restore_or_create() "
-                                    "instead. ATTENTION: Using that also switches to "
-                                    "session_get() which requires the OTRS route for HTTP GET "
-                                    "/Session to be configured  (which is/was not the default).")
-    def session_restore_or_set_up_new(self):
-        """Try to restore Session ID from file otherwise create new one and save to file
+    def session_renew(self, invalid_session_id=None):
+        """create a new Session ID, save it to file and use it for all following requests
+
+        Called by the background session refresh and when retrying a request that failed
+        because of an invalid Session ID (see *session_refresh* and *session_retry*).
+
+        Args:
+            invalid_session_id (str): only renew if this is still the current Session ID - so
+                many threads failing with the same Session ID only create one new one
 
         Raises:
             SessionCreateError
-            SessionIDFileError
 
-        .. note::
-            Session ID is recorded in self.session_id_store.value (**non persistently**)
+        Returns:
+            **str**: the (new) Session ID
 
-        .. note::
+        """
+        with self._session_lock:
+            store = self.session_id_store
+            if invalid_session_id is not None and store.value != invalid_session_id:
+                return store.value  # renewed by another thread meanwhile
+
+            # the per-call attributes of the calling thread must not change
+            state = (self.operation, self.result, self.result_json, self._result_type,
+                     self._result_error, self._result_status_code, self._result_content,
+                     self._request, self._url)
+            try:
+                if self.session_provider is not None:
+                    # locked and shared with the other processes using the session file
+                    self.session_provider.renew(self, store.value)
+                else:
+                    if not self.session_create():
+                        raise SessionCreateError("Failed to create a Session ID!")
+                    if not store.write(store.value):
+                        raise OSError("Failed to save Session ID to file!")
+            finally:
+                (self.operation, self.result, self.result_json, self._result_type,
+                 self._result_error, self._result_status_code, self._result_content,
+                 self._request, self._url) = state
+
+            log.info(f"Renewed Session ID ({store.file_path})")
+            return store.value
+
+    def start_session_refresh(self):
+        """start the background thread renewing the Session ID (if *session_refresh* is set)
+
+        Returns:
+            **bool**: **True** if the thread is running
+
+        """
+        if not self.session_refresh:
+            return False
+
+        with self._session_lock:
+            thread = self._session_refresh_thread
+            if thread is None or not thread.is_alive():
+                self._session_refresh_stop.clear()
+                self._session_refresh_thread = threading.Thread(
+                    target=self._session_refresh_loop, name="pyotrs-session-refresh",
+                    daemon=True)
+                self._session_refresh_thread.start()
+        return True
+
+    def stop_session_refresh(self):
+        """stop the background thread renewing the Session ID"""
+        self._session_refresh_stop.set()
+        thread = self._session_refresh_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._session_refresh_thread = None
+
+    def _session_refresh_wait(self):
+        """seconds until the current Session ID has to be renewed (0 if its age is unknown)"""
+        created = self.session_id_store.created
+        if not created:
+            return 0.0
+        age = (datetime.datetime.utcnow() - created).total_seconds()
+        return max(0.0, self.session_timeout * self.session_refresh - age)
+
+    def _session_refresh_loop(self):
+        stop = self._session_refresh_stop
+        while not stop.wait(self._session_refresh_wait()):
+            try:
+                self.session_renew()
+            except Exception as err:
+                log.warning(f"Failed to renew Session ID: {err}")
+                # try again later (but well before the Session ID expires)
+                if stop.wait(min(60.0, self.session_timeout * (1 - self.session_refresh) / 4)):
+                    break
+
+    def _session_invalid(self, operation, payload, result_json):
+        """check whether a request failed because its Session ID is not valid (anymore)
+
+        Returns:
+            **str** or **None**: the invalid Session ID if the request can be retried
+
+        """
+        if not self.session_retry or operation == "SessionGet" or not payload or \
+                not isinstance(result_json, dict):
+            return None
+        session_id = payload.get(self._session_key)
+        error = result_json.get("Error")
+        if session_id and isinstance(error, dict) and \
+                str(error.get("ErrorCode", "")).endswith(_SESSION_ERROR_CODES):
+            log.info(f"Session ID is invalid ({error['ErrorCode']}); retrying with a new one")
+            return session_id
+        return None
+
+    def _retry_with_new_session(self, payload, invalid_session_id):
+        """return a copy of payload using a new Session ID"""
+        payload = dict(payload)
+        del payload[self._session_key]
+        session_id = self.session_renew(invalid_session_id)
+        payload[self._session_key] = session_id  # key changes if falling back to legacy
+        return payload
+
+    @deprecation.deprecated(deprecated_in="0.10.0", removed_in="2.0", current_version=__version__,
+                            details="This method uses session_check_is_valid which was "
+                                    "implemented with a \"dirty\" workaround and should not be "
+                                    "called anymore. Use Client.session_restore_or_create() "
+                                    "instead. ATTENTION: Using that also switches to "
+                                    "session_get() which requires the OTRS route for HTTP GET "
+                                    "/Session to be configured  (which is/was not the default).")
+    def session_restore_or_set_up_new(self):
+        """Try to restore Session ID from file otherwise create new one and save to file
+
+        Raises:
+            SessionCreateError
+            SessionIDFileError
+
+        .. note::
+            Session ID is recorded in self.session_id_store.value (**non persistently**)
+
+        .. note::
             Session ID is **saved persistently** to file: *self.session_id_store.file_path*
 
         Returns:
@@ -1255,12 +3438,23 @@ class Client:
         Returns:
             **dict** or **False**: dict if successful, otherwise **False**.
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "TicketCreate"
+        payload = self._payload_ticket_create(ticket, article, attachments, dynamic_fields,
+                                              **kwargs)
+
+        if not self._parse_and_validate_response(self._send_request(payload)):
+            return False
+        else:
+            return self.result_json
 
-        payload = {self._session_key: self.session_id_store.value}
+    def _payload_ticket_create(self,
+                               ticket=None,
+                               article=None,
+                               attachments=None,
+                               dynamic_fields=None,
+                               **kwargs):
+        """build the payload for TicketCreate"""
+        payload = self._session_payload()
 
         if not ticket:
             raise ArgumentMissingError("Ticket")
@@ -1285,10 +3479,7 @@ class Client:
             # noinspection PyTypeChecker
             payload.update({"DynamicField": [df.to_dct() for df in dynamic_fields]})
 
-        if not self._parse_and_validate_response(self._send_request(payload)):
-            return False
-        else:
-            return self.result_json
+        return payload
 
     """
     GenericInterface::Operation::Ticket::TicketGet
@@ -1320,26 +3511,44 @@ class Client:
             **Ticket** or **False**: Ticket object if successful, otherwise **False**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "TicketGet"
-
-        payload = {
-            self._session_key: self.session_id_store.value,
-            "TicketID": f"{ticket_id}",
-            "AllArticles": int(articles),
-            "Attachments": int(attachments),
-            "DynamicFields": int(dynamic_fields),
-            "HTMLBodyAsAttachment": int(html_body_as_attachment),
-        }
+        payload = self._payload_ticket_get(ticket_id, articles, attachments, dynamic_fields,
+                                           html_body_as_attachment)
+
+        if self.ticket_cache is not None:
+            key = TicketCache.key(ticket_id, articles, attachments, dynamic_fields,
+                                  html_body_as_attachment)
+            cached = self._ticket_cache_get([key])
+            if cached:
+                self.result_json = {"Ticket": [cached[key]]}
+                self.result = [self.ticket_class(cached[key])]
+                return self.result[0]
 
         response = self._send_request(payload, ticket_id)
         if not self._parse_and_validate_response(response):
             return False
         else:
+            self._ticket_cache_set(articles, attachments, dynamic_fields,
+                                   html_body_as_attachment)
             return self.result[0]
 
+    def _payload_ticket_get(self,
+                            ticket_id,
+                            articles=False,
+                            attachments=False,
+                            dynamic_fields=True,
+                            html_body_as_attachment=False):
+        """build the payload for TicketGet"""
+        payload = self._session_payload()
+        payload.update({
+            "TicketID": f"{ticket_id}",
+            "AllArticles": int(articles),
+            "Attachments": int(attachments),
+            "DynamicFields": int(dynamic_fields),
+            "HTMLBodyAsAttachment": int(html_body_as_attachment),
+        })
+        return payload
+
     def ticket_get_by_list(self,
                            ticket_id_list,
                            articles=False,
@@ -1362,31 +3571,266 @@ class Client:
             **list**: Ticket objects (as list) if successful, otherwise **False**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "TicketGetList"
-
-        if not isinstance(ticket_id_list, list):
-            raise ArgumentInvalidError("Please provide list of IDs!")
+        payload = self._payload_ticket_get_list(ticket_id_list, articles, attachments,
+                                                dynamic_fields, html_body_as_attachment)
 
         # When you ask with an empty ticket_id_list, you get an empty response
         if not ticket_id_list:
             return []
 
-        payload = {
-            self._session_key: self.session_id_store.value,
+        if self.ticket_cache is not None:
+            return self._ticket_get_by_list_cached(ticket_id_list, articles, attachments,
+                                                   dynamic_fields, html_body_as_attachment)
+
+        if not self._parse_and_validate_response(self._send_request(payload)):
+            return False
+        else:
+            return self.result
+
+    def _ticket_get_by_list_cached(self,
+                                   ticket_id_list,
+                                   articles,
+                                   attachments,
+                                   dynamic_fields,
+                                   html_body_as_attachment):
+        """ticket_get_by_list using the ticket_cache - only missing tickets are requested"""
+        keys = [TicketCache.key(ticket_id, articles, attachments, dynamic_fields,
+                                html_body_as_attachment) for ticket_id in ticket_id_list]
+        cached = self._ticket_cache_get(keys)
+
+        missing = [ticket_id for ticket_id, key in zip(ticket_id_list, keys) if key not in cached]
+        if missing:
+            payload = self._payload_ticket_get_list(missing, articles, attachments,
+                                                    dynamic_fields, html_body_as_attachment)
+            if not self._parse_and_validate_response(self._send_request(payload)):
+                return False
+            cached.update(self._ticket_cache_set(articles, attachments, dynamic_fields,
+                                                 html_body_as_attachment))
+
+        raw_list = [cached[key] for key in keys if key in cached]
+        self.result_json = {"Ticket": raw_list}
+        self.result = [self.ticket_class(raw) for raw in raw_list]
+        return self.result
+
+    def _ticket_cache_get(self, keys):
+        """get raw tickets from ticket_cache - stale entries are revalidated
+
+        A stale entry is still valid if a TicketSearch for its TicketID with
+        TicketChangeTimeOlderDate set to the cached "Changed" time finds the ticket. Entries
+        with the same "Changed" time are checked with a single TicketSearch.
+
+        Args:
+            keys (list): list of cache keys (see *TicketCache.key*)
+
+        Returns:
+            **dict**: cache key -> raw ticket (dict) for all usable entries
+
+        """
+        cache = self.ticket_cache
+        found = {}
+        stale = collections.defaultdict(list)
+        for key in keys:
+            entry = cache.lookup(key)
+            if entry is None:
+                continue
+            raw, fresh = entry
+            if fresh:
+                found[key] = raw
+            elif raw.get("Changed"):
+                stale[raw["Changed"]].append((key, raw))
+            else:
+                cache.invalidate(key)
+
+        for changed, entries in stale.items():
+            ticket_ids = sorted({key[0] for key, _raw in entries})
+            try:
+                response = self.execute("TicketSearch", self._payload_ticket_search(
+                    TicketID=ticket_ids, TicketChangeTimeOlderDate=changed))
+            except PyOTRSError as err:
+                log.debug(f"TicketCache revalidation failed: {err}")
+                unchanged = set()
+            else:
+                unchanged = {str(tid) for tid in response.result} if response.success else set()
+
+            for key, raw in entries:
+                if key[0] in unchanged:
+                    cache.set(key, raw)
+                    found[key] = raw
+                else:
+                    cache.invalidate(key)
+
+        return found
+
+    def _ticket_cache_set(self, articles, attachments, dynamic_fields, html_body_as_attachment):
+        """store the tickets of the last TicketGet/TicketGetList response in ticket_cache
+
+        Returns:
+            **dict**: cache key -> raw ticket (dict) of the stored tickets
+
+        """
+        stored = {}
+        if self.ticket_cache is None or not isinstance(self.result_json, dict):
+            return stored
+
+        for raw in self.result_json.get("Ticket", []):
+            key = TicketCache.key(raw.get("TicketID"), articles, attachments, dynamic_fields,
+                                  html_body_as_attachment)
+            self.ticket_cache.set(key, raw)
+            stored[key] = raw
+        return stored
+
+    def _payload_ticket_get_list(self,
+                                 ticket_id_list,
+                                 articles=False,
+                                 attachments=False,
+                                 dynamic_fields=True,
+                                 html_body_as_attachment=False):
+        """build the payload for TicketGetList"""
+        payload = self._session_payload()
+
+        if not isinstance(ticket_id_list, list):
+            raise ArgumentInvalidError("Please provide list of IDs!")
+
+        payload.update({
             "TicketID": ','.join([str(item) for item in ticket_id_list]),
             "AllArticles": int(articles),
             "Attachments": int(attachments),
             "DynamicFields": int(dynamic_fields),
             "HTMLBodyAsAttachment": int(html_body_as_attachment),
-        }
+        })
+        return payload
+
+    def ticket_get_by_list_stream(self,
+                                  ticket_id_list,
+                                  articles=False,
+                                  attachments=False,
+                                  dynamic_fields=True,
+                                  html_body_as_attachment=False,
+                                  chunk_size=65536):
+        """ticket_get_by_list - yield each Ticket as soon as it is read from the response
+
+        The response body is parsed incrementally while it is received, so only one ticket
+        is held in memory at a time (instead of the whole response, e.g. with articles and
+        attachments of hundreds of tickets). Does not modify the Client.
 
-        if not self._parse_and_validate_response(self._send_request(payload)):
-            return False
-        else:
-            return self.result
+        Args:
+            ticket_id_list (list): List of either String or Integer values
+            attachments (bool): will request OTRS to include attachments (*default: False*)
+            articles (bool): will request OTRS to include all
+                    Articles (*default: False*)
+            dynamic_fields (bool): will request OTRS to include all
+                    Dynamic Fields (*default: True*)
+            html_body_as_attachment (bool): Optional, If enabled the HTML body version of
+                    each article is added to the attachments list
+            chunk_size (int): bytes read from the response at once (*default: 65536*)
+
+        Raises:
+            HTTPError
+            OTRSAPIError
+            ResponseParseError
+
+        Returns:
+            **generator**: Ticket objects
+
+        """
+        payload = self._payload_ticket_get_list(ticket_id_list, articles, attachments,
+                                                dynamic_fields, html_body_as_attachment)
+
+        if not ticket_id_list:
+            return
+
+        context = self._prepare("TicketGetList", payload)
+        response = self._http_send(context.http_method, context.url, context.payload,
+                                   stream=True, operation=context.operation)
+
+        parser = _TicketListParser(self.json_codec.loads)
+        with contextlib.closing(response):
+            for chunk in response.iter_content(chunk_size):
+                for item in parser.feed(chunk):
+                    yield self.ticket_class(item)
+
+        document = parser.close()
+        if not isinstance(document, dict) or "Ticket" not in document:
+            # no tickets - raises APIError or ResponseParseError
+            self._evaluate_response(context.operation, document or {}, context.result_type)
+
+    def ticket_get_bulk(self,
+                        ticket_id_list,
+                        articles=False,
+                        attachments=False,
+                        dynamic_fields=True,
+                        html_body_as_attachment=False,
+                        chunk_size=100,
+                        max_url_length=4096,
+                        max_in_flight=4):
+        """fetch many tickets with concurrent TicketGetList requests
+
+        The IDs are split into chunks of at most *chunk_size* tickets whose request URL does
+        not exceed *max_url_length*. Up to *max_in_flight* chunks are fetched at the same time
+        over the pooled HTTP session and tickets are yielded as soon as their chunk arrives.
+
+        Args:
+            ticket_id_list (iterable): String or Integer values of Ticket IDs
+            attachments (bool): will request OTRS to include attachments (*default: False*)
+            articles (bool): will request OTRS to include all
+                    Articles (*default: False*)
+            dynamic_fields (bool): will request OTRS to include all
+                    Dynamic Fields (*default: True*)
+            html_body_as_attachment (bool): Optional, If enabled the HTML body version of
+                    each article is added to the attachments list
+            chunk_size (int): maximum number of tickets per request (*default: 100*)
+            max_url_length (int): maximum length of a request URL (*default: 4096*)
+            max_in_flight (int): maximum number of concurrent requests (*default: 4*)
+
+        Raises:
+            ArgumentInvalidError
+
+        Returns:
+            **generator**: Ticket objects (in the order the chunks arrive)
+
+        """
+        payload = self._payload_ticket_get_list([], articles, attachments, dynamic_fields,
+                                                html_body_as_attachment)
+        del payload["TicketID"]
+
+        # URL and all fixed query parameters: "<url>?<params>&TicketID="
+        url = self._route_url("TicketGetList")
+        id_budget = max_url_length - len(f"{url}?{urlencode(payload)}&TicketID=")
+
+        def fetch(chunk):
+            chunk_payload = dict(payload, TicketID=",".join(chunk))
+            return self.execute("TicketGetList", chunk_payload).result
+
+        chunks = self._ticket_id_chunks(ticket_id_list, chunk_size, id_budget)
+        for tickets in _bounded_map(fetch, chunks, max_in_flight):
+            yield from tickets
+
+    @staticmethod
+    def _ticket_id_chunks(ticket_id_list, chunk_size, id_budget):
+        """split Ticket IDs into lists of at most chunk_size IDs using at most id_budget
+        characters when URL encoded (comma separated)"""
+        chunk = []
+        chunk_length = 0
+        for ticket_id in ticket_id_list:
+            ticket_id = str(ticket_id)
+            if len(ticket_id) > id_budget:
+                raise ArgumentInvalidError("max_url_length is too small for "
+                                           f"TicketID: {ticket_id}")
+
+            # a separating comma is URL encoded as "%2C"
+            length = len(ticket_id) + (3 if chunk else 0)
+            if chunk and (len(chunk) >= chunk_size or chunk_length + length > id_budget):
+                yield chunk
+                chunk = []
+                chunk_length = 0
+                length = len(ticket_id)
+
+            chunk.append(ticket_id)
+            chunk_length += length
+
+        if chunk:
+            yield chunk
 
     def ticket_get_by_number(self,
                              ticket_number,
@@ -1412,16 +3856,39 @@ class Client:
         Returns:
             **Ticket** or **False**: Ticket object if successful, otherwise **False**.
 
+        .. note::
+            With a *ticket_number_cache* the TicketSearch is skipped for cached Ticket Numbers.
+
         """
         if isinstance(ticket_number, int):
             raise ArgumentInvalidError("Provide ticket_number as str/unicode. "
                                        "Got ticket_number as int.")
+
+        cache = self.ticket_number_cache
+        if cache is not None:
+            ticket_id = cache.get(ticket_number)
+            if ticket_id is not None:
+                try:
+                    result = self.ticket_get_by_id(ticket_id,
+                                                   articles=articles,
+                                                   attachments=attachments,
+                                                   dynamic_fields=dynamic_fields,
+                                                   html_body_as_attachment=html_body_as_attachment)
+                    if result:
+                        return result
+                except APIError:
+                    pass
+                # cached Ticket ID is outdated (e.g. ticket was deleted or merged)
+                cache.invalidate(ticket_number)
+
         result_list = self.ticket_search(TicketNumber=ticket_number)
 
         if not result_list:
             return False
 
         if len(result_list) == 1:
+            if cache is not None:
+                cache.set(ticket_number, result_list[0])
             result = self.ticket_get_by_id(result_list[0],
                                            articles=articles,
                                            attachments=attachments,
@@ -1436,6 +3903,58 @@ class Client:
             raise ValueError("Found more than one result for "
                              f"Ticket Number: {ticket_number}")
 
+    def iter_tickets(self,
+                     search_kwargs=None,
+                     search_dynamic_fields=None,
+                     articles=False,
+                     attachments=False,
+                     dynamic_fields=True,
+                     html_body_as_attachment=False,
+                     batch_size=100,
+                     prefetch=1,
+                     search_query=None):
+        """search for tickets and iterate over the found Ticket objects
+
+        Runs one TicketSearch and then fetches the found tickets in batches of *batch_size*
+        (TicketGetList). The next *prefetch* batches are requested in the background while
+        the current batch is consumed, so only a few batches are held in memory.
+
+        Args:
+            search_kwargs (dict): arguments for the TicketSearch (see *ticket_search*)
+            search_dynamic_fields (list): DynamicField objects for the TicketSearch
+            attachments (bool): will request OTRS to include attachments (*default: False*)
+            articles (bool): will request OTRS to include all
+                    Articles (*default: False*)
+            dynamic_fields (bool): will request OTRS to include all
+                    Dynamic Fields (*default: True*)
+            html_body_as_attachment (bool): Optional, If enabled the HTML body version of
+                    each article is added to the attachments list
+            batch_size (int): number of tickets per TicketGetList request (*default: 100*)
+            prefetch (int): number of batches requested ahead of the consumer (*default: 1*)
+            search_query (SearchQuery): precompiled arguments for the TicketSearch
+
+        Returns:
+            **generator**: Ticket objects in the order of the search result
+
+        """
+        if batch_size < 1:
+            raise ArgumentInvalidError("batch_size must be at least 1")
+
+        search_payload = self._payload_ticket_search(search_dynamic_fields, search_query,
+                                                     **(search_kwargs or {}))
+        ticket_ids = self.execute("TicketSearch", search_payload).result
+
+        payload = self._payload_ticket_get_list([], articles, attachments, dynamic_fields,
+                                                html_body_as_attachment)
+
+        def fetch(batch):
+            batch_payload = dict(payload, TicketID=",".join(str(item) for item in batch))
+            return self.execute("TicketGetList", batch_payload).result
+
+        batches = (ticket_ids[i:i + batch_size] for i in range(0, len(ticket_ids), batch_size))
+        for tickets in _prefetch_map(fetch, batches, prefetch):
+            yield from tickets
+
     """
     GenericInterface::Operation::Ticket::TicketHistoryGet
 
@@ -1452,15 +3971,8 @@ class Client:
             **dict** or **False**: A **dict** ("History") containing a list of dicts, otherwise **False**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "TicketHistoryGet"
-
-        payload = {
-            self._session_key: self.session_id_store.value,
-            "TicketID": f"{ticket_id}"
-        }
+        payload = self._payload_ticket_history_get(ticket_id)
 
         response = self._send_request(payload, ticket_id)
         if not self._parse_and_validate_response(response):
@@ -1468,18 +3980,26 @@ class Client:
         else:
             return self.result[0]
 
+    def _payload_ticket_history_get(self, ticket_id):
+        """build the payload for TicketHistoryGet"""
+        payload = self._session_payload()
+        payload.update({"TicketID": f"{ticket_id}"})
+        return payload
+
     """
     GenericInterface::Operation::Ticket::TicketSearch
         * ticket_search
         * ticket_search_full_text
     """
 
-    def ticket_search(self, dynamic_fields=None, **kwargs):
+    def ticket_search(self, dynamic_fields=None, query=None, **kwargs):
         """Search for ticket
 
         Args:
             dynamic_fields (list): List of DynamicField objects for which the search
                 should be performed
+            query (SearchQuery): precompiled search arguments (e.g. for many searches with
+                the same DynamicFields) - kwargs are added to them
             **kwargs: Arbitrary keyword arguments (not for DynamicField objects).
 
         Returns:
@@ -1491,13 +4011,120 @@ class Client:
             converted to the appropriate string format for OTRS API.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "TicketSearch"
-        payload = {
-            self._session_key: self.session_id_store.value,
-        }
+        payload = self._payload_ticket_search(dynamic_fields, query, **kwargs)
+
+        if not self._parse_and_validate_response(self._send_request(payload)):
+            return False
+        else:
+            return self.result
+
+    def ticket_search_windowed(self,
+                               start,
+                               end,
+                               window=datetime.timedelta(days=1),
+                               limit=10000,
+                               max_in_flight=4,
+                               time_field="TicketCreateTime",
+                               dynamic_fields=None,
+                               query=None,
+                               **kwargs):
+        """search tickets in time windows and iterate over the found Ticket IDs
+
+        The time range is split into windows of *window* (searched with
+        <time_field>NewerDate/<time_field>OlderDate and *Limit*), up to *max_in_flight*
+        windows are searched at the same time and the IDs of each window are yielded as soon
+        as it arrives. A window returning *limit* IDs is split in half and searched again, so
+        no single response gets larger than *limit* IDs.
+
+        Args:
+            start (datetime.datetime): search tickets from this time (inclusive)
+            end (datetime.datetime): search tickets until this time (exclusive)
+            window (datetime.timedelta): length of the initial windows (*default: 1 day*)
+            limit (int): maximum number of IDs per request (*default: 10000*)
+            max_in_flight (int): maximum number of concurrent requests (*default: 4*)
+            time_field (str): "TicketCreateTime", "TicketChangeTime", "TicketCloseTime", ...
+                (*default: TicketCreateTime*)
+            dynamic_fields (list): List of DynamicField objects for which the search
+                should be performed
+            query (SearchQuery): precompiled search arguments (see *ticket_search*)
+            **kwargs: further TicketSearch arguments (see *ticket_search*)
+
+        Raises:
+            ArgumentInvalidError
+
+        Returns:
+            **generator**: Ticket IDs (str) - window by window in the order the responses
+            arrive
+
+        .. note::
+            OTRS compares times with a resolution of one second (both limits inclusive), so
+            each window ends one second before the next one starts. A one second window with
+            *limit* or more tickets can not be split - only *limit* of its IDs are returned
+            (and a warning is logged).
+
+        """
+        one_second = datetime.timedelta(seconds=1)
+        if limit < 1:
+            raise ArgumentInvalidError("limit must be at least 1")
+        if window < one_second:
+            raise ArgumentInvalidError("window must be at least one second")
+        if max_in_flight < 1:
+            raise ArgumentInvalidError("max_in_flight must be at least 1")
+
+        start = start.replace(microsecond=0)
+        if end.microsecond:
+            end = end.replace(microsecond=0) + one_second
+        payload = self._payload_ticket_search(dynamic_fields, query, Limit=limit, **kwargs)
+
+        def search(time_window):
+            window_start, window_end = time_window
+            window_payload = dict(payload)
+            window_payload[f"{time_field}NewerDate"] = _format_search_datetime(window_start)
+            window_payload[f"{time_field}OlderDate"] = \
+                _format_search_datetime(window_end - one_second)
+            return self.execute("TicketSearch", window_payload).result
+
+        windows = collections.deque()
+        window_start = start
+        while window_start < end:
+            windows.append((window_start, min(window_start + window, end)))
+            window_start += window
+
+        with ThreadPoolExecutor(max_workers=max_in_flight,
+                                thread_name_prefix="pyotrs") as executor:
+            running = {}
+            while windows or running:
+                while windows and len(running) < max_in_flight:
+                    time_window = windows.popleft()
+                    running[executor.submit(search, time_window)] = time_window
+
+                done, _pending = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window_start, window_end = running.pop(future)
+                    ticket_ids = future.result()
+
+                    if len(ticket_ids) >= limit:
+                        # split on whole seconds; earlier halves are searched first
+                        half = (window_end - window_start) // 2
+                        middle = window_start + datetime.timedelta(seconds=half.seconds,
+                                                                   days=half.days)
+                        if middle > window_start:
+                            windows.appendleft((middle, window_end))
+                            windows.appendleft((window_start, middle))
+                            continue
+
+                        log.warning(f"TicketSearch window at {window_start} has {limit} or "
+                                    "more tickets - increase limit to get all of them")
+
+                    yield from ticket_ids
+
+    def _payload_ticket_search(self, dynamic_fields=None, query=None, **kwargs):
+        """build the payload for TicketSearch"""
+        payload = self._session_payload()
+
+        if query is not None:
+            payload.update(query.fields)
 
         if dynamic_fields:
             if isinstance(dynamic_fields, DynamicField):
@@ -1506,16 +4133,10 @@ class Client:
                 for df in dynamic_fields:
                     payload.update(df.to_dct_search())
 
-        if kwargs is not None:
-            for key, value in kwargs.items():
-                if isinstance(value, datetime.datetime):
-                    value = value.strftime("%Y-%m-%d %H:%M:%S")
-                payload.update({key: value})
+        if kwargs:
+            payload.update(_search_values(kwargs))
 
-        if not self._parse_and_validate_response(self._send_request(payload)):
-            return False
-        else:
-            return self.result
+        return payload
 
     def ticket_search_full_text(self, pattern):
         """Wrapper for search ticket for full text search
@@ -1529,18 +4150,22 @@ class Client:
 
         """
         self.operation = "TicketSearch"
+        return self.ticket_search(**self._search_full_text_kwargs(pattern))
+
+    def _search_full_text_kwargs(self, pattern):
+        """build the TicketSearch arguments for a full text search"""
         pattern_wildcard = f"%{pattern}%"
 
         if self.use_legacy_sessions:
-            return self.ticket_search(FullTextIndex="1",
-                                      ContentSearch="OR",
-                                      Subject=pattern_wildcard,
-                                      Body=pattern_wildcard)
+            return {"FullTextIndex": "1",
+                    "ContentSearch": "OR",
+                    "Subject": pattern_wildcard,
+                    "Body": pattern_wildcard}
         else:
-            return self.ticket_search(FullTextIndex="1",
-                                      ContentSearch="OR",
-                                      MIMEBase_Subject=pattern_wildcard,
-                                      MIMEBase_Body=pattern_wildcard)
+            return {"FullTextIndex": "1",
+                    "ContentSearch": "OR",
+                    "MIMEBase_Subject": pattern_wildcard,
+                    "MIMEBase_Body": pattern_wildcard}
 
     """
     GenericInterface::Operation::Ticket::TicketUpdate
@@ -1568,12 +4193,88 @@ class Client:
         Returns:
             **dict** or **False**: A dict if successful, otherwise **False**.
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "TicketUpdate"
+        payload = self._payload_ticket_update(ticket_id, article, attachments, dynamic_fields,
+                                              **kwargs)
+
+        if self.ticket_cache is not None:
+            self.ticket_cache.invalidate_ticket(ticket_id)
+        try:
+            response = self._send_request(payload, ticket_id)
+        finally:
+            # another thread may have cached the old ticket while the request was sent
+            if self.ticket_cache is not None:
+                self.ticket_cache.invalidate_ticket(ticket_id)
+
+        if not self._parse_and_validate_response(response):
+            return False
+
+        return self.result_json
+
+    def ticket_update_bulk(self, updates, max_in_flight=4, rate_limit=None):
+        """update many tickets with concurrent TicketUpdate requests
+
+        A failing update does not stop the others: every update yields a
+        *TicketUpdateResult* with the response or the error and the time it took.
+
+        Args:
+            updates (iterable): tuples of (ticket_id, fields, dynamic_fields, article) - fields
+                is a dict of regular Ticket Fields (see *ticket_update* kwargs); dynamic_fields
+                (list of *DynamicField*) and article (*Article*) are optional or may be None
+            max_in_flight (int): maximum number of concurrent requests (*default: 4*)
+            rate_limit (float or RateLimiter): maximum number of requests per second - a
+                *RateLimiter* can be shared by several bulk updates (*default: None*)
+
+        Raises:
+            ArgumentInvalidError
+
+        Returns:
+            **generator**: TicketUpdateResult objects (in the order the responses arrive)
 
-        payload = {self._session_key: self.session_id_store.value, "TicketID": ticket_id}
+        """
+        if rate_limit is not None and not isinstance(rate_limit, RateLimiter):
+            rate_limit = RateLimiter(rate_limit)
+
+        def update(item):
+            # known before unpacking - so malformed items are reported with their ticket_id
+            ticket_id = item[0] if isinstance(item, (tuple, list)) and item else item
+            start = time.perf_counter()
+            try:
+                ticket_id, fields, *optional = item
+                dynamic_fields, article = (list(optional) + [None, None])[:2]
+
+                payload = self._payload_ticket_update(ticket_id, article, None, dynamic_fields,
+                                                      **(fields or {}))
+                if rate_limit is not None:
+                    rate_limit.acquire()
+                    start = time.perf_counter()
+
+                if self.ticket_cache is not None:
+                    self.ticket_cache.invalidate_ticket(ticket_id)
+                try:
+                    response = self.execute("TicketUpdate", payload, ticket_id)
+                finally:
+                    if self.ticket_cache is not None:
+                        self.ticket_cache.invalidate_ticket(ticket_id)
+            except (PyOTRSError, TypeError, ValueError) as err:
+                log.warning(f"Failed to update ticket {ticket_id}: {err}")
+                return TicketUpdateResult(ticket_id, False, error=err,
+                                          elapsed=time.perf_counter() - start)
+
+            return TicketUpdateResult(ticket_id, response.success, response.result_json,
+                                      elapsed=response.elapsed)
+
+        yield from _bounded_map(update, updates, max_in_flight)
+
+    def _payload_ticket_update(self,
+                               ticket_id,
+                               article=None,
+                               attachments=None,
+                               dynamic_fields=None,
+                               **kwargs):
+        """build the payload for TicketUpdate"""
+        payload = self._session_payload()
+        payload.update({"TicketID": ticket_id})
 
         if article:
             article.validate()
@@ -1595,10 +4296,7 @@ class Client:
                 ticket_dct.update({key: value})
             payload.update({"Ticket": ticket_dct})
 
-        if not self._parse_and_validate_response(self._send_request(payload, ticket_id)):
-            return False
-
-        return self.result_json
+        return payload
 
     def ticket_update_set_pending(self,
                                   ticket_id,
@@ -1619,12 +4317,17 @@ class Client:
         .. note::
             Operates in UTC
         """
+        pt = self._pending_time(pending_days, pending_hours)
+
+        return self.ticket_update(ticket_id, State=new_state, PendingTime=pt)
+
+    @staticmethod
+    def _pending_time(pending_days, pending_hours):
+        """pending time (UTC) as required by TicketUpdate"""
         datetime_now = datetime.datetime.utcnow()
         pending_till = datetime_now + datetime.timedelta(days=pending_days, hours=pending_hours)
 
-        pt = Ticket.datetime_to_pending_time_text(datetime_object=pending_till)
-
-        return self.ticket_update(ticket_id, State=new_state, PendingTime=pt)
+        return Ticket.datetime_to_pending_time_text(datetime_object=pending_till)
 
     """
     GenericInterface::Operation::Link::LinkAdd
@@ -1654,22 +4357,30 @@ class Client:
             **True** or **False**: True if successful, otherwise **False**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "LinkAdd"
+        payload = self._payload_link_add(src_object_id, dst_object_id, src_object_type,
+                                         dst_object_type, link_type, state)
+
+        return self._parse_and_validate_response(self._send_request(payload))
 
-        payload = {
-            self._session_key: self.session_id_store.value,
+    def _payload_link_add(self,
+                          src_object_id,
+                          dst_object_id,
+                          src_object_type="Ticket",
+                          dst_object_type="Ticket",
+                          link_type="Normal",
+                          state="Valid"):
+        """build the payload for LinkAdd"""
+        payload = self._session_payload()
+        payload.update({
             "SourceObject": src_object_type,
             "SourceKey": int(src_object_id),
             "TargetObject": dst_object_type,
             "TargetKey": int(dst_object_id),
             "Type": link_type,
             "State": state
-        }
-
-        return self._parse_and_validate_response(self._send_request(payload))
+        })
+        return payload
 
     """
     GenericInterface::Operation::Link::LinkDelete
@@ -1697,21 +4408,28 @@ class Client:
             **True** or **False**: True if successful, otherwise **False**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "LinkDelete"
+        payload = self._payload_link_delete(src_object_id, dst_object_id, src_object_type,
+                                            dst_object_type, link_type)
+
+        return self._parse_and_validate_response(self._send_request(payload))
 
-        payload = {
-            self._session_key: self.session_id_store.value,
+    def _payload_link_delete(self,
+                             src_object_id,
+                             dst_object_id,
+                             src_object_type="Ticket",
+                             dst_object_type="Ticket",
+                             link_type="Normal"):
+        """build the payload for LinkDelete"""
+        payload = self._session_payload()
+        payload.update({
             "Object1": src_object_type,
             "Key1": int(src_object_id),
             "Object2": dst_object_type,
             "Key2": int(dst_object_id),
             "Type": link_type
-        }
-
-        return self._parse_and_validate_response(self._send_request(payload))
+        })
+        return payload
 
     """
     GenericInterface::Operation::Link::LinkDeleteAll
@@ -1732,22 +4450,24 @@ class Client:
             **True** or **False**: True if successful, otherwise **False**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "LinkDeleteAll"
-
-        payload = {
-            self._session_key: self.session_id_store.value,
-            "Object": object_type,
-            "Key": int(object_id)
-        }
+        payload = self._payload_link_delete_all(object_id, object_type)
 
         return self._parse_and_validate_response(self._send_request(payload))
 
+    def _payload_link_delete_all(self, object_id, object_type="Ticket"):
+        """build the payload for LinkDeleteAll"""
+        payload = self._session_payload()
+        payload.update({
+            "Object": object_type,
+            "Key": int(object_id)
+        })
+        return payload
+
     """
     GenericInterface::Operation::Link::LinkList
         * link_list
+        * link_graph
     """
 
     def link_list(self,
@@ -1773,17 +4493,29 @@ class Client:
             **list** or **None**: List of found dict links if successful, if empty **None**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "LinkList"
+        payload = self._payload_link_list(src_object_id, src_object_type, dst_object_type,
+                                          state, link_type, direction)
 
-        payload = {
-            self._session_key: self.session_id_store.value,
+        result = None
+        if self._parse_and_validate_response(self._send_request(payload)):
+            result = self.result
+        return result
+
+    def _payload_link_list(self,
+                           src_object_id,
+                           src_object_type="Ticket",
+                           dst_object_type=None,
+                           state="Valid",
+                           link_type=None,
+                           direction=None):
+        """build the payload for LinkList"""
+        payload = self._session_payload()
+        payload.update({
             "Object": src_object_type,
             "Key": int(src_object_id),
             "State": state
-        }
+        })
 
         if dst_object_type:
             payload.update({"Object2": dst_object_type})
@@ -1794,10 +4526,87 @@ class Client:
         if direction:
             payload.update({"Direction": direction})
 
-        result = None
-        if self._parse_and_validate_response(self._send_request(payload)):
-            result = self.result
-        return result
+        return payload
+
+    def link_graph(self,
+                   ticket_ids,
+                   max_depth=None,
+                   max_tickets=1000,
+                   max_in_flight=4,
+                   link_type=None,
+                   state="Valid",
+                   link_cache=None):
+        """fetch the tickets linked (directly or indirectly) to ticket_ids
+
+        The links are expanded breadth first: the links of all tickets of one level are
+        fetched with concurrent LinkList requests and the links of every ticket are fetched
+        only once - so a cluster of linked tickets takes one round of requests per level.
+
+        Args:
+            ticket_ids (int or list): Ticket ID(s) to start from
+            max_depth (int): maximum number of links between ticket_ids and a ticket whose
+                links are fetched, None means no limit (*default: None*)
+            max_tickets (int): maximum number of tickets whose links are fetched
+                (*default: 1000*)
+            max_in_flight (int): maximum number of concurrent requests (*default: 4*)
+            link_type (str): only follow links of this type: "Normal" or "ParentChild"
+            state (str): State of the links (*default: Valid*)
+            link_cache (LRUCache): optional cache of the linked Ticket IDs of a ticket, e.g.
+                to share them between several calls (*default: None*)
+
+        Raises:
+            ArgumentInvalidError
+
+        Returns:
+            **dict**: Ticket ID (int) -> **set** of linked Ticket IDs (int) for every ticket
+            whose links were fetched. Tickets beyond max_depth or max_tickets only appear
+            in the sets.
+
+        """
+        if max_tickets < 1:
+            raise ArgumentInvalidError("max_tickets must be at least 1")
+        if max_depth is not None and max_depth < 0:
+            raise ArgumentInvalidError("max_depth must not be negative")
+
+        if isinstance(ticket_ids, (int, str)):
+            ticket_ids = [ticket_ids]
+
+        def fetch(ticket_id):
+            key = (ticket_id, link_type, state)
+            if link_cache is not None:
+                linked = link_cache.get(key)
+                if linked is not None:
+                    return ticket_id, linked
+
+            payload = self._payload_link_list(ticket_id, "Ticket", "Ticket", state, link_type)
+            links = self.execute("LinkList", payload).result or []
+            if isinstance(links, dict):  # a single link is not wrapped in a list
+                links = [links]
+            linked = frozenset(int(link["Key"]) for link in links
+                               if link.get("Object", "Ticket") == "Ticket")
+
+            if link_cache is not None:
+                link_cache.set(key, linked)
+            return ticket_id, linked
+
+        graph = {}
+        frontier = list(dict.fromkeys(int(ticket_id) for ticket_id in ticket_ids))
+        depth = 0
+        while frontier:
+            if len(graph) + len(frontier) > max_tickets:
+                log.warning(f"Link graph truncated: more than {max_tickets} linked tickets")
+                frontier = frontier[:max_tickets - len(graph)]
+
+            for ticket_id, linked in _bounded_map(fetch, frontier, max_in_flight):
+                graph[ticket_id] = set(linked)
+
+            if max_depth is not None and depth >= max_depth:
+                break
+            depth += 1
+            frontier = sorted({linked_id for ticket_id in frontier
+                               for linked_id in graph[ticket_id]} - graph.keys())
+
+        return graph
 
     """
     GenericInterface::Operation::Link::PossibleLinkList
@@ -1811,14 +4620,8 @@ class Client:
             **List** or **False**: List if successful, otherwise **False**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "PossibleLinkList"
-
-        payload = {
-            self._session_key: self.session_id_store.value,
-        }
+        payload = self._session_payload()
 
         if self._parse_and_validate_response(self._send_request(payload)):
             return self.result
@@ -1842,15 +4645,9 @@ class Client:
             **List** or **False**: List if successful, otherwise **False**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "PossibleObjectsList"
-
-        payload = {
-            self._session_key: self.session_id_store.value,
-            "Object": object_type,
-        }
+        payload = self._session_payload()
+        payload.update({"Object": object_type})
 
         if self._parse_and_validate_response(self._send_request(payload)):
             return self.result
@@ -1877,22 +4674,57 @@ class Client:
             **List** or **False**: List if successful, otherwise **False**.
 
         """
-        if not self.session_id_store.value:
-            raise SessionNotCreated("Call session_create() or "
-                                    "session_restore_or_create() first")
         self.operation = "PossibleTypesList"
-
-        payload = {
-            self._session_key: self.session_id_store.value,
-            "Object1": src_object_type,
-            "Object2": dst_object_type,
-        }
+        payload = self._payload_link_possible_types_list(src_object_type, dst_object_type)
 
         if self._parse_and_validate_response(self._send_request(payload)):
             return self.result
         else:
             return False
 
+    def _payload_link_possible_types_list(self, src_object_type="Ticket",
+                                          dst_object_type="Ticket"):
+        """build the payload for PossibleTypesList"""
+        payload = self._session_payload()
+        payload.update({
+            "Object1": src_object_type,
+            "Object2": dst_object_type,
+        })
+        return payload
+
+    def compile_operations(self):
+        """compile ws_config into a table of the request settings of each operation
+
+        The table is created by __init__ (see *self.operations*) and recompiled whenever
+        *baseurl* or *webservice_path* is assigned - call this again and assign the result to
+        *self.operations* only after changing the Web Service configuration.
+
+        Returns:
+            **dict**: Name of the operation -> **OperationRoute**
+
+        """
+        routes_ticket = set(self.routes_ticket)
+        routes_link = set(self.routes_link)
+        ticket_url = f"{self.baseurl}{self.webservice_path}{self.ws_ticket}"
+        link_url = f"{self.baseurl}{self.webservice_path}{self.ws_link}"
+
+        operations = {}
+        for operation, config in self.ws_config.items():
+            route, route_arg, connector, url = config["Route"], None, None, None
+
+            if ":" in route:
+                route, route_arg = route.split(":")[:2]
+                if route_arg in ("TicketID", "SessionID"):
+                    connector, url = self.ws_ticket, f"{ticket_url}{route}"
+            elif route in routes_ticket:
+                connector, url = self.ws_ticket, f"{ticket_url}{route}"
+            elif route in routes_link:
+                connector, url = self.ws_link, f"{link_url}{route}"
+
+            operations[operation] = OperationRoute(config["RequestMethod"], url,
+                                                   config["Result"], connector, route, route_arg)
+        return operations
+
     def _build_url(self, data_id=None):
         """build url for request
 
@@ -1903,33 +4735,40 @@ class Client:
             **str**: The complete URL where the request will be send to.
 
         """
-        route = self.ws_config[self.operation]["Route"]
+        self._url = self._route_url(self.operation, data_id)
+        return self._url
 
-        if ":" in route:
-            route_split = route.split(":")
-            route = route_split[0]
-            route_arg = route_split[1]
+    def _route_url(self, operation, data_id=None):
+        """build url for a request of operation (does not modify the Client)
 
-            if route_arg == "TicketID":
-                if not data_id:
-                    raise ValueError("TicketID is None but Route requires "
-                                     f"TicketID: {route}")
-                self._url = f"{self.baseurl}{self.webservice_path}{self.ws_ticket}{route}{data_id}"
-            elif route_arg == "SessionID":
-                if not data_id:
-                    raise ValueError("SessionID is None but Route requires "
-                                     f"SessionID: {route}")
-                self._url = f"{self.baseurl}{self.webservice_path}{self.ws_ticket}{route}{data_id}"
-        else:
-            if route in self.routes_ticket:
-                self._url = f"{self.baseurl}{self.webservice_path}{self.ws_ticket}{route}"
-            elif route in self.routes_link:
-                self._url = f"{self.baseurl}{self.webservice_path}{self.ws_link}{route}"
+        Args:
+            operation (str): Name of the OTRS WebService operation
+            data_id (optional[int])
 
-        return self._url
+        Returns:
+            **str**: The complete URL where the request will be send to.
+
+        Raises:
+            ArgumentInvalidError: if operation is unknown or its Route can not be resolved
+
+        """
+        route = self.operations.get(operation)
+        if route is None:
+            raise ArgumentInvalidError(f"Unknown operation: {operation}")
+        if route.url is None:
+            raise ArgumentInvalidError(f"Route of operation {operation} can not be "
+                                       f"resolved: {route.route}")
+
+        if route.route_arg is None:
+            return route.url
+
+        if not data_id:
+            raise ValueError(f"{route.route_arg} is None but Route requires "
+                             f"{route.route_arg}: {route.route}")
+        return f"{route.url}{data_id}"
 
     def _send_request(self, payload=None, data_id=None):
-        """send the API request using the *requests.request* method
+        """send the API request using the pooled HTTP session of this Client
 
         Args:
             payload (dict)
@@ -1947,13 +4786,47 @@ class Client:
         if not payload:
             raise ArgumentMissingError("payload")
 
-        self._result_type = self.ws_config[self.operation]["Result"]
-
         url = self._build_url(data_id)
 
-        http_method = self.ws_config[self.operation]["RequestMethod"]
+        route = self.operations[self.operation]
+        self._result_type = route.result_type
+
+        http_method = route.http_method
+
+        self._request_start = time.perf_counter()
+        response = self._http_send(http_method, url, payload, operation=self.operation)
+
+        # an error response is small - so only those are decoded twice
+        if self.session_retry and len(response.content) < 4096:
+            invalid_session_id = self._session_invalid(self.operation, payload,
+                                                       self._decode(self.operation, response))
+            if invalid_session_id:
+                payload = self._retry_with_new_session(payload, invalid_session_id)
+                response = self._http_send(http_method, url, payload, operation=self.operation)
+
+        # store a copy of the request
+        self._request = response.request
+
+        return response
+
+    def _http_send(self, http_method, url, payload, stream=False, operation=None):
+        """send a HTTP request over the pooled HTTP session (does not modify the Client)
+
+        Args:
+            http_method (str): HTTP method
+            url (str): The complete URL
+            payload (dict)
+            stream (bool): do not read the response body now (see *requests*)
+            operation (str): Name of the OTRS WebService operation (for the *governor*)
 
-        if http_method not in ["DELETE", "GET", "HEAD", "PATCH", "POST", "PUT"]:
+        Raises:
+            OTRSHTTPError:
+
+        Returns:
+            **requests.Response**: Response received after sending the request.
+
+        """
+        if http_method not in _HTTP_METHODS:
             raise ValueError("invalid http_method")
 
         headers = {}
@@ -1961,62 +4834,102 @@ class Client:
         if self.user_agent:
             headers.update({"User-Agent": self.user_agent})
 
-        if http_method == "GET":
+        options = {"stream": True} if stream else {}
 
-            # print("sending {0} to {1} as {2}".format(payload, url, http_method.upper()))
-            try:
-                response = requests.request("GET",
-                                            url,
-                                            headers=headers,
-                                            params=payload,
-                                            proxies=self.proxies,
-                                            verify=self.https_verify,
-                                            cert=self.client_auth_cert,
-                                            auth=self.auth,
-                                            timeout=self.request_timeout)
-
-                # store a copy of the request
-                self._request = response.request
-
-            # critical error: HTTP request resulted in an error!
-            except Exception as err:
-                # raise OTRSHTTPError("get http")
-                raise HTTPError("Failed to access OTRS. Check Hostname, Proxy, SSL Certificate!\n"
-                                f"Error with http communication: {err}")
+        if self.compression:
+            headers.update({"Accept-Encoding": ", ".join(COMPRESSIONS)})
 
+        if self.governor is not None:
+            slot = self.governor.slot(operation)
         else:
+            slot = contextlib.nullcontext()
 
+        encode_time = None
+        if http_method == "GET":
+            data = {"params": payload}
+        else:
             headers.update({"Content-Type": "application/json"})
 
-            json_payload = json.dumps(payload)
+            encode_start = time.perf_counter()
+            json_payload = _json_body(payload, self.json_codec)
 
-            # print("sending {0} to {1} as {2}".format(payload, url, http_method.upper()))
-            try:
-                response = requests.request(http_method.upper(),
-                                            url,
-                                            headers=headers,
-                                            data=json_payload,
-                                            proxies=self.proxies,
-                                            verify=self.https_verify,
-                                            cert=self.client_auth_cert,
-                                            auth=self.auth,
-                                            timeout=self.request_timeout)
-
-                # store a copy of the request
-                self._request = response.request
-
-            # critical error: HTTP request resulted in an error!
-            except Exception as err:
-                # raise OTRSHTTPError("get http")
-                raise HTTPError("Failed to access OTRS. Check Hostname, Proxy, SSL Certificate!\n"
-                                f"Error with http communication: {err}")
+            if self.compression and not isinstance(json_payload, _StreamingBody):
+                json_payload, encoding = _compress_body(json_payload,
+                                                        self.compression,
+                                                        self.compression_threshold,
+                                                        self.compression_level)
+                if encoding:
+                    headers.update({"Content-Encoding": encoding})
+            encode_time = time.perf_counter() - encode_start
+
+            data = {"data": json_payload}
+
+        # print("sending {0} to {1} as {2}".format(payload, url, http_method.upper()))
+        try:
+            with slot:
+                sent = time.perf_counter()
+                response = self.http_session.request(http_method.upper(),
+                                                     url,
+                                                     headers=headers,
+                                                     proxies=self.proxies,
+                                                     verify=self.https_verify,
+                                                     cert=self.client_auth_cert,
+                                                     auth=self.auth,
+                                                     timeout=self.request_timeout,
+                                                     **data,
+                                                     **options)
+                http_time = time.perf_counter() - sent
+
+        # critical error: HTTP request resulted in an error!
+        except Exception as err:
+            self._record(operation, "errors", 1)
+            # raise OTRSHTTPError("get http")
+            raise HTTPError("Failed to access OTRS. Check Hostname, Proxy, SSL Certificate!\n"
+                            f"Error with http communication: {err}") from err
+
+        if self.recorder is not None:
+            self._record_http(operation, response, http_time, encode_time, stream)
 
         if not response.status_code == 200:
+            self._record(operation, "errors", 1)
             raise HTTPError("Received HTTP Error. Check Hostname and WebServiceName.\n"
                             f"HTTP Status Code: {response.status_code}\n"
                             f"HTTP Message: {response.content}")
         return response
 
+    def _record(self, operation, metric, value):
+        """pass a measurement to the recorder (if any)"""
+        if self.recorder is not None:
+            self.recorder.record(operation, metric, value)
+
+    def _record_http(self, operation, response, http_time, encode_time, stream):
+        """pass the measurements of one HTTP request to the recorder"""
+        record = self.recorder.record
+        record(operation, "http", http_time)
+        if isinstance(response.elapsed, datetime.timedelta):
+            record(operation, "ttfb", response.elapsed.total_seconds())
+        if encode_time is not None:
+            record(operation, "encode", encode_time)
+
+        request = response.request
+        if request is not None:
+            if request.body is not None:
+                record(operation, "request_bytes", len(request.body))
+            else:
+                record(operation, "request_bytes", len(request.url.partition("?")[2]))
+        if not stream:
+            record(operation, "response_bytes", len(response.content))
+
+    def _decode(self, operation, response):
+        """decode the JSON response (measuring the time it takes)"""
+        if self.recorder is None:
+            return self.json_codec.decode_response(response)
+
+        start = time.perf_counter()
+        result_json = self.json_codec.decode_response(response)
+        self.recorder.record(operation, "decode", time.perf_counter() - start)
+        return result_json
+
     def _parse_and_validate_response(self, response):
         """_parse_and_validate_response
 
@@ -2036,7 +4949,7 @@ class Client:
         if not isinstance(response, requests.models.Response):
             raise ValueError("requests.Response object expected!")
 
-        if self.operation not in self.ws_config.keys():
+        if self.operation not in self.operations:
             raise ValueError("invalid operation")
 
         # clear data from Client
@@ -2044,85 +4957,661 @@ class Client:
         self._result_error = False
 
         # get and set new data
-        self.result_json = response.json()
+        self.result_json = self._decode(self.operation, response)
         self._result_status_code = response.status_code
         self._result_content = response.content
 
+        try:
+            success, self.result = self._evaluate_response(self.operation,
+                                                           self.result_json,
+                                                           self._result_type)
+        except (APIError, ResponseParseError):
+            self._result_error = True
+            self._record(self.operation, "errors", 1)
+            raise
+        finally:
+            if self._request_start is not None:
+                self._record(self.operation, "wall", time.perf_counter() - self._request_start)
+                self._request_start = None
+
+        return success
+
+    def _evaluate_response(self, operation, result_json, result_type):
+        """validate the decoded response of operation (does not modify the Client)
+
+        Args:
+            operation (str): Name of the OTRS WebService operation
+            result_json (dict): decoded JSON response
+            result_type (str): key of the result in result_json
+
+        Raises:
+            OTRSAPIError
+            ResponseParseError
+
+        Returns:
+            **tuple**: (**bool** success, result)
+
+        """
         # handle TicketSearch operation first. special: empty search result has no "TicketID"
-        if self.operation == "TicketSearch":
-            if not self.result_json:
-                self.result = []
-                return True
-            if self.result_json.get(self._result_type, None):
-                self.result = self.result_json['TicketID']
-                return True
+        if operation == "TicketSearch":
+            if not result_json:
+                return True, []
+            if result_json.get(result_type, None):
+                return True, result_json['TicketID']
 
         # now handle SessionGet operation
-        if self.operation in ["SessionGet"]:
+        if operation in ["SessionGet"]:
             # For SessionGet the "Result" that is returned is different when legacy session
             # are used.
             # SessionData was default in OTRS <= 7 / PyOTRS used it as default from v0.1.
             # AccessTokenData was introduced in OTRS 8 - for CustomerUser already in 7 (?!).
             # Unless the dict was modified - use the hardcoded defaults accordingly.
-            if self._result_type not in ["AccessTokenData", "SessionData"]:
-                session_result_type = self._result_type
+            if result_type not in ["AccessTokenData", "SessionData"]:
+                session_result_type = result_type
             else:
                 if self.use_legacy_sessions:
                     session_result_type = "SessionData"
                 else:
                     session_result_type = "AccessTokenData"
 
-            _session_data = self.result_json.get(session_result_type, None)
+            _session_data = result_json.get(session_result_type, None)
             if _session_data:  # received SessionData -> Session ID is valid
-                self._result_error = False
-                self.result = self.result_json[session_result_type]
-                return True
-            elif self.result_json["Error"]["ErrorCode"] == "SessionGet.SessionInvalid":
-                return False
+                return True, result_json[session_result_type]
+            elif result_json["Error"]["ErrorCode"] == "SessionGet.SessionInvalid":
+                return False, None
             else:
                 raise APIError("Failed to access OTRS API.\n"
                                "OTRS Error Code: {}\nOTRS Error Message: {}"
-                               "".format(self.result_json["Error"]["ErrorCode"],
-                                         self.result_json["Error"]["ErrorMessage"]))
+                               "".format(result_json["Error"]["ErrorCode"],
+                                         result_json["Error"]["ErrorMessage"]))
 
         # handle Link operations; Add, Delete, DeleteAll return: {"Success":1}
-        if self.operation in ["LinkAdd", "LinkDelete", "LinkDeleteAll"]:
-            if self.result_json.get("Success", None) == 1:
-                return True
+        if operation in ["LinkAdd", "LinkDelete", "LinkDeleteAll"]:
+            if result_json.get("Success", None) == 1:
+                return True, None
 
         # LinkList result can be empty
-        if self.operation in "LinkList":
-            _link_list = self.result_json.get("LinkList", None)
+        if operation == "LinkList":
+            _link_list = result_json.get("LinkList", None)
             if not _link_list:
-                self.result = None
-                return True
+                return True, None
             else:
-                self.result = _link_list
-                return True
+                return True, _link_list
 
         # now handle other operations
-        if self.result_json.get(self._result_type, None):
-            self._result_error = False
-            self.result = self.result_json[self._result_type]
-        elif self.result_json.get("Error", None):
-            self._result_error = True
-        else:
-            self._result_error = True
-            # critical error: Unknown response from OTRS API - FAIL NOW!
-            raise ResponseParseError("Unknown key in response JSON DICT!")
-
-        # report error
-        if self._result_error:
+        if result_json.get(result_type, None):
+            result = result_json[result_type]
+        elif result_json.get("Error", None):
+            # report error
             raise APIError("Failed to access OTRS API. Check Username and Password! "
                            "Session ID expired?! Does Ticket exist?\n"
                            "OTRS Error Code: {}\nOTRS Error Message: {}"
-                           "".format(self.result_json["Error"]["ErrorCode"],
-                                     self.result_json["Error"]["ErrorMessage"]))
+                           "".format(result_json["Error"]["ErrorCode"],
+                                     result_json["Error"]["ErrorMessage"]))
+        else:
+            # critical error: Unknown response from OTRS API - FAIL NOW!
+            raise ResponseParseError("Unknown key in response JSON DICT!")
 
         # for operation TicketGet: parse result list into Ticket object list
-        if self.operation == "TicketGet" or self.operation == "TicketGetList":
-            self.result = [Ticket(item) for item in self.result_json['Ticket']]
+        if operation == "TicketGet" or operation == "TicketGetList":
+            parse_start = time.perf_counter()
+            result = [self.ticket_class(item) for item in result_json['Ticket']]
+            self._record(operation, "parse", time.perf_counter() - parse_start)
+
+        return True, result
+
+    def execute(self, operation, payload, data_id=None):
+        """send a request for operation and validate the response
+
+        This is reentrant: the Client is not modified, so it can be called from many threads
+        at the same time.
+
+        Args:
+            operation (str): Name of the OTRS WebService operation (e.g. "TicketGet")
+            payload (dict): payload incl. Session ID (see *_payload_** methods)
+            data_id (optional[int]): ID required by the route (e.g. TicketID)
+
+        Raises:
+            ArgumentMissingError
+            HTTPError
+            OTRSAPIError
+            ResponseParseError
+
+        Returns:
+            **ClientResponse**: status, decoded JSON, result and timing of the call
+
+        """
+        context = self._prepare(operation, payload, data_id)
+
+        start = time.perf_counter()
+        response = self._http_send(context.http_method, context.url, context.payload,
+                                   operation=context.operation)
+
+        result_json = self._decode(context.operation, response)
+
+        invalid_session_id = self._session_invalid(context.operation, context.payload,
+                                                   result_json)
+        if invalid_session_id:
+            context = context._replace(
+                payload=self._retry_with_new_session(context.payload, invalid_session_id))
+            response = self._http_send(context.http_method, context.url, context.payload,
+                                       operation=context.operation)
+            result_json = self._decode(context.operation, response)
+
+        try:
+            success, result = self._evaluate_response(context.operation,
+                                                      result_json,
+                                                      context.result_type)
+        except (APIError, ResponseParseError):
+            self._record(context.operation, "errors", 1)
+            raise
+
+        elapsed = time.perf_counter() - start
+        self._record(context.operation, "wall", elapsed)
+        return ClientResponse(context, response.status_code, result_json, result, success,
+                              elapsed)
+
+    def _prepare(self, operation, payload, data_id=None):
+        """create the immutable RequestContext for a request
+
+        Returns:
+            **RequestContext**
+
+        """
+        if not payload:
+            raise ArgumentMissingError("payload")
+
+        url = self._route_url(operation, data_id)
+        route = self.operations[operation]
+        return RequestContext(operation,
+                              route.http_method,
+                              url,
+                              payload,
+                              data_id,
+                              route.result_type)
+
+
+class AsyncClient:
+    """PyOTRS AsyncClient class - asyncio interface for the OTRS GenericInterface
+
+    All operations of *Client* are available as coroutines that return their result
+    instead of storing it in the (shared) Client attributes, so many ticket operations can be
+    awaited concurrently from one event loop (e.g. using *asyncio.gather*).
+
+    Args:
+        client (Client): Client which provides configuration, Session ID store and the pooled
+            HTTP session - if omitted a new Client is created from **kwargs
+        max_concurrency (int): maximum number of requests in flight at the same time - all
+            further requests wait for a free slot (defaults to 10)
+        **kwargs: arguments for creating a new Client (only used if client is not given)
+
+    .. note::
+        Requests are sent over the pooled HTTP session of the Client by a bounded pool of
+        worker threads (*max_concurrency*). A Client created from **kwargs gets a
+        *pool_maxsize* of *max_concurrency* unless specified otherwise.
+
+    """
+
+    def __init__(self, client=None, max_concurrency=10, **kwargs):
+        if client is None:
+            kwargs.setdefault("pool_maxsize", max_concurrency)
+            client = Client(**kwargs)
+            self._owns_client = True
+        else:
+            self._owns_client = False
+
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix="pyotrs")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: {self.client.baseurl}>"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # close blocks until the running requests (and the session refresh thread) are done
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def close(self):
+        """stop the worker threads (and close the Client if it was created by AsyncClient)"""
+        self._executor.shutdown(wait=True)
+        if self._owns_client:
+            self.client.close()
+
+    async def _run(self, func, *args):
+        """run func(*args) on the worker threads and wait for its return value"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    async def execute(self, operation, payload, data_id=None):
+        """see *Client.execute*
+
+        Returns:
+            **ClientResponse**
+
+        """
+        return await self._run(self.client.execute, operation, payload, data_id)
+
+    """
+    GenericInterface::Operation::Session::SessionCreate
+        * session_create
+        * session_get
+        * session_restore_or_create
+    """
+
+    async def session_create(self):
+        """create new (temporary) session (and Session ID)
+
+        Returns:
+            **bool**: **True** if successful, otherwise **False**.
 
+        """
+        payload = self.client._payload_session_create()
+        try:
+            response = await self.execute(self.client._session_create_operation, payload)
+        except ResponseParseError:
+            if not self.client.use_legacy_sessions:
+                log.warning("AccessTokenCreate failed, retrying using legacy session")
+                self.client.use_legacy_sessions = True
+                self.client.session_id_store.is_legacy = True
+                return await self.session_create()
+            return False
+
+        if not response.success:
+            return False
+
+        self.client.session_id_store.value = response.result_json[self.client._session_key]
         return True
 
+    async def session_get(self, session_id=None):
+        """get/check/validate a Session ID
+
+        Returns:
+            **bool**: **True** if successful, otherwise **False**.
+
+        """
+        payload = self.client._payload_session_get(session_id)
+        response = await self.execute("SessionGet", payload, session_id)
+        return response.success
+
+    async def session_restore_or_create(self):
+        """Try to restore Session ID from file otherwise create new one and save to file
+
+        Raises:
+            SessionCreateError
+            SessionIDFileError
+
+        Returns:
+            **bool**: **True** if successful, otherwise **False**.
+
+        """
+        if self.client.session_provider is not None:
+            result = await self._run(self.client.session_provider.restore_or_create, self.client)
+            self.client.start_session_refresh()
+            return result
+
+        store = self.client.session_id_store
+        store.value = await self._run(store.read)
+
+        if store.value:
+            self.client.use_legacy_sessions = store.is_legacy
+            if await self.session_get(store.value):
+                log.info(f"Using valid Session ID from ({store.file_path})")
+                self.client.start_session_refresh()
+                return True
+
+        await self._run(store.write, "")
+
+        if not await self.session_create():
+            raise SessionCreateError("Failed to create a Session ID!")
+
+        if not await self._run(store.write, store.value):
+            raise OSError("Failed to save Session ID to file!")
+        else:
+            log.info(f"Saved new Session ID to file: {store.file_path}")
+            self.client.start_session_refresh()
+            return True
+
+    """
+    GenericInterface::Operation::Ticket
+        * ticket_create
+        * ticket_get_by_id
+        * ticket_get_by_list
+        * ticket_get_by_number
+        * ticket_history_get_by_id
+        * ticket_search
+        * ticket_search_full_text
+        * ticket_update
+        * ticket_update_set_pending
+    """
+
+    async def ticket_create(self,
+                            ticket=None,
+                            article=None,
+                            attachments=None,
+                            dynamic_fields=None,
+                            **kwargs):
+        """Create a Ticket - see *Client.ticket_create*
+
+        Returns:
+            **dict** or **False**: dict if successful, otherwise **False**.
+        """
+        payload = self.client._payload_ticket_create(ticket, article, attachments,
+                                                     dynamic_fields, **kwargs)
+        response = await self.execute("TicketCreate", payload)
+        return response.result_json if response.success else False
+
+    async def ticket_get_by_id(self,
+                               ticket_id,
+                               articles=False,
+                               attachments=False,
+                               dynamic_fields=True,
+                               html_body_as_attachment=False):
+        """ticket_get_by_id - see *Client.ticket_get_by_id*
+
+        Returns:
+            **Ticket** or **False**: Ticket object if successful, otherwise **False**.
+
+        """
+        payload = self.client._payload_ticket_get(ticket_id, articles, attachments,
+                                                  dynamic_fields, html_body_as_attachment)
+
+        cache = self.client.ticket_cache
+        if cache is not None:
+            key = TicketCache.key(ticket_id, articles, attachments, dynamic_fields,
+                                  html_body_as_attachment)
+            cached = await self._run(self.client._ticket_cache_get, [key])
+            if cached:
+                return self.client.ticket_class(cached[key])
+
+        response = await self.execute("TicketGet", payload, ticket_id)
+        if not response.success:
+            return False
+
+        if cache is not None:
+            cache.set(key, response.result_json["Ticket"][0])
+        return response.result[0]
+
+    async def ticket_get_by_list(self,
+                                 ticket_id_list,
+                                 articles=False,
+                                 attachments=False,
+                                 dynamic_fields=True,
+                                 html_body_as_attachment=False):
+        """ticket_get_by_list - see *Client.ticket_get_by_list*
+
+        Returns:
+            **list**: Ticket objects (as list) if successful, otherwise **False**.
+
+        """
+        payload = self.client._payload_ticket_get_list(ticket_id_list, articles, attachments,
+                                                       dynamic_fields, html_body_as_attachment)
+        if not ticket_id_list:
+            return []
+
+        cache = self.client.ticket_cache
+        if cache is None:
+            response = await self.execute("TicketGetList", payload)
+            return response.result if response.success else False
+
+        keys = [TicketCache.key(ticket_id, articles, attachments, dynamic_fields,
+                                html_body_as_attachment) for ticket_id in ticket_id_list]
+        cached = await self._run(self.client._ticket_cache_get, keys)
+
+        missing = [ticket_id for ticket_id, key in zip(ticket_id_list, keys) if key not in cached]
+        if missing:
+            payload = self.client._payload_ticket_get_list(missing, articles, attachments,
+                                                           dynamic_fields,
+                                                           html_body_as_attachment)
+            response = await self.execute("TicketGetList", payload)
+            if not response.success:
+                return False
+            for raw in response.result_json["Ticket"]:
+                key = TicketCache.key(raw.get("TicketID"), articles, attachments,
+                                      dynamic_fields, html_body_as_attachment)
+                cache.set(key, raw)
+                cached[key] = raw
+
+        return [self.client.ticket_class(cached[key]) for key in keys if key in cached]
+
+    async def ticket_get_by_number(self,
+                                   ticket_number,
+                                   articles=False,
+                                   attachments=False,
+                                   dynamic_fields=True,
+                                   html_body_as_attachment=False):
+        """ticket_get_by_number - see *Client.ticket_get_by_number*
+
+        Raises:
+            ValueError
+
+        Returns:
+            **Ticket** or **False**: Ticket object if successful, otherwise **False**.
+
+        """
+        if isinstance(ticket_number, int):
+            raise ArgumentInvalidError("Provide ticket_number as str/unicode. "
+                                       "Got ticket_number as int.")
+
+        cache = self.client.ticket_number_cache
+        if cache is not None:
+            ticket_id = cache.get(ticket_number)
+            if ticket_id is not None:
+                try:
+                    result = await self.ticket_get_by_id(
+                        ticket_id,
+                        articles=articles,
+                        attachments=attachments,
+                        dynamic_fields=dynamic_fields,
+                        html_body_as_attachment=html_body_as_attachment)
+                    if result:
+                        return result
+                except APIError:
+                    pass
+                cache.invalidate(ticket_number)
+
+        result_list = await self.ticket_search(TicketNumber=ticket_number)
+
+        if not result_list:
+            return False
+
+        if len(result_list) > 1:
+            raise ValueError("Found more than one result for "
+                             f"Ticket Number: {ticket_number}")
+
+        if cache is not None:
+            cache.set(ticket_number, result_list[0])
+
+        return await self.ticket_get_by_id(result_list[0],
+                                           articles=articles,
+                                           attachments=attachments,
+                                           dynamic_fields=dynamic_fields,
+                                           html_body_as_attachment=html_body_as_attachment)
+
+    async def ticket_history_get_by_id(self, ticket_id):
+        """ticket_history_get_by_id - see *Client.ticket_history_get_by_id*
+
+        Returns:
+            **dict** or **False**: A **dict** ("History") containing a list of dicts,
+            otherwise **False**.
+
+        """
+        payload = self.client._payload_ticket_history_get(ticket_id)
+        response = await self.execute("TicketHistoryGet", payload, ticket_id)
+        return response.result[0] if response.success else False
+
+    async def ticket_search(self, dynamic_fields=None, query=None, **kwargs):
+        """Search for ticket - see *Client.ticket_search*
+
+        Returns:
+            **list** or **False**: The search result (as list) if successful (can be an
+                empty list: []), otherwise **False**.
+
+        """
+        payload = self.client._payload_ticket_search(dynamic_fields, query, **kwargs)
+        response = await self.execute("TicketSearch", payload)
+        return response.result if response.success else False
+
+    async def ticket_search_full_text(self, pattern):
+        """Wrapper for search ticket for full text search - see *Client.ticket_search_full_text*
+
+        Returns:
+            **list** or **False**: The search result (as list) if successful,
+                otherwise **False**.
+
+        """
+        return await self.ticket_search(**self.client._search_full_text_kwargs(pattern))
+
+    async def ticket_update(self,
+                            ticket_id,
+                            article=None,
+                            attachments=None,
+                            dynamic_fields=None,
+                            **kwargs):
+        """Update a Ticket - see *Client.ticket_update*
+
+        Returns:
+            **dict** or **False**: A dict if successful, otherwise **False**.
+        """
+        payload = self.client._payload_ticket_update(ticket_id, article, attachments,
+                                                     dynamic_fields, **kwargs)
+        cache = self.client.ticket_cache
+        if cache is not None:
+            cache.invalidate_ticket(ticket_id)
+        try:
+            response = await self.execute("TicketUpdate", payload, ticket_id)
+        finally:
+            # another task may have cached the old ticket while the request was sent
+            if cache is not None:
+                cache.invalidate_ticket(ticket_id)
+        return response.result_json if response.success else False
+
+    async def ticket_update_set_pending(self,
+                                        ticket_id,
+                                        new_state="pending reminder",
+                                        pending_days=1,
+                                        pending_hours=0):
+        """ticket_update_set_state_pending - see *Client.ticket_update_set_pending*
+
+        Returns:
+            **dict** or **False**: A dict if successful, otherwise **False**.
+
+        """
+        pt = Client._pending_time(pending_days, pending_hours)
+
+        return await self.ticket_update(ticket_id, State=new_state, PendingTime=pt)
+
+    """
+    GenericInterface::Operation::Link
+        * link_add
+        * link_delete
+        * link_delete_all
+        * link_list
+        * link_possible_link_list
+        * link_possible_objects_list
+        * link_possible_types_list
+    """
+
+    async def link_add(self,
+                       src_object_id,
+                       dst_object_id,
+                       src_object_type="Ticket",
+                       dst_object_type="Ticket",
+                       link_type="Normal",
+                       state="Valid"):
+        """link_add - see *Client.link_add*
+
+        Returns:
+            **True** or **False**: True if successful, otherwise **False**.
+
+        """
+        payload = self.client._payload_link_add(src_object_id, dst_object_id, src_object_type,
+                                                dst_object_type, link_type, state)
+        response = await self.execute("LinkAdd", payload)
+        return response.success
+
+    async def link_delete(self,
+                          src_object_id,
+                          dst_object_id,
+                          src_object_type="Ticket",
+                          dst_object_type="Ticket",
+                          link_type="Normal"):
+        """link_delete - see *Client.link_delete*
+
+        Returns:
+            **True** or **False**: True if successful, otherwise **False**.
+
+        """
+        payload = self.client._payload_link_delete(src_object_id, dst_object_id,
+                                                   src_object_type, dst_object_type, link_type)
+        response = await self.execute("LinkDelete", payload)
+        return response.success
+
+    async def link_delete_all(self, object_id, object_type="Ticket"):
+        """link_delete_all - see *Client.link_delete_all*
+
+        Returns:
+            **True** or **False**: True if successful, otherwise **False**.
+
+        """
+        payload = self.client._payload_link_delete_all(object_id, object_type)
+        response = await self.execute("LinkDeleteAll", payload)
+        return response.success
+
+    async def link_list(self,
+                        src_object_id,
+                        src_object_type="Ticket",
+                        dst_object_type=None,
+                        state="Valid",
+                        link_type=None,
+                        direction=None):
+        """link_list - see *Client.link_list*
+
+        Returns:
+            **list** or **None**: List of found dict links if successful, if empty **None**.
+
+        """
+        payload = self.client._payload_link_list(src_object_id, src_object_type,
+                                                 dst_object_type, state, link_type, direction)
+        response = await self.execute("LinkList", payload)
+        return response.result if response.success else None
+
+    async def link_possible_link_list(self):
+        """link_possible_link_list - see *Client.link_possible_link_list*
+
+        Returns:
+            **List** or **False**: List if successful, otherwise **False**.
+
+        """
+        payload = self.client._session_payload()
+        response = await self.execute("PossibleLinkList", payload)
+        return response.result if response.success else False
+
+    async def link_possible_objects_list(self, object_type="Ticket"):
+        """link_possible_objects_list - see *Client.link_possible_objects_list*
+
+        Returns:
+            **List** or **False**: List if successful, otherwise **False**.
+
+        """
+        payload = self.client._session_payload()
+        payload.update({"Object": object_type})
+        response = await self.execute("PossibleObjectsList", payload)
+        return response.result if response.success else False
+
+    async def link_possible_types_list(self, src_object_type="Ticket", dst_object_type="Ticket"):
+        """link_possible_types_list - see *Client.link_possible_types_list*
+
+        Returns:
+            **List** or **False**: List if successful, otherwise **False**.
+
+        """
+        payload = self.client._payload_link_possible_types_list(src_object_type,
+                                                                dst_object_type)
+        response = await self.execute("PossibleTypesList", payload)
+        return response.result if response.success else False
+
 # EOF
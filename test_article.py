@@ -440,6 +440,37 @@ class ArticleTests(unittest.TestCase):
         art.validate(validation_map=custom_validation)
         self.assertDictEqual(art.to_dct(), expected_validated)
 
+    def test_lazy_attachments_and_dynamic_fields(self):
+        """Attachments and DynamicFields are only parsed on first access"""
+        art = Article({"ArticleID": "5",
+                       "Attachment": [{"Filename": "a.txt", "Content": "YmFyCg=="}],
+                       "DynamicField": [{"Name": "firstname", "Value": "Jane"}]})
+
+        self.assertIsNone(art._attachments)
+        self.assertEqual(art.__repr__(), "<ArticleID: 5 (1 Attachment)>")
+        self.assertIsNone(art._attachments)
+
+        self.assertIsInstance(art.attachment_get("a.txt"), Attachment)
+        self.assertIsInstance(art.dynamic_field_get("firstname"), DynamicField)
+        self.assertDictEqual(art.fields, {"ArticleID": "5"})
+
+    def test_attachment_get_index_follows_mutations(self):
+        art = Article({"ArticleID": "5",
+                       "Attachment": [{"Filename": "a.txt", "Content": "YmFyCg=="}]})
+
+        self.assertEqual(art.attachment_get("a.txt").Filename, "a.txt")
+        self.assertIsNone(art.attachment_get("b.txt"))
+
+        art.attachments += [Attachment.create_basic("YmFyCg==", "text/plain", "b.txt")]
+        self.assertEqual(art.attachment_get("b.txt").Filename, "b.txt")
+
+        art.attachments.pop(0)
+        self.assertIsNone(art.attachment_get("a.txt"))
+
+        art.attachment_get("b.txt").Filename = "c.txt"
+        self.assertIsNone(art.attachment_get("b.txt"))
+        self.assertEqual(art.attachment_get("c.txt").Filename, "c.txt")
+
 
 def main():
     unittest.main()
@@ -0,0 +1,242 @@
+""" test_async_client.py
+
+Test for PyOTRS AsyncClient class
+"""
+
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+import responses
+
+from pyotrs.lib import (
+    ArgumentMissingError,
+    AsyncClient,
+    Client,
+    SessionCreateError,
+    SessionNotCreated,
+    Ticket,
+    TicketCache,
+    TicketNumberCache,
+)
+
+URL_TICKET = "http://fqdn/otrs/nph-genericinterface.pl/Webservice/GenericTicketConnectorREST"
+URL_LINK = "http://fqdn/otrs/nph-genericinterface.pl/Webservice/GenericLinkConnectorREST"
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class AsyncClientTests(unittest.TestCase):
+    def setUp(self):
+        self.client = Client(baseurl="http://fqdn")
+        self.client.session_id_store.value = "some_session_id"
+        self.aclient = AsyncClient(self.client, max_concurrency=4)
+
+    def tearDown(self):
+        self.aclient.close()
+
+    def test_init(self):
+        self.assertIsInstance(self.aclient, AsyncClient)
+        self.assertIs(self.aclient.client, self.client)
+        self.assertEqual(self.aclient.max_concurrency, 4)
+        self.assertEqual(self.aclient.__repr__(), '<AsyncClient: http://fqdn>')
+
+    def test_init_from_kwargs(self):
+        aclient = AsyncClient(baseurl="http://fqdn/", max_concurrency=16)
+        self.assertIsInstance(aclient.client, Client)
+        self.assertEqual(aclient.client.baseurl, "http://fqdn")
+        self.assertEqual(aclient.client.pool_maxsize, 16)
+
+        with mock.patch.object(aclient.client, 'close') as mock_close:
+            aclient.close()
+        self.assertEqual(mock_close.call_count, 1)
+
+    def test_close_does_not_close_foreign_client(self):
+        aclient = AsyncClient(self.client)
+        with mock.patch.object(self.client, 'close') as mock_close:
+            aclient.close()
+        self.assertEqual(mock_close.call_count, 0)
+
+    def test_async_context_manager(self):
+        async def use():
+            async with AsyncClient(self.client) as aclient:
+                return aclient
+
+        aclient = run(use())
+        self.assertTrue(aclient._executor._shutdown)
+
+    def test_async_context_manager_closes_off_event_loop(self):
+        threads = []
+
+        async def use():
+            async with AsyncClient(self.client):
+                return threading.current_thread()
+
+        with mock.patch('pyotrs.AsyncClient.close', autospec=True,
+                        side_effect=lambda obj: threads.append(threading.current_thread())):
+            loop_thread = run(use())
+
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], loop_thread)
+
+    def test_ticket_get_by_id_no_session_created(self):
+        self.client.session_id_store.value = None
+        self.assertRaisesRegex(SessionNotCreated,
+                               'Call session_create.*',
+                               run,
+                               self.aclient.ticket_get_by_id(1))
+
+    def test_session_get_no_session_id(self):
+        self.assertRaisesRegex(ArgumentMissingError,
+                               'session_id',
+                               run,
+                               self.aclient.session_get())
+
+    @responses.activate
+    def test_ticket_get_by_id(self):
+        responses.add(responses.GET, f"{URL_TICKET}/Ticket/1",
+                      json={"Ticket": [{"TicketID": "1", "Title": "foo"}]}, status=200)
+
+        result = run(self.aclient.ticket_get_by_id(1))
+
+        self.assertIsInstance(result, Ticket)
+        self.assertEqual(result.tid, 1)
+        self.assertIsNone(self.client.operation)
+        self.assertEqual(self.client.result, [])
+        self.assertIsNone(self.client.result_json)
+
+    @responses.activate
+    def test_ticket_get_by_id_gather(self):
+        for tid in range(1, 21):
+            responses.add(responses.GET, f"{URL_TICKET}/Ticket/{tid}",
+                          json={"Ticket": [{"TicketID": str(tid)}]}, status=200)
+
+        async def fetch_all():
+            return await asyncio.gather(*[self.aclient.ticket_get_by_id(tid)
+                                          for tid in range(1, 21)])
+
+        result = run(fetch_all())
+
+        self.assertEqual([ticket.tid for ticket in result], list(range(1, 21)))
+
+    def test_ticket_get_by_list_empty(self):
+        self.assertEqual(run(self.aclient.ticket_get_by_list([])), [])
+
+    @responses.activate
+    def test_ticket_search(self):
+        responses.add(responses.GET, f"{URL_TICKET}/Ticket",
+                      json={"TicketID": ["3", "4"]}, status=200)
+
+        self.assertEqual(run(self.aclient.ticket_search(Title="foo")), ["3", "4"])
+
+    @responses.activate
+    def test_ticket_search_empty(self):
+        responses.add(responses.GET, f"{URL_TICKET}/Ticket", json={}, status=200)
+
+        self.assertEqual(run(self.aclient.ticket_search(Title="foo")), [])
+
+    @responses.activate
+    def test_ticket_get_by_number(self):
+        responses.add(responses.GET, f"{URL_TICKET}/Ticket",
+                      json={"TicketID": ["7"]}, status=200)
+        responses.add(responses.GET, f"{URL_TICKET}/Ticket/7",
+                      json={"Ticket": [{"TicketID": "7", "TicketNumber": "000007"}]},
+                      status=200)
+
+        result = run(self.aclient.ticket_get_by_number("000007"))
+
+        self.assertIsInstance(result, Ticket)
+        self.assertEqual(result.field_get("TicketNumber"), "000007")
+
+    @responses.activate
+    def test_ticket_get_by_number_cached(self):
+        self.client.ticket_number_cache = TicketNumberCache()
+        self.client.ticket_number_cache.set("000007", "7")
+        responses.add(responses.GET, f"{URL_TICKET}/Ticket/7",
+                      json={"Ticket": [{"TicketID": "7", "TicketNumber": "000007"}]},
+                      status=200)
+
+        result = run(self.aclient.ticket_get_by_number("000007"))
+
+        self.assertEqual(result.tid, 7)
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_ticket_update(self):
+        responses.add(responses.PATCH, f"{URL_TICKET}/Ticket/9",
+                      json={"TicketID": "9", "TicketNumber": "000008"}, status=200)
+
+        result = run(self.aclient.ticket_update(9, State="closed"))
+
+        self.assertDictEqual(result, {"TicketID": "9", "TicketNumber": "000008"})
+
+    @responses.activate
+    def test_ticket_update_invalidates_ticket_cache_filled_meanwhile(self):
+        self.client.ticket_cache = TicketCache()
+
+        def update(request):
+            # e.g. a ticket_get_by_id of another task while the update is sent
+            self.client.ticket_cache.set(TicketCache.key(9), {"TicketID": "9"})
+            return 200, {}, '{"TicketID": "9", "TicketNumber": "000008"}'
+
+        responses.add_callback(responses.PATCH, f"{URL_TICKET}/Ticket/9", callback=update)
+
+        self.assertTrue(run(self.aclient.ticket_update(9, State="closed")))
+        self.assertEqual(len(self.client.ticket_cache), 0)
+
+    @responses.activate
+    def test_link_list_empty(self):
+        responses.add(responses.GET, f"{URL_LINK}/LinkList", json={"LinkList": ""}, status=200)
+
+        self.assertIsNone(run(self.aclient.link_list(1)))
+
+    @responses.activate
+    def test_link_add(self):
+        responses.add(responses.POST, f"{URL_LINK}/LinkAdd", json={"Success": 1}, status=200)
+
+        self.assertTrue(run(self.aclient.link_add(1, 2)))
+
+    @responses.activate
+    def test_session_create(self):
+        responses.add(responses.POST, f"{URL_TICKET}/Session",
+                      json={"AccessToken": "tMtTFDg1PxCX51dWnjue4W5oQtNsFd0k"}, status=200)
+
+        self.assertTrue(run(self.aclient.session_create()))
+        self.assertEqual(self.client.session_id_store.value, "tMtTFDg1PxCX51dWnjue4W5oQtNsFd0k")
+
+    @mock.patch('pyotrs.SessionStore.write', autospec=True)
+    @mock.patch('pyotrs.SessionStore.read', autospec=True)
+    @mock.patch('pyotrs.AsyncClient.session_create', autospec=True)
+    def test_session_restore_or_create_nok(self, mock_s_create, mock_read, mock_write):
+        mock_read.return_value = None
+        mock_s_create.return_value = False
+
+        self.assertRaisesRegex(SessionCreateError,
+                               'Failed to create a Session ID!',
+                               run,
+                               self.aclient.session_restore_or_create())
+        self.assertEqual(mock_write.call_count, 1)
+
+    @mock.patch('pyotrs.SessionStore.write', autospec=True)
+    @mock.patch('pyotrs.SessionStore.read', autospec=True)
+    @mock.patch('pyotrs.AsyncClient.session_get', autospec=True)
+    def test_session_restore_or_create_restored(self, mock_s_get, mock_read, mock_write):
+        mock_read.return_value = "restored_session_id"
+        mock_s_get.return_value = True
+
+        self.assertTrue(run(self.aclient.session_restore_or_create()))
+        self.assertEqual(self.client.session_id_store.value, "restored_session_id")
+        self.assertEqual(mock_write.call_count, 0)
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
+
+# EOF
@@ -3,13 +3,15 @@
 Test for PyOTRS Attachment class
 """
 
+import base64
 import json
 import os.path
 import sys
+import tempfile
 import unittest
 from unittest import mock
 
-from pyotrs.lib import Attachment
+from pyotrs.lib import Attachment, Base64File, _json_body, _StreamingBody, get_json_codec
 
 # make sure (early) that parent dir (main app) is in path
 current_path = os.path.dirname(os.path.realpath(__file__))
@@ -123,6 +125,109 @@ class AttachmentTests(unittest.TestCase):
         self.assertEqual(m.call_count, 1)
         self.assertEqual(m.call_args_list, [mock.call("/tmp/dümmy5.txt", 'wb')])
 
+    def test_to_dct_does_not_modify_attachment(self):
+        att = Attachment.create_basic("YmFyCg==", "text/plain", "foo.txt")
+
+        dct = att.to_dct(content=False)
+        self.assertDictEqual(dct, {'ContentType': 'text/plain', 'Filename': 'foo.txt'})
+        self.assertEqual(att.Content, "YmFyCg==")
+
+        dct = att.to_dct()
+        dct["Filename"] = "bar.txt"
+        self.assertEqual(att.Filename, "foo.txt")
+        self.assertIs(att.to_dct()["Content"], att.Content)
+
+    def test_slots(self):
+        att = Attachment({"Content": "YmFyCg==", "ContentType": "text/plain",
+                          "Filename": "foo.txt", "FilesizeRaw": "4"})
+        self.assertFalse(hasattr(att, "__dict__"))
+        self.assertEqual(att.FilesizeRaw, "4")
+
+        att.Disposition = "attachment"
+        self.assertDictEqual(att.to_dct(content=False),
+                             {"ContentType": "text/plain", "Filename": "foo.txt",
+                              "FilesizeRaw": "4", "Disposition": "attachment"})
+        self.assertIsNone(Attachment.create_basic()._extra)
+
+        self.assertFalse(hasattr(Attachment({}), "Filename"))
+        self.assertRaises(AttributeError, getattr, att, "Missing")
+
+        del att.FilesizeRaw
+        self.assertFalse(hasattr(att, "FilesizeRaw"))
+        self.assertRaises(AttributeError, delattr, att, "FilesizeRaw")
+
+
+class StreamingAttachmentTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.data = os.urandom(100003)
+        self.file_path = os.path.join(self.tmp_dir.name, "dump.bin")
+        with open(self.file_path, "wb") as f:
+            f.write(self.data)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_create_from_file_stream(self):
+        att = Attachment.create_from_file(self.file_path, stream=True)
+
+        self.assertIsInstance(att.Content, Base64File)
+        self.assertEqual(att.Filename, "dump.bin")
+        self.assertEqual(att.ContentType, "application/octet-stream")
+        self.assertEqual(att.Content.__repr__(), f"<Base64File: {self.file_path}>")
+
+    def test_base64_file_chunks(self):
+        content = Base64File(self.file_path, chunk_size=1000)
+
+        self.assertEqual(content.chunk_size, 999)
+        self.assertEqual(len(content), len(base64.b64encode(self.data)))
+        self.assertEqual(b"".join(content.chunks()), base64.b64encode(self.data))
+
+    def test_json_body_without_stream(self):
+        self.assertEqual(_json_body({"foo": "bär"}), json.dumps({"foo": "bär"}))
+        self.assertRaises(TypeError, _json_body, {"foo": object()})
+
+    def test_json_body_stream(self):
+        att = Attachment.create_from_file(self.file_path, stream=True)
+        payload = {"Ticket": {"Title": "foo"}, "Attachment": [att.to_dct(), att.to_dct()]}
+
+        body = _json_body(payload)
+
+        self.assertIsInstance(body, _StreamingBody)
+        expected = json.dumps({"Ticket": {"Title": "foo"},
+                               "Attachment": [{"Content": base64.b64encode(self.data).decode(),
+                                               "ContentType": "application/octet-stream",
+                                               "Filename": "dump.bin"}] * 2}).encode()
+        self.assertEqual(len(body), len(expected))
+        self.assertEqual(b"".join(iter(body)), expected)
+
+        codec_body = _json_body(payload, get_json_codec("auto"))
+        self.assertEqual(json.loads(b"".join(iter(codec_body))), json.loads(expected))
+
+        body.seek(0)
+        self.assertEqual(body.read(10), expected[:10])
+        self.assertEqual(body.tell(), 10)
+        self.assertEqual(body.read(), expected[10:])
+        self.assertRaises(OSError, body.seek, 5)
+
+    def test_save_to_dir_chunked(self):
+        encoded = base64.encodebytes(self.data).decode()  # with line breaks
+        att = Attachment.create_basic(encoded, "application/octet-stream", "out.bin")
+
+        att.save_to_dir(self.tmp_dir.name, chunk_size=1001)
+
+        with open(os.path.join(self.tmp_dir.name, "out.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.data)
+
+    def test_save_to_dir_stream(self):
+        att = Attachment.create_from_file(self.file_path, stream=True)
+        att.Filename = "copy.bin"
+
+        att.save_to_dir(self.tmp_dir.name)
+
+        with open(os.path.join(self.tmp_dir.name, "copy.bin"), "rb") as f:
+            self.assertEqual(f.read(), self.data)
+
 
 def main():
     unittest.main()
@@ -0,0 +1,112 @@
+""" test_benchmark.py
+
+Test for PyOTRS benchmarks
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+import requests
+
+from pyotrs import benchmark
+from pyotrs.lib import Article, Client, CompactTicket, Ticket
+
+
+class BenchmarkTests(unittest.TestCase):
+    def test_sample_ticket(self):
+        dct = benchmark.sample_ticket(7, articles=1, dynamic_fields=2)
+        self.assertEqual(dct["TicketID"], "7")
+        self.assertEqual(len(dct["Article"]), 1)
+        self.assertEqual(len(dct["DynamicField"]), 2)
+        self.assertDictEqual(CompactTicket(benchmark.sample_ticket(7)).to_dct(),
+                             Ticket(benchmark.sample_ticket(7)).to_dct())
+
+    def test_memory(self):
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(benchmark.main(["memory", "--tickets", "200"]), 0)
+
+        self.assertIn("CompactTicket", out.getvalue())
+        self.assertIn("reduction", out.getvalue())
+
+    def test_codec(self):
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(benchmark.main(["codec", "--tickets", "5", "--attachment-kb", "1",
+                                             "--repeat", "1"]), 0)
+
+        self.assertIn("json", out.getvalue())
+        response = benchmark.sample_ticket_get_response(2, attachment_kb=1)
+        self.assertEqual(len(response["Ticket"]), 2)
+        self.assertIn("Attachment", response["Ticket"][0]["Article"][0])
+
+    def test_overhead(self):
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(benchmark.main(["overhead", "--calls", "10", "--repeat", "1"]), 0)
+
+        self.assertIn("TicketGet", out.getvalue())
+        self.assertIn("us/call", out.getvalue())
+
+
+class FakeGenericInterfaceTests(unittest.TestCase):
+    def test_load_routes(self):
+        name, routes = benchmark.load_routes(benchmark.CONNECTOR_FILES[0])
+
+        self.assertEqual(name, "GenericTicketConnectorREST")
+        self.assertIn(("TicketGet", "GET", "/Ticket/:TicketID"), routes)
+        self.assertIn(("TicketUpdate", "PATCH", "/Ticket/:TicketID"), routes)
+
+    def test_client_against_stand_in(self):
+        with benchmark.FakeGenericInterface(attachment_kb=1, process=False) as server:
+            client = Client(baseurl=server.baseurl, compression="gzip",
+                            compression_threshold=0)
+            client.session_id_store.value = "stand-in"
+
+            ticket = client.ticket_get_by_id(3, articles=True, attachments=True)
+            self.assertEqual(ticket.tid, 3)
+            self.assertEqual(len(ticket.articles), 2)
+            self.assertEqual(len(ticket.articles[0].attachments), 1)
+
+            tickets = client.ticket_get_by_list([4, 5], articles=False)
+            self.assertEqual([item.tid for item in tickets], [4, 5])
+            self.assertEqual(tickets[0].articles, [])
+
+            self.assertEqual(len(client.ticket_search(Title="Alert*")), 100)
+            article = Article({"Subject": "s", "Body": "b"})
+            self.assertEqual(client.ticket_update(7, article=article, State="open")["ArticleID"],
+                             "70")
+            self.assertTrue(client.link_add(1, 2))
+            self.assertIsNone(client.link_list(1))
+            self.assertTrue(client.session_create())
+
+            response = requests.get(f"{server.baseurl}/otrs/unknown")
+            self.assertEqual(response.status_code, 404)
+            client.close()
+
+    def test_server(self):
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(benchmark.main(["server", "--calls", "4", "--threads", "2",
+                                             "--latency", "0", "--attachment-kb", "1"]), 0)
+
+        lines = out.getvalue().splitlines()
+        self.assertIn("ops/s", lines[1])
+        self.assertEqual(len(lines), 2 + 4 * 3)
+        self.assertTrue(lines[-1].startswith("TicketUpdate   concurrent"))
+
+    def test_links(self):
+        with redirect_stdout(io.StringIO()) as out:
+            self.assertEqual(benchmark.main(["links", "--tickets", "30", "--threads", "4",
+                                             "--latency", "0", "--in-process"]), 0)
+
+        lines = out.getvalue().splitlines()
+        self.assertEqual(len(lines), 2 + 3)
+        self.assertTrue(all(line.split()[1] == "30" for line in lines[2:]))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
+
+# EOF
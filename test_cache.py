@@ -0,0 +1,236 @@
+""" test_cache.py
+
+Test for PyOTRS LRUCache, TicketNumberCache and TicketCache classes
+"""
+
+import json
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pyotrs.lib import (
+    ArgumentInvalidError,
+    LRUCache,
+    TicketCache,
+    TicketNumberCache,
+    _acquire_file_lock,
+    _release_file_lock,
+    fcntl,
+)
+
+
+def _write_ticket_numbers(file_path, start):
+    cache = TicketNumberCache(file_path=file_path)
+    for num in range(start, 200, 4):
+        cache.set(f"{num:06d}", str(num))
+
+
+class LRUCacheTests(unittest.TestCase):
+    def test_init(self):
+        cache = LRUCache(maxsize=2, ttl=5)
+        self.assertEqual(cache.maxsize, 2)
+        self.assertEqual(cache.ttl, 5)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.__repr__(), '<LRUCache: 0/2>')
+
+    def test_init_invalid_maxsize(self):
+        self.assertRaisesRegex(ArgumentInvalidError, 'maxsize', LRUCache, maxsize=0)
+
+    def test_get_set(self):
+        cache = LRUCache()
+        self.assertIsNone(cache.get("foo"))
+        self.assertEqual(cache.get("foo", "bar"), "bar")
+        cache.set("foo", 1)
+        self.assertEqual(cache.get("foo"), 1)
+        self.assertIn("foo", cache)
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    @mock.patch('pyotrs.lib.time.time')
+    def test_ttl_expiry(self, mock_time):
+        mock_time.return_value = 1000.0
+        cache = LRUCache(ttl=10)
+        cache.set("foo", 1)
+
+        mock_time.return_value = 1009.0
+        self.assertEqual(cache.get("foo"), 1)
+
+        mock_time.return_value = 1010.0
+        self.assertIsNone(cache.get("foo"))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_and_clear(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        cache.invalidate("not_there")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TicketNumberCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmp_dir.name, ".pyotrs_tn_cache")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_init(self):
+        cache = TicketNumberCache()
+        self.assertEqual(cache.ttl, 3600)
+        self.assertIsNone(cache.file_path)
+
+    def test_memory_only(self):
+        cache = TicketNumberCache()
+        cache.set("000001", "1")
+        self.assertEqual(cache.get("000001"), "1")
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_file_shared_between_instances(self):
+        writer = TicketNumberCache(file_path=self.file_path)
+        writer.set("000001", "1")
+
+        self.assertEqual(oct(os.stat(self.file_path).st_mode & 0o777), '0o600')
+
+        reader = TicketNumberCache(file_path=self.file_path)
+        self.assertEqual(reader.get("000001"), "1")
+        self.assertEqual(len(reader), 1)
+
+    def test_file_concurrent_writers(self):
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            pool.starmap(_write_ticket_numbers, [(self.file_path, start) for start in range(4)])
+
+        reader = TicketNumberCache(file_path=self.file_path)
+        self.assertEqual([reader.get(f"{num:06d}") for num in range(200)],
+                         [str(num) for num in range(200)])
+
+    @unittest.skipIf(fcntl is None, "no advisory file locks")
+    def test_file_lock_timeout(self):
+        cache = TicketNumberCache(file_path=self.file_path, lock_timeout=0.1)
+        fd = _acquire_file_lock(f"{self.file_path}.lock", 1)
+        try:
+            with self.assertLogs("pyotrs.lib", level="WARNING"):
+                cache.set("000001", "1")
+        finally:
+            _release_file_lock(fd)
+
+        self.assertEqual(cache.get("000001"), "1")
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_file_invalidate(self):
+        writer = TicketNumberCache(file_path=self.file_path)
+        writer.set("000001", "1")
+        writer.set("000002", "2")
+        writer.invalidate("000001")
+
+        with open(self.file_path) as f:
+            self.assertEqual(list(json.load(f)), ["000002"])
+
+        writer.clear()
+        with open(self.file_path) as f:
+            self.assertEqual(json.load(f), {})
+
+    @mock.patch('pyotrs.lib.time.time')
+    def test_file_expired_entries_ignored(self, mock_time):
+        mock_time.return_value = 1000.0
+        TicketNumberCache(ttl=10, file_path=self.file_path).set("000001", "1")
+
+        mock_time.return_value = 1011.0
+        self.assertIsNone(TicketNumberCache(file_path=self.file_path).get("000001"))
+
+    def test_file_invalid_content_ignored(self):
+        with open(self.file_path, "w") as f:
+            f.write("no json")
+        os.chmod(self.file_path, 0o600)
+
+        cache = TicketNumberCache(file_path=self.file_path)
+        self.assertIsNone(cache.get("000001"))
+        cache.set("000001", "1")
+        self.assertEqual(TicketNumberCache(file_path=self.file_path).get("000001"), "1")
+
+    def test_file_insecure_permissions_ignored(self):
+        TicketNumberCache(file_path=self.file_path).set("000001", "1")
+        os.chmod(self.file_path, 0o644)
+
+        self.assertIsNone(TicketNumberCache(file_path=self.file_path).get("000001"))
+
+
+class TicketCacheTests(unittest.TestCase):
+    def test_key(self):
+        self.assertEqual(TicketCache.key(1), ("1", False, False, True, False))
+        self.assertEqual(TicketCache.key("1", articles=1), ("1", True, False, True, False))
+
+    @mock.patch('pyotrs.lib.time.time')
+    def test_lookup_stale_kept_with_revalidate(self, mock_time):
+        mock_time.return_value = 1000.0
+        cache = TicketCache(ttl=10)
+        cache.set(TicketCache.key(1), {"TicketID": "1"})
+
+        self.assertEqual(cache.lookup(TicketCache.key(1)), ({"TicketID": "1"}, True))
+
+        mock_time.return_value = 1020.0
+        self.assertEqual(cache.lookup(TicketCache.key(1)), ({"TicketID": "1"}, False))
+        self.assertIsNone(cache.lookup(TicketCache.key(2)))
+
+    @mock.patch('pyotrs.lib.time.time')
+    def test_lookup_stale_dropped_without_revalidate(self, mock_time):
+        mock_time.return_value = 1000.0
+        cache = TicketCache(ttl=10, revalidate=False)
+        cache.set(TicketCache.key(1), {"TicketID": "1"})
+
+        mock_time.return_value = 1020.0
+        self.assertIsNone(cache.lookup(TicketCache.key(1)))
+        self.assertEqual(len(cache), 0)
+
+    def test_invalidate_ticket(self):
+        cache = TicketCache()
+        cache.set(TicketCache.key(1), {"TicketID": "1"})
+        cache.set(TicketCache.key(1, articles=True), {"TicketID": "1"})
+        cache.set(TicketCache.key(2), {"TicketID": "2"})
+
+        cache.invalidate_ticket(1)
+
+        self.assertEqual(len(cache), 1)
+        self.assertIsNotNone(cache.lookup(TicketCache.key(2)))
+
+    def test_entries_are_copied(self):
+        cache = TicketCache()
+        raw = {"TicketID": "1", "Article": [{"Attachment": [{"Filename": "a.txt"}]}]}
+        cache.set(TicketCache.key(1), raw)
+        raw["Article"][0]["Attachment"][0]["Filename"] = "b.txt"
+
+        hit, _fresh = cache.lookup(TicketCache.key(1))
+        hit["Article"][0]["Attachment"][0]["Filename"] = "c.txt"
+        cache.get(TicketCache.key(1))["TicketID"] = "2"
+
+        self.assertEqual(cache.lookup(TicketCache.key(1)),
+                         ({"TicketID": "1", "Article": [{"Attachment": [{"Filename": "a.txt"}]}]},
+                          True))
+
+
+def main():
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
+
+# EOF
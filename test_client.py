@@ -3,11 +3,27 @@
 Test for PyOTRS Client class
 """
 
+import base64
 import datetime
+import gzip
+import json
+import re
+import tempfile
+import threading
+import time
 import unittest
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
+from urllib.parse import parse_qs, urlparse
 
 import requests
+import responses
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from pyotrs.lib import (
     APIError,
@@ -16,12 +32,30 @@ from pyotrs.lib import (
     Article,
     Attachment,
     Client,
+    ClientResponse,
+    CompactTicket,
     DynamicField,
+    HistogramRecorder,
     HTTPError,
+    JSONCodec,
+    LRUCache,
+    MetricsRecorder,
+    OperationRoute,
+    OrjsonCodec,
+    RateLimiter,
+    RequestContext,
+    RequestGovernor,
     ResponseParseError,
+    SearchQuery,
     SessionCreateError,
     SessionNotCreated,
+    SessionProvider,
+    SessionStore,
     Ticket,
+    TicketCache,
+    TicketNumberCache,
+    _TicketListParser,
+    get_json_codec,
 )
 
 
@@ -190,6 +224,38 @@ class ClientTests(unittest.TestCase):
         obj = Client(baseurl="http://fqdn/", request_timeout=(3, 5.5))
         self.assertEqual(obj.request_timeout, (3, 5.5))
 
+    def test_init_http_session_pool_defaults(self):
+        obj = Client(baseurl="http://fqdn/")
+        self.assertIsInstance(obj.http_session, requests.Session)
+        adapter = obj.http_session.get_adapter("https://fqdn/")
+        self.assertEqual(adapter._pool_maxsize, 10)
+        self.assertEqual(adapter.max_retries.total, 0)
+
+    def test_init_http_session_pool_manual(self):
+        obj = Client(baseurl="http://fqdn/",
+                     pool_connections=2,
+                     pool_maxsize=32,
+                     max_retries=3,
+                     retry_backoff_factor=0.1)
+        adapter = obj.http_session.get_adapter("http://fqdn/")
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertEqual(adapter.max_retries.backoff_factor, 0.1)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+
+    @mock.patch('pyotrs.lib.requests.Session.close', autospec=True)
+    def test_close(self, mock_close):
+        obj = Client(baseurl="http://fqdn/")
+        obj.close()
+        mock_close.assert_called_once_with(obj.http_session)
+
+    @mock.patch('pyotrs.lib.requests.Session.close', autospec=True)
+    def test_context_manager(self, mock_close):
+        with Client(baseurl="http://fqdn/") as obj:
+            self.assertIsInstance(obj, Client)
+        mock_close.assert_called_once_with(obj.http_session)
+
     @mock.patch('pyotrs.Client._send_request')
     @mock.patch('pyotrs.Client._parse_and_validate_response', autospec=True)
     def test_session_create_ok(self, mock_parse_validate, mock_send_req):
@@ -818,6 +884,174 @@ class ClientTests(unittest.TestCase):
         self.assertEqual(mock_parse_validate.call_count, 1)
         self.assertEqual(mock_send_req.call_count, 1)
 
+    def test_ticket_get_bulk_no_session_created(self):
+        """Tests ticket_get_bulk session check"""
+        obj = Client(baseurl="http://fqdn")
+
+        self.assertRaisesRegex(SessionNotCreated,
+                               'Call session_create.*',
+                               list,
+                               obj.ticket_get_bulk([1, 2]))
+
+    def test_ticket_id_chunks_chunk_size(self):
+        """Tests _ticket_id_chunks splits by number of IDs"""
+        chunks = list(Client._ticket_id_chunks(range(1, 8), 3, 1000))
+        self.assertEqual(chunks, [["1", "2", "3"], ["4", "5", "6"], ["7"]])
+
+    def test_ticket_id_chunks_budget(self):
+        """Tests _ticket_id_chunks splits by URL length (comma encoded as %2C)"""
+        chunks = list(Client._ticket_id_chunks([10, 11, 12, 13], 100, 7))
+        self.assertEqual(chunks, [["10", "11"], ["12", "13"]])
+
+    def test_ticket_id_chunks_budget_too_small(self):
+        """Tests _ticket_id_chunks with a TicketID longer than the budget"""
+        self.assertRaisesRegex(ArgumentInvalidError,
+                               'max_url_length is too small.*',
+                               list,
+                               Client._ticket_id_chunks([123456], 100, 5))
+
+    @responses.activate
+    def test_ticket_get_bulk(self):
+        """Tests ticket_get_bulk fetches all tickets in chunks within max_url_length"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+
+        def callback(request):
+            self.assertLessEqual(len(request.url), 300)
+            ticket_ids = request.params["TicketID"].split(",")
+            return 200, {}, json.dumps({"Ticket": [{"TicketID": x} for x in ticket_ids]})
+
+        responses.add_callback(responses.GET,
+                               'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                               'GenericTicketConnectorREST/TicketList',
+                               callback=callback,
+                               content_type='application/json')
+
+        result = list(obj.ticket_get_bulk(range(1, 251),
+                                          chunk_size=50,
+                                          max_url_length=300,
+                                          max_in_flight=3))
+
+        self.assertTrue(all(isinstance(ticket, Ticket) for ticket in result))
+        self.assertEqual(sorted(ticket.tid for ticket in result), list(range(1, 251)))
+        self.assertGreater(len(responses.calls), 5)
+
+    @responses.activate
+    def test_iter_tickets(self):
+        """Tests iter_tickets yields all found tickets in search order using batches"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+
+        found = [str(x) for x in range(250, 0, -1)]
+        batches = []
+
+        def callback(request):
+            ticket_ids = request.params["TicketID"].split(",")
+            batches.append(ticket_ids)
+            return 200, {}, json.dumps({"Ticket": [{"TicketID": x} for x in ticket_ids]})
+
+        url = 'http://fqdn/otrs/nph-genericinterface.pl/Webservice/GenericTicketConnectorREST'
+        responses.add(responses.GET, f"{url}/Ticket", json={"TicketID": found}, status=200)
+        responses.add_callback(responses.GET, f"{url}/TicketList", callback=callback,
+                               content_type='application/json')
+
+        result = obj.iter_tickets({"StateType": "closed"}, batch_size=100, prefetch=2)
+
+        self.assertEqual([ticket.tid for ticket in result], list(range(250, 0, -1)))
+        self.assertEqual(sorted(len(batch) for batch in batches), [50, 100, 100])
+        self.assertEqual(responses.calls[0].request.params["StateType"], "closed")
+
+    @responses.activate
+    def test_iter_tickets_empty_search(self):
+        """Tests iter_tickets with an empty search result"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket',
+                      json={}, status=200)
+
+        self.assertEqual(list(obj.iter_tickets()), [])
+        self.assertEqual(len(responses.calls), 1)
+
+    def test_iter_tickets_invalid_batch_size(self):
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+
+        self.assertRaisesRegex(ArgumentInvalidError,
+                               'batch_size must be at least 1',
+                               list,
+                               obj.iter_tickets(batch_size=0))
+
+    def _add_windowed_search(self, created):
+        """TicketSearch callback filtering tickets by created time (inclusive) and Limit"""
+        requests_seen = []
+
+        def callback(request):
+            params = request.params
+            newer = datetime.datetime.strptime(params["TicketCreateTimeNewerDate"],
+                                               "%Y-%m-%d %H:%M:%S")
+            older = datetime.datetime.strptime(params["TicketCreateTimeOlderDate"],
+                                               "%Y-%m-%d %H:%M:%S")
+            requests_seen.append((newer, older))
+            found = [str(tid) for tid, time_created in created.items()
+                     if newer <= time_created <= older][:int(params["Limit"])]
+            return 200, {}, json.dumps({"TicketID": found} if found else {})
+
+        responses.add_callback(responses.GET,
+                               'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                               'GenericTicketConnectorREST/Ticket',
+                               callback=callback,
+                               content_type='application/json')
+        return requests_seen
+
+    @responses.activate
+    def test_ticket_search_windowed(self):
+        """Tests ticket_search_windowed splits full windows and yields every ID once"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        start = datetime.datetime(2024, 1, 1)
+        # 200 tickets on the first day (one per minute), 10 on the second and third day
+        created = {tid: start + datetime.timedelta(minutes=tid) for tid in range(200)}
+        created.update({tid: start + datetime.timedelta(days=1, hours=tid - 200)
+                        for tid in range(200, 220)})
+        seen = self._add_windowed_search(created)
+
+        result = list(obj.ticket_search_windowed(start, start + datetime.timedelta(days=3),
+                                                 limit=50, max_in_flight=3,
+                                                 StateType="closed"))
+
+        self.assertEqual(sorted(int(tid) for tid in result), list(range(220)))
+        self.assertEqual(len(result), 220)
+        self.assertGreater(len(seen), 3)
+        self.assertTrue(all(older - newer < datetime.timedelta(days=1) for newer, older in seen))
+        self.assertEqual(responses.calls[0].request.params["StateType"], "closed")
+
+    @responses.activate
+    def test_ticket_search_windowed_full_second(self):
+        """Tests ticket_search_windowed with more than limit tickets in one second"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        start = datetime.datetime(2024, 1, 1)
+        self._add_windowed_search({tid: start for tid in range(10)})
+
+        with self.assertLogs("pyotrs.lib", level="WARNING"):
+            result = list(obj.ticket_search_windowed(start, start + datetime.timedelta(hours=1),
+                                                     limit=5))
+
+        self.assertEqual(len(result), 5)
+
+    def test_ticket_search_windowed_invalid(self):
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        now = datetime.datetime(2024, 1, 1)
+
+        self.assertRaisesRegex(ArgumentInvalidError, 'limit', list,
+                               obj.ticket_search_windowed(now, now, limit=0))
+        self.assertRaisesRegex(ArgumentInvalidError, 'window', list,
+                               obj.ticket_search_windowed(now, now, window=datetime.timedelta()))
+        self.assertEqual(list(obj.ticket_search_windowed(now, now)), [])
+
     def test_ticket_get_by_number_with_int(self):
         """Tests ticket_get_by_number provided int not str -> fail"""
         obj = Client(baseurl="http://fqdn")
@@ -871,6 +1105,43 @@ class ClientTests(unittest.TestCase):
         self.assertEqual(mock_ticket_search.call_count, 1)
         self.assertEqual(mock_t_get_id.call_count, 1)
 
+    @mock.patch('pyotrs.Client.ticket_get_by_id', autospec=True)
+    @mock.patch('pyotrs.Client.ticket_search', autospec=True)
+    def test_ticket_get_by_number_cache_miss_then_hit(self, mock_ticket_search, mock_t_get_id):
+        """Tests ticket_get_by_number - second call is resolved from cache"""
+        obj = Client(baseurl="http://fqdn", ticket_number_cache=TicketNumberCache())
+        obj.session_id_store.value = "some_session_id"
+
+        mock_ticket_search.return_value = ['12']
+        mock_t_get_id.return_value = Ticket._dummy()
+
+        obj.ticket_get_by_number("4712")
+        result = obj.ticket_get_by_number("4712")
+
+        self.assertIsInstance(result, Ticket)
+        self.assertEqual(mock_ticket_search.call_count, 1)
+        self.assertEqual(mock_t_get_id.call_count, 2)
+        self.assertEqual(mock_t_get_id.call_args[0][1], '12')
+
+    @mock.patch('pyotrs.Client.ticket_get_by_id', autospec=True)
+    @mock.patch('pyotrs.Client.ticket_search', autospec=True)
+    def test_ticket_get_by_number_cache_stale(self, mock_ticket_search, mock_t_get_id):
+        """Tests ticket_get_by_number - stale cache entry is invalidated and searched again"""
+        cache = TicketNumberCache()
+        cache.set("4712", "11")
+        obj = Client(baseurl="http://fqdn", ticket_number_cache=cache)
+        obj.session_id_store.value = "some_session_id"
+
+        mock_ticket_search.return_value = ['12']
+        mock_t_get_id.side_effect = [APIError("gone"), Ticket._dummy()]
+
+        result = obj.ticket_get_by_number("4712")
+
+        self.assertIsInstance(result, Ticket)
+        self.assertEqual(mock_ticket_search.call_count, 1)
+        self.assertEqual(mock_t_get_id.call_count, 2)
+        self.assertEqual(cache.get("4712"), '12')
+
     @mock.patch('pyotrs.Client.ticket_search', autospec=True)
     def test_ticket_get_by_number_with_string_three_results(self, mock_ticket_search):
         """Tests ticket_get_by_number provided as int; 3 results -> nok"""
@@ -992,6 +1263,32 @@ class ClientTests(unittest.TestCase):
         self.assertEqual(mock_parse_validate.call_count, 1)
         self.assertEqual(mock_send_req.call_count, 1)
 
+    @mock.patch('pyotrs.Client._send_request')
+    @mock.patch('pyotrs.Client._parse_and_validate_response', autospec=True)
+    def test_ticket_search_query(self, mock_parse_validate, mock_send_req):
+        """Tests ticket_search with a precompiled SearchQuery"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        obj.result = [1]
+
+        mock_parse_validate.return_value = True
+        mock_send_req.return_value = "mock"
+
+        query = SearchQuery(DynamicField("SomeFieldName", search_patterns="foo"),
+                            Title="FooBar", StateType="open")
+
+        obj.ticket_search(query=query, StateType="closed",
+                          TicketCreateTimeNewerDate=datetime.datetime(2011, 1, 1, 12))
+
+        self.assertEqual(mock_send_req.call_count, 1)
+        self.assertDictEqual(mock_send_req.call_args[0][0],
+                             {obj._session_key: "some_session_id",
+                              "DynamicField_SomeFieldName": {"Equals": ["foo"]},
+                              "Title": "FooBar",
+                              "StateType": "closed",
+                              "TicketCreateTimeNewerDate": "2011-01-01 12:00:00"})
+        self.assertEqual(query.fields["StateType"], "open")
+
     @mock.patch('pyotrs.Client.ticket_search')
     def test_ticket_search_full_text(self, mock_ticket_search):
         """Tests ticket_search full text"""
@@ -1203,6 +1500,88 @@ class ClientTests(unittest.TestCase):
         self.assertEqual(mock_send_req.call_count, 1)
         self.assertFalse(result)
 
+    @responses.activate
+    def test_ticket_update_bulk(self):
+        """Tests ticket_update_bulk isolates failing updates"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+
+        def callback(request):
+            ticket_id = request.url.rsplit("/", 1)[1]
+            if ticket_id == "2":
+                return 200, {}, json.dumps({"Error": {"ErrorCode": "TicketUpdate.AccessDenied",
+                                                      "ErrorMessage": "no permission"}})
+            return 200, {}, json.dumps({"TicketID": ticket_id, "TicketNumber": "00" + ticket_id})
+
+        responses.add_callback(responses.PATCH,
+                               re.compile(r'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                                          r'GenericTicketConnectorREST/Ticket/\d+'),
+                               callback=callback,
+                               content_type='application/json')
+
+        updates = [(1, {"State": "closed successful"}),
+                   (2, {"State": "closed successful"}, None, None),
+                   (3, {"Owner": "root@localhost"}, [DynamicField("Firstname", "Jane")]),
+                   (4, None, None, Article({"Subject": "closed", "Body": "auto closed"}))]
+        result = {outcome.ticket_id: outcome
+                  for outcome in obj.ticket_update_bulk(updates, max_in_flight=2)}
+
+        self.assertEqual(sorted(result), [1, 2, 3, 4])
+        self.assertEqual([result[tid].success for tid in (1, 2, 3, 4)], [True, False, True, True])
+        self.assertIsInstance(result[2].error, APIError)
+        self.assertIsNone(result[2].result_json)
+        self.assertEqual(result[3].result_json, {"TicketID": "3", "TicketNumber": "003"})
+        self.assertEqual(repr(result[2]), "<TicketUpdateResult: 2 (failed)>")
+        self.assertTrue(all(outcome.elapsed >= 0 for outcome in result.values()))
+
+        bodies = {call.request.url.rsplit("/", 1)[1]: json.loads(call.request.body)
+                  for call in responses.calls}
+        self.assertEqual(bodies["3"]["DynamicField"], [{"Name": "Firstname", "Value": "Jane"}])
+        self.assertEqual(bodies["4"]["Article"]["Subject"], "closed")
+        self.assertNotIn("Ticket", bodies["4"])
+
+    def test_ticket_update_bulk_malformed_items(self):
+        """Tests ticket_update_bulk reports malformed items without stopping the batch"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+
+        with mock.patch.object(obj, 'execute', autospec=True) as mock_execute:
+            mock_execute.return_value = ClientResponse(None, 200, {"TicketID": "4"},
+                                                       None, True, 0.01)
+            result = {outcome.ticket_id: outcome for outcome in obj.ticket_update_bulk(
+                [(1,), (2, "closed"), 3, (4, {"State": "closed"})])}
+
+        self.assertEqual(sorted(result), [1, 2, 3, 4])
+        self.assertIsInstance(result[1].error, ValueError)
+        self.assertIsInstance(result[2].error, TypeError)
+        self.assertIsInstance(result[3].error, TypeError)
+        self.assertTrue(result[4].success)
+        self.assertEqual(mock_execute.call_count, 1)
+
+    def test_ticket_update_bulk_no_session_created(self):
+        """Tests ticket_update_bulk reports the missing session for every ticket"""
+        obj = Client(baseurl="http://fqdn")
+
+        result = list(obj.ticket_update_bulk([(1, {"State": "open"}), (2, {"State": "open"})]))
+
+        self.assertEqual(len(result), 2)
+        self.assertTrue(all(isinstance(outcome.error, SessionNotCreated) for outcome in result))
+
+    @mock.patch('pyotrs.RateLimiter.acquire', autospec=True)
+    @mock.patch('pyotrs.Client.execute', autospec=True)
+    def test_ticket_update_bulk_rate_limit(self, mock_execute, mock_acquire):
+        """Tests ticket_update_bulk waits for the rate limiter before every request"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        mock_acquire.return_value = 0.0
+
+        result = list(obj.ticket_update_bulk([(tid, {"State": "open"}) for tid in range(5)],
+                                             rate_limit=100))
+
+        self.assertEqual(len(result), 5)
+        self.assertEqual(mock_acquire.call_count, 5)
+        self.assertEqual(mock_execute.call_count, 5)
+
     def test_link_add_no_session_created(self):
         """Test link_add - no session"""
         obj = Client(baseurl="http://fqdn")
@@ -1349,6 +1728,92 @@ class ClientTests(unittest.TestCase):
         self.assertEqual(mock_parse_validate.call_count, 1)
         self.assertEqual(mock_send_req.call_count, 1)
 
+    @staticmethod
+    def _link_graph_client():
+        """Client for a LinkList stand-in with the links 1-2, 1-3, 2-4, 3-4, 4-5 and 5-6"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+
+        edges = [(1, 2), (1, 3), (2, 4), (3, 4), (4, 5), (5, 6)]
+        links = {}
+        for src, dst in edges:
+            links.setdefault(src, []).append({"Object": "Ticket", "Key": str(dst),
+                                              "Type": "Normal", "Direction": "Target"})
+            links.setdefault(dst, []).append({"Object": "Ticket", "Key": str(src),
+                                              "Type": "Normal", "Direction": "Source"})
+        links[1].append({"Object": "FAQ", "Key": "99", "Type": "Normal", "Direction": "Target"})
+
+        def callback(request):
+            params = parse_qs(urlparse(request.url).query)
+            result = links.get(int(params["Key"][0]), [])
+            if len(result) == 1:  # a single link is not wrapped in a list
+                result = result[0]
+            return 200, {}, json.dumps({"LinkList": result or ""})
+
+        responses.add_callback(responses.GET,
+                               'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                               'GenericLinkConnectorREST/LinkList',
+                               callback=callback,
+                               content_type='application/json')
+        return obj
+
+    @responses.activate
+    def test_link_graph(self):
+        """Tests link_graph fetches the links of every ticket once"""
+        obj = self._link_graph_client()
+
+        graph = obj.link_graph(1, max_in_flight=3)
+
+        self.assertDictEqual(graph, {1: {2, 3}, 2: {1, 4}, 3: {1, 4}, 4: {2, 3, 5},
+                                     5: {4, 6}, 6: {5}})
+        self.assertEqual(len(responses.calls), 6)
+        params = parse_qs(urlparse(responses.calls[0].request.url).query)
+        self.assertEqual(params["Object2"], ["Ticket"])
+
+    @responses.activate
+    def test_link_graph_max_depth(self):
+        """Tests link_graph stops after max_depth links"""
+        obj = self._link_graph_client()
+
+        graph = obj.link_graph([1, "1"], max_depth=1)
+
+        self.assertDictEqual(graph, {1: {2, 3}, 2: {1, 4}, 3: {1, 4}})
+        self.assertEqual(len(responses.calls), 3)
+        self.assertDictEqual(obj.link_graph([5, 6], max_depth=0), {5: {4, 6}, 6: {5}})
+
+    @responses.activate
+    def test_link_graph_max_tickets(self):
+        """Tests link_graph stops after max_tickets tickets"""
+        obj = self._link_graph_client()
+
+        with self.assertLogs("pyotrs.lib", level="WARNING"):
+            graph = obj.link_graph(1, max_tickets=4)
+
+        self.assertEqual(sorted(graph), [1, 2, 3, 4])
+        self.assertEqual(len(responses.calls), 4)
+
+    @responses.activate
+    def test_link_graph_link_cache(self):
+        """Tests link_graph shares the linked tickets through link_cache"""
+        obj = self._link_graph_client()
+        link_cache = LRUCache(ttl=60)
+
+        first = obj.link_graph(4, link_cache=link_cache)
+        second = obj.link_graph(1, link_cache=link_cache)
+
+        self.assertDictEqual(first, second)
+        self.assertEqual(len(responses.calls), 6)
+        self.assertEqual(len(link_cache), 6)
+
+    def test_link_graph_invalid(self):
+        """Tests link_graph with invalid bounds"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+
+        self.assertRaises(ArgumentInvalidError, obj.link_graph, 1, max_tickets=0)
+        self.assertRaises(ArgumentInvalidError, obj.link_graph, 1, max_depth=-1)
+        self.assertRaises(ArgumentInvalidError, obj.link_graph, 1, max_in_flight=0)
+
     def test_link_possible_link_list_no_session_created(self):
         """Test link_possible_link_list - no session"""
         obj = Client(baseurl="http://fqdn")
@@ -1550,6 +2015,44 @@ class ClientTests(unittest.TestCase):
                          "GenericLinkConnectorREST/PossibleLinkList",
                          obj._build_url())
 
+    def test_compile_operations(self):
+        obj = Client(baseurl="http://fqdn")
+
+        self.assertEqual(obj.operations["TicketGet"],
+                         OperationRoute("GET",
+                                        "http://fqdn/otrs/nph-genericinterface.pl/Webservice/"
+                                        "GenericTicketConnectorREST/Ticket/",
+                                        "Ticket", "GenericTicketConnectorREST", "/Ticket/",
+                                        "TicketID"))
+        self.assertEqual(obj.operations["LinkAdd"].connector, "GenericLinkConnectorREST")
+        self.assertIsNone(obj.operations["LinkAdd"].route_arg)
+        self.assertEqual(set(obj.operations), set(obj.ws_config))
+
+    def test_compile_operations_after_change(self):
+        obj = Client(baseurl="http://fqdn")
+        obj.baseurl = "https://other"
+
+        self.assertTrue(obj._route_url("TicketGet", 1).startswith("https://other/"))
+        obj.webservice_path = "/otrs/nph-genericinterface.pl/Webservice/"
+        self.assertEqual(obj._route_url("TicketGet", 1),
+                         "https://other/otrs/nph-genericinterface.pl/Webservice/"
+                         "GenericTicketConnectorREST/Ticket/1")
+
+    def test__route_url_unknown_route(self):
+        config = {"Name": "GenericTicketConnectorREST",
+                  "Config": {"TicketGet": {"Result": "Ticket", "RequestMethod": "GET",
+                                           "Route": "/Ticket/:Foo"}}}
+        obj = Client(baseurl="http://fqdn", webservice_config_ticket=config)
+
+        self.assertIsNone(obj.operations["TicketGet"].url)
+        self.assertRaisesRegex(ArgumentInvalidError, "TicketGet", obj._route_url, "TicketGet")
+
+    def test__route_url_unknown_operation(self):
+        obj = Client(baseurl="http://fqdn")
+
+        self.assertRaisesRegex(ArgumentInvalidError, "Unknown operation: TicketFoo",
+                               obj._route_url, "TicketFoo")
+
     def test__send_request_no_payload(self):
         """Test _send_request no payload"""
         obj = Client(baseurl="http://fqdn")
@@ -1590,7 +2093,7 @@ class ClientTests(unittest.TestCase):
                                obj._send_request,
                                payload={"foo": "bar"})
 
-    @mock.patch('pyotrs.lib.requests.request')
+    @mock.patch('pyotrs.lib.requests.Session.request')
     def test__send_request_with_defaults(self, mock_requests_req):
         """Tests _send_request call with defaults"""
         obj = Client(baseurl="http://fqdn")
@@ -1620,7 +2123,7 @@ class ClientTests(unittest.TestCase):
 
         self.assertTrue(mocked_result.result)
 
-    @mock.patch('pyotrs.lib.requests.request')
+    @mock.patch('pyotrs.lib.requests.Session.request')
     def test__send_get_request_with_manual_values(self, mock_requests_req):
         """Tests _send_request call with manual values"""
         obj = Client(
@@ -1658,7 +2161,7 @@ class ClientTests(unittest.TestCase):
 
         self.assertTrue(mocked_result.result)
 
-    @mock.patch('pyotrs.lib.requests.request')
+    @mock.patch('pyotrs.lib.requests.Session.request')
     def test__send_post_request_with_manual_values(self, mock_requests_req):
         """Tests _send_post_request call with manual values"""
         obj = Client(
@@ -1699,7 +2202,7 @@ class ClientTests(unittest.TestCase):
 
         self.assertTrue(mocked_result.result)
 
-    @mock.patch('pyotrs.lib.requests.request')
+    @mock.patch('pyotrs.lib.requests.Session.request')
     def test__send_request_ok(self, mock_requests_req):
         """Tests _send_request ok"""
         obj = Client(baseurl="http://fqdn", user_agent="MyCustomClient v0.1")
@@ -1715,7 +2218,7 @@ class ClientTests(unittest.TestCase):
         self.assertEqual(mock_requests_req.call_count, 1)
         self.assertTrue(mocked_result.result)
 
-    @mock.patch('pyotrs.lib.requests.request', autospec=True)
+    @mock.patch('pyotrs.lib.requests.Session.request', autospec=True)
     def test__send_request_http_status_code_nok(self, mock_requests_req):
         """Tests _send_request fail http status code not 200"""
         obj = Client(baseurl="http://fqdn")
@@ -1733,7 +2236,7 @@ class ClientTests(unittest.TestCase):
 
         self.assertEqual(mock_requests_req.call_count, 1)
 
-    @mock.patch('pyotrs.lib.requests.request', autospec=True)
+    @mock.patch('pyotrs.lib.requests.Session.request', autospec=True)
     def test__send_request_fail(self, mock_requests_req):
         """Tests _send_request fail"""
         obj = Client(baseurl="http://fqdn")
@@ -1957,6 +2460,774 @@ class ClientTests(unittest.TestCase):
                                obj._parse_and_validate_response,
                                mocked_response)
 
+    @responses.activate
+    def test_execute_ticket_get(self):
+        """Test execute returns a ClientResponse and does not touch per-call attributes"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket/5',
+                      json={'Ticket': [{'TicketID': '5', 'Title': 'foo'}]},
+                      status=200)
+
+        response = obj.execute("TicketGet", obj._payload_ticket_get(5), 5)
+
+        self.assertIsInstance(response, ClientResponse)
+        self.assertIsInstance(response.context, RequestContext)
+        self.assertEqual(response.operation, "TicketGet")
+        self.assertEqual(response.context.http_method, "GET")
+        self.assertEqual(response.context.result_type, "Ticket")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.success)
+        self.assertIsInstance(response.result[0], Ticket)
+        self.assertEqual(response.result_json, {'Ticket': [{'TicketID': '5', 'Title': 'foo'}]})
+        self.assertGreaterEqual(response.elapsed, 0)
+        self.assertEqual(response.__repr__(), '<ClientResponse: TicketGet (200)>')
+
+        self.assertIsNone(obj.operation)
+        self.assertIsNone(obj.result_json)
+        self.assertEqual(obj.result, [])
+
+    def test_execute_no_payload(self):
+        obj = Client(baseurl="http://fqdn")
+        self.assertRaisesRegex(ArgumentMissingError, 'payload', obj.execute, "TicketGet", {}, 1)
+
+    def test_request_context_immutable(self):
+        obj = Client(baseurl="http://fqdn")
+        context = obj._prepare("TicketSearch", {"foo": "bar"})
+
+        self.assertEqual(context.url, 'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                                      'GenericTicketConnectorREST/Ticket')
+        self.assertRaises(AttributeError, setattr, context, "url", "http://other")
+
+    def test_per_call_attributes_per_thread(self):
+        obj = Client(baseurl="http://fqdn")
+        obj.operation = "TicketGet"
+        obj.result = ["main"]
+
+        seen = {}
+
+        def worker():
+            seen["operation"] = obj.operation
+            seen["result"] = obj.result
+            obj.operation = "TicketSearch"
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertIsNone(seen["operation"])
+        self.assertEqual(seen["result"], [])
+        self.assertEqual(obj.operation, "TicketGet")
+        self.assertEqual(obj.result, ["main"])
+
+    @responses.activate
+    def test_ticket_get_by_id_shared_by_threads(self):
+        """Test one Client shared by 32 threads returns the matching ticket to every call"""
+        obj = Client(baseurl="http://fqdn", pool_maxsize=32)
+        obj.session_id_store.value = "some_session_id"
+        for tid in range(1, 129):
+            responses.add(responses.GET,
+                          'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                          f'GenericTicketConnectorREST/Ticket/{tid}',
+                          json={'Ticket': [{'TicketID': str(tid)}]},
+                          status=200)
+
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            result = list(executor.map(obj.ticket_get_by_id, range(1, 129)))
+
+        self.assertEqual([ticket.tid for ticket in result], list(range(1, 129)))
+
+    @responses.activate
+    def test_ticket_get_by_id_ticket_cache_hit(self):
+        """Test ticket_get_by_id - second call is served from ticket_cache"""
+        obj = Client(baseurl="http://fqdn", ticket_cache=TicketCache())
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket/1',
+                      json={'Ticket': [{'TicketID': '1', 'Changed': '2024-01-01 10:00:00'}]},
+                      status=200)
+
+        first = obj.ticket_get_by_id(1)
+        first.fields["Title"] = "modified"
+        second = obj.ticket_get_by_id(1)
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.tid, 1)
+        self.assertNotIn("Title", second.fields)
+        self.assertEqual(obj.result, [second])
+
+        obj.ticket_get_by_id(1, articles=True)
+        self.assertEqual(len(responses.calls), 2)
+
+    @responses.activate
+    def test_ticket_get_by_id_ticket_cache_hit_not_shared(self):
+        """Test ticket_get_by_id - modifying a cache hit does not change the next hit"""
+        obj = Client(baseurl="http://fqdn", ticket_cache=TicketCache())
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket/1',
+                      json={'Ticket': [{'TicketID': '1', 'Article': [
+                          {'ArticleID': '2', 'Attachment': [{'Filename': 'a.txt',
+                                                             'Content': 'YmFyCg=='}]}]}]},
+                      status=200)
+
+        obj.ticket_get_by_id(1, articles=True, attachments=True)
+        hit = obj.ticket_get_by_id(1, articles=True, attachments=True)
+        hit.articles[0].attachments[0].Filename = "b.txt"
+        obj.result_json["Ticket"][0]["TicketID"] = "3"
+
+        self.assertEqual(obj.ticket_get_by_id(1, articles=True, attachments=True)
+                         .articles[0].attachments[0].Filename, "a.txt")
+        self.assertEqual(obj.result_json["Ticket"][0]["TicketID"], "1")
+        self.assertEqual(len(responses.calls), 1)
+
+        tickets = obj.ticket_get_by_list([1], articles=True, attachments=True)
+        tickets[0].articles[0].attachments[0].Filename = "c.txt"
+        self.assertEqual(obj.ticket_get_by_list([1], articles=True, attachments=True)[0]
+                         .articles[0].attachments[0].Filename, "a.txt")
+
+    @responses.activate
+    def test_ticket_get_by_id_ticket_cache_revalidated(self):
+        """Test ticket_get_by_id - stale entry which did not change is used"""
+        cache = TicketCache(ttl=0)
+        cache.set(TicketCache.key(1), {'TicketID': '1', 'Changed': '2024-01-01 10:00:00'})
+        obj = Client(baseurl="http://fqdn", ticket_cache=cache)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket',
+                      json={'TicketID': ['1']},
+                      status=200)
+
+        result = obj.ticket_get_by_id(1)
+
+        self.assertEqual(result.tid, 1)
+        self.assertEqual(len(responses.calls), 1)
+        search = parse_qs(urlparse(responses.calls[0].request.url).query)
+        self.assertEqual(search["TicketID"], ["1"])
+        self.assertEqual(search["TicketChangeTimeOlderDate"], ["2024-01-01 10:00:00"])
+
+    @responses.activate
+    def test_ticket_get_by_id_ticket_cache_changed(self):
+        """Test ticket_get_by_id - stale entry which changed is fetched again"""
+        cache = TicketCache(ttl=0)
+        cache.set(TicketCache.key(1), {'TicketID': '1', 'Changed': '2024-01-01 10:00:00'})
+        obj = Client(baseurl="http://fqdn", ticket_cache=cache)
+        obj.session_id_store.value = "some_session_id"
+        url = 'http://fqdn/otrs/nph-genericinterface.pl/Webservice/GenericTicketConnectorREST'
+        responses.add(responses.GET, f"{url}/Ticket", json={}, status=200)
+        responses.add(responses.GET, f"{url}/Ticket/1",
+                      json={'Ticket': [{'TicketID': '1', 'Changed': '2024-02-01 10:00:00'}]},
+                      status=200)
+
+        result = obj.ticket_get_by_id(1)
+
+        self.assertEqual(result.field_get("Changed"), '2024-02-01 10:00:00')
+        self.assertEqual(len(responses.calls), 2)
+        self.assertEqual(cache.lookup(TicketCache.key(1))[0]["Changed"], '2024-02-01 10:00:00')
+
+    @responses.activate
+    def test_ticket_get_by_list_ticket_cache_partial(self):
+        """Test ticket_get_by_list - only tickets missing in ticket_cache are requested"""
+        cache = TicketCache()
+        cache.set(TicketCache.key(2), {'TicketID': '2', 'Changed': '2024-01-01 10:00:00'})
+        obj = Client(baseurl="http://fqdn", ticket_cache=cache)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/TicketList',
+                      json={'Ticket': [{'TicketID': '3'}, {'TicketID': '1'}]},
+                      status=200)
+
+        result = obj.ticket_get_by_list([1, 2, 3])
+
+        self.assertEqual([ticket.tid for ticket in result], [1, 2, 3])
+        query = parse_qs(urlparse(responses.calls[0].request.url).query)
+        self.assertEqual(query["TicketID"], ["1,3"])
+
+        obj.ticket_get_by_list([3, 1])
+        self.assertEqual(len(responses.calls), 1)
+
+    @responses.activate
+    def test_ticket_update_invalidates_ticket_cache(self):
+        """Test ticket_update removes the ticket from ticket_cache"""
+        cache = TicketCache()
+        cache.set(TicketCache.key(9), {'TicketID': '9'})
+        obj = Client(baseurl="http://fqdn", ticket_cache=cache)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.PATCH,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket/9',
+                      json={'TicketID': '9', 'TicketNumber': '000008'},
+                      status=200)
+
+        obj.ticket_update(9, State="closed")
+
+        self.assertEqual(len(cache), 0)
+
+    @responses.activate
+    def test_ticket_update_invalidates_ticket_cache_filled_meanwhile(self):
+        """Test ticket_update drops a ticket cached by another thread during the update"""
+        obj = Client(baseurl="http://fqdn", ticket_cache=TicketCache())
+        obj.session_id_store.value = "some_session_id"
+        url = 'http://fqdn/otrs/nph-genericinterface.pl/Webservice/' \
+              'GenericTicketConnectorREST/Ticket/9'
+        responses.add(responses.GET, url, json={'Ticket': [{'TicketID': '9'}]}, status=200)
+
+        def get_in_other_thread():
+            thread = threading.Thread(target=obj.ticket_get_by_id, args=(9,))
+            thread.start()
+            thread.join()
+            self.assertEqual(len(obj.ticket_cache), 1)
+
+        def update(request):
+            get_in_other_thread()
+            return 200, {}, json.dumps({'TicketID': '9', 'TicketNumber': '000008'})
+
+        def update_failing(request):
+            get_in_other_thread()
+            raise requests.exceptions.ConnectionError("connection reset")
+
+        responses.add_callback(responses.PATCH, url, callback=update)
+        obj.ticket_update(9, State="closed")
+        obj.ticket_get_by_id(9)
+        self.assertEqual(len([call for call in responses.calls
+                              if call.request.method == "GET"]), 2)
+
+        obj.ticket_cache.clear()
+        responses.remove(responses.PATCH, url)
+        responses.add_callback(responses.PATCH, url, callback=update_failing)
+        self.assertRaises(HTTPError, obj.ticket_update, 9, State="closed")
+        self.assertEqual(len(obj.ticket_cache), 0)
+
+        result = list(obj.ticket_update_bulk([(9, {"State": "closed"})]))
+        self.assertFalse(result[0].success)
+        self.assertEqual(len(obj.ticket_cache), 0)
+
+    @responses.activate
+    def test_ticket_get_by_id_ticket_class(self):
+        """Test ticket_get_by_id with ticket_class CompactTicket"""
+        obj = Client(baseurl="http://fqdn", ticket_class=CompactTicket)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket/1',
+                      json={'Ticket': [{'TicketID': '1', 'State': 'open'}]},
+                      status=200)
+
+        result = obj.ticket_get_by_id(1)
+
+        self.assertIsInstance(result, CompactTicket)
+        self.assertEqual(result.field_get("State"), "open")
+
+    @responses.activate
+    def test_ticket_create_streamed_attachment(self):
+        """Test ticket_create sends a streamed attachment with Content-Length"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        received = {}
+
+        def callback(request):
+            received["length"] = request.headers["Content-Length"]
+            body = request.body
+            received["body"] = json.loads(body if isinstance(body, bytes) else body.read())
+            return 200, {}, json.dumps({"TicketID": "2", "TicketNumber": "000002"})
+
+        responses.add_callback(responses.POST,
+                               'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                               'GenericTicketConnectorREST/Ticket',
+                               callback=callback)
+
+        with tempfile.NamedTemporaryFile(suffix=".txt") as f:
+            f.write(b"foo bar\n" * 1000)
+            f.flush()
+            att = Attachment.create_from_file(f.name, stream=True)
+            result = obj.ticket_create(Ticket._dummy(), Article._dummy(), attachments=[att])
+
+        self.assertEqual(result["TicketID"], "2")
+        content = received["body"]["Attachment"][0]["Content"]
+        self.assertEqual(base64.b64decode(content), b"foo bar\n" * 1000)
+        self.assertEqual(received["body"]["Attachment"][0]["ContentType"], "text/plain")
+
+    def test_json_codec_default(self):
+        obj = Client(baseurl="http://fqdn")
+        self.assertIsInstance(obj.json_codec, JSONCodec)
+        self.assertEqual(obj.json_codec.__repr__(), "<JSONCodec: json>")
+
+    def test_get_json_codec(self):
+        self.assertIsInstance(get_json_codec("json"), JSONCodec)
+        self.assertRaisesRegex(ArgumentInvalidError, 'Unknown JSON codec', get_json_codec, "foo")
+
+        with mock.patch('pyotrs.lib.orjson', None):
+            self.assertEqual(get_json_codec("auto").name, "json")
+            self.assertRaisesRegex(ArgumentInvalidError, 'orjson is not installed',
+                                   get_json_codec, "orjson")
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    @responses.activate
+    def test_json_codec_orjson(self):
+        """Test a Client using orjson encodes to bytes and decodes the raw response"""
+        obj = Client(baseurl="http://fqdn", json_codec="auto")
+        obj.session_id_store.value = "some_session_id"
+        self.assertIsInstance(obj.json_codec, OrjsonCodec)
+
+        responses.add(responses.PATCH,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket/9',
+                      json={'TicketID': '9', 'TicketNumber': '000008'},
+                      status=200)
+
+        result = obj.ticket_update(9, Title="bär")
+
+        self.assertDictEqual(result, {'TicketID': '9', 'TicketNumber': '000008'})
+        body = responses.calls[0].request.body
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body)["Ticket"], {"Title": "bär"})
+
+    def test_ticket_list_parser_byte_by_byte(self):
+        """Test _TicketListParser with tricky strings fed one byte at a time"""
+        document = {"Ticket": [{"TicketID": "1", "Title": "a \\\"[{}]\" b",
+                                "Article": [{"Body": "bjørn ]}", "ArticleID": "3"}]},
+                               {"TicketID": "2", "Title": "\\", "DynamicField": []}],
+                    "Other": {"Ticket": [1]}}
+        data = json.dumps(document, ensure_ascii=False).encode("utf-8")
+
+        parser = _TicketListParser(json.loads)
+        elements = []
+        for pos in range(len(data)):
+            elements.extend(parser.feed(data[pos:pos + 1]))
+
+        self.assertEqual(elements, document["Ticket"])
+        self.assertEqual(parser.close(), {"Ticket": [], "Other": {"Ticket": [1]}})
+        self.assertLess(len(parser._buffer), 2)
+
+    def test_ticket_list_parser_error_document(self):
+        parser = _TicketListParser(json.loads)
+        data = b'{"Error": {"ErrorCode": "TicketGet.AccessDenied", "ErrorMessage": "no"}}'
+        self.assertEqual(parser.feed(data[:20]) + parser.feed(data[20:]), [])
+        self.assertEqual(parser.close()["Error"]["ErrorCode"], "TicketGet.AccessDenied")
+
+        parser = _TicketListParser(json.loads)
+        parser.feed(b'{"Ticket": ')
+        self.assertRaisesRegex(ResponseParseError, 'Invalid JSON', parser.close)
+
+    @responses.activate
+    def test_ticket_get_by_list_stream(self):
+        """Test ticket_get_by_list_stream yields Tickets from a streamed response"""
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/TicketList',
+                      json={'Ticket': [{'TicketID': str(tid), 'Title': f'T{tid}'}
+                                       for tid in range(1, 51)]},
+                      status=200)
+
+        result = list(obj.ticket_get_by_list_stream(list(range(1, 51)), chunk_size=7))
+
+        self.assertEqual([ticket.tid for ticket in result], list(range(1, 51)))
+        self.assertEqual(result[9].field_get("Title"), "T10")
+        self.assertIsNone(obj.operation)
+        self.assertEqual(list(obj.ticket_get_by_list_stream([])), [])
+
+    @responses.activate
+    def test_ticket_get_by_list_stream_error(self):
+        obj = Client(baseurl="http://fqdn")
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/TicketList',
+                      json={'Error': {'ErrorCode': 'TicketGet.AccessDenied',
+                                      'ErrorMessage': 'denied'}},
+                      status=200)
+
+        self.assertRaisesRegex(APIError, 'TicketGet.AccessDenied',
+                               list, obj.ticket_get_by_list_stream([1]))
+
+    def test_init_compression_invalid(self):
+        self.assertRaisesRegex(ArgumentInvalidError, 'compression must be one of',
+                               Client, baseurl="http://fqdn", compression="brotli")
+
+    @responses.activate
+    def test_ticket_update_compressed(self):
+        """Test request bodies above the threshold are compressed"""
+        obj = Client(baseurl="http://fqdn", compression="gzip", compression_threshold=1000)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.PATCH,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket/9',
+                      json={'TicketID': '9', 'TicketNumber': '000008'},
+                      status=200)
+        body = "<p>" + "note " * 5000 + "</p>"
+
+        obj.ticket_update(9, article=Article({"Subject": "note", "Body": body}))
+        obj.ticket_update(9, State="closed")
+
+        compressed, small = [call.request for call in responses.calls]
+        self.assertEqual(compressed.headers["Content-Encoding"], "gzip")
+        self.assertEqual(compressed.headers["Accept-Encoding"], "gzip, deflate")
+        self.assertLess(len(compressed.body), len(body) // 10)
+        self.assertEqual(json.loads(gzip.decompress(compressed.body))["Article"]["Body"], body)
+        self.assertNotIn("Content-Encoding", small.headers)
+        self.assertEqual(json.loads(small.body)["Ticket"]["State"], "closed")
+
+    @responses.activate
+    def test_ticket_update_compressed_deflate(self):
+        obj = Client(baseurl="http://fqdn", compression="deflate", compression_threshold=0)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.PATCH,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket/9',
+                      json={'TicketID': '9', 'TicketNumber': '000008'},
+                      status=200)
+
+        obj.ticket_update(9, State="closed")
+
+        request = responses.calls[0].request
+        self.assertEqual(request.headers["Content-Encoding"], "deflate")
+        self.assertEqual(json.loads(zlib.decompress(request.body))["Ticket"]["State"], "closed")
+
+
+class RateLimiterTests(unittest.TestCase):
+    def test_init_invalid(self):
+        self.assertRaisesRegex(ArgumentInvalidError, 'rate', RateLimiter, 0)
+        self.assertRaisesRegex(ArgumentInvalidError, 'burst', RateLimiter, 1, burst=0)
+
+    def test_acquire(self):
+        limiter = RateLimiter(50, burst=2)
+        self.assertEqual(repr(limiter), "<RateLimiter: 50/s (burst 2)>")
+
+        start = time.monotonic()
+        waited = [limiter.acquire() for _ in range(6)]
+
+        self.assertEqual(waited[:2], [0.0, 0.0])
+        self.assertTrue(all(delay > 0 for delay in waited[2:]))
+        self.assertGreaterEqual(time.monotonic() - start, 4 / 50 * 0.9)
+
+    def test_acquire_threads(self):
+        limiter = RateLimiter(200)
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: limiter.acquire(), range(20)))
+
+        self.assertGreaterEqual(time.monotonic() - start, 19 / 200 * 0.9)
+
+
+class RequestGovernorTests(unittest.TestCase):
+    def test_init_invalid(self):
+        self.assertRaisesRegex(ArgumentInvalidError, 'max_concurrency',
+                               RequestGovernor, max_concurrency=0)
+        self.assertRaisesRegex(ArgumentInvalidError, 'rate',
+                               RequestGovernor, operations={"TicketSearch": {"rate": -1}})
+
+    def test_slot_max_concurrency_per_operation(self):
+        governor = RequestGovernor(max_concurrency=4,
+                                   operations={"TicketSearch": {"max_concurrency": 2}})
+        self.assertEqual(repr(governor), "<RequestGovernor: rate=None, max_concurrency=4>")
+        lock = threading.Lock()
+        running = {"TicketSearch": 0, "TicketGet": 0}
+        peak = dict(running)
+
+        def request(operation):
+            with governor.slot(operation):
+                with lock:
+                    running[operation] += 1
+                    peak[operation] = max(peak[operation], running[operation])
+                time.sleep(0.02)
+                with lock:
+                    running[operation] -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(request, ["TicketSearch"] * 6 + ["TicketGet"] * 6))
+
+        self.assertEqual(peak["TicketSearch"], 2)
+        self.assertLessEqual(peak["TicketGet"], 4)
+
+        metrics = governor.metrics()
+        self.assertEqual(metrics["TicketSearch"]["requests"], 6)
+        self.assertEqual(metrics["TicketSearch"]["in_flight"], 0)
+        self.assertEqual(metrics["TicketSearch"]["in_flight_max"], 2)
+        self.assertGreater(metrics["TicketSearch"]["queued"], 0)
+        self.assertGreater(metrics["TicketSearch"]["delay_max"], 0.01)
+        self.assertAlmostEqual(metrics["TicketSearch"]["delay_avg"],
+                               metrics["TicketSearch"]["delay_total"] / 6)
+
+        governor.reset_metrics()
+        self.assertEqual(governor.metrics()["TicketSearch"]["requests"], 0)
+
+    def test_slot_rate(self):
+        governor = RequestGovernor(operations={"TicketUpdate": {"rate": 100}})
+
+        start = time.monotonic()
+        for _ in range(5):
+            with governor.slot("TicketUpdate"):
+                pass
+        with governor.slot("TicketSearch") as delay:
+            self.assertLess(delay, 0.001)
+
+        self.assertGreaterEqual(time.monotonic() - start, 4 / 100 * 0.9)
+        self.assertEqual(governor.metrics()["TicketUpdate"]["requests"], 5)
+
+    @responses.activate
+    def test_client_governor(self):
+        governor = RequestGovernor(max_concurrency=2)
+        obj = Client(baseurl="http://fqdn", governor=governor)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET,
+                      'http://fqdn/otrs/nph-genericinterface.pl/Webservice/'
+                      'GenericTicketConnectorREST/Ticket',
+                      json={"TicketID": ["1"]}, status=200)
+
+        obj.ticket_search(Title="foo")
+        obj.execute("TicketSearch", obj._payload_ticket_search(Title="foo"))
+
+        self.assertEqual(governor.metrics()["TicketSearch"]["requests"], 2)
+
+
+class RecorderTests(unittest.TestCase):
+    URL = "http://fqdn/otrs/nph-genericinterface.pl/Webservice/GenericTicketConnectorREST"
+
+    def test_histogram(self):
+        recorder = HistogramRecorder()
+        for value in range(1, 101):
+            recorder.record("TicketGet", "wall", value / 1000)
+        recorder.record("TicketGet", "errors", 1)
+        recorder.record("TicketGet", "request_bytes", 0)
+
+        self.assertEqual(repr(recorder), "<HistogramRecorder: 3 histograms>")
+        self.assertAlmostEqual(recorder.percentile("TicketGet", "wall", 50), 0.05, delta=0.01)
+        self.assertAlmostEqual(recorder.percentile("TicketGet", "wall", 99), 0.099, delta=0.02)
+        self.assertEqual(recorder.percentile("TicketGet", "wall", 100), 0.1)
+        self.assertEqual(recorder.percentile("TicketGet", "request_bytes", 50), 0)
+        self.assertIsNone(recorder.percentile("TicketSearch", "wall", 50))
+
+        wall = recorder.snapshot()["TicketGet"]["wall"]
+        self.assertEqual(wall["count"], 100)
+        self.assertAlmostEqual(wall["sum"], 5.05)
+        self.assertEqual((wall["min"], wall["max"]), (0.001, 0.1))
+        self.assertEqual(sum(wall["buckets"].values()), 100)
+        self.assertEqual(list(wall["buckets"]), sorted(wall["buckets"]))
+
+        report = recorder.report()
+        self.assertIn("p95", report.splitlines()[0])
+        self.assertEqual(len(report.splitlines()), 4)
+
+        recorder.clear()
+        self.assertEqual(recorder.snapshot(), {})
+
+    def test_callback(self):
+        calls = []
+        MetricsRecorder(lambda *args: calls.append(args)).record("LinkAdd", "wall", 0.5)
+        MetricsRecorder().record("LinkAdd", "wall", 0.5)
+        self.assertEqual(calls, [("LinkAdd", "wall", 0.5)])
+
+    @responses.activate
+    def test_ticket_get_by_id_recorded(self):
+        recorder = HistogramRecorder()
+        obj = Client(baseurl="http://fqdn", recorder=recorder)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET, f"{self.URL}/Ticket/1",
+                      json={"Ticket": [{"TicketID": "1"}]}, status=200)
+
+        obj.ticket_get_by_id(1)
+
+        metrics = recorder.snapshot()["TicketGet"]
+        self.assertEqual(set(metrics), {"wall", "http", "ttfb", "decode", "parse",
+                                        "request_bytes", "response_bytes"})
+        self.assertEqual(metrics["response_bytes"]["sum"],
+                         len(responses.calls[0].response.content))
+        self.assertGreater(metrics["request_bytes"]["sum"], 0)
+        self.assertGreaterEqual(metrics["wall"]["sum"], metrics["http"]["sum"])
+        self.assertIsNone(obj._request_start)
+
+    @responses.activate
+    def test_execute_recorded(self):
+        recorder = HistogramRecorder()
+        obj = Client(baseurl="http://fqdn", recorder=recorder)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.PATCH, f"{self.URL}/Ticket/9",
+                      json={"TicketID": "9"}, status=200)
+        responses.add(responses.PATCH, f"{self.URL}/Ticket/10",
+                      json={"Error": {"ErrorCode": "TicketUpdate.AccessDenied",
+                                      "ErrorMessage": "no permission"}}, status=200)
+
+        response = obj.execute("TicketUpdate", obj._payload_ticket_update(9, State="open"), 9)
+        self.assertRaises(APIError, obj.execute, "TicketUpdate",
+                          obj._payload_ticket_update(10, State="open"), 10)
+
+        metrics = recorder.snapshot()["TicketUpdate"]
+        self.assertEqual(metrics["wall"]["count"], 1)
+        self.assertEqual(metrics["wall"]["sum"], response.elapsed)
+        self.assertEqual(metrics["encode"]["count"], 2)
+        self.assertEqual(metrics["request_bytes"]["sum"],
+                         sum(len(call.request.body) for call in responses.calls))
+        self.assertEqual(metrics["errors"]["count"], 1)
+
+    @responses.activate
+    def test_http_error_recorded(self):
+        recorder = HistogramRecorder()
+        obj = Client(baseurl="http://fqdn", recorder=recorder)
+        obj.session_id_store.value = "some_session_id"
+        responses.add(responses.GET, f"{self.URL}/Ticket/1",
+                      body=requests.exceptions.ConnectionError("refused"))
+        responses.add(responses.GET, f"{self.URL}/Ticket/2", status=503)
+
+        with self.assertRaises(HTTPError) as context:
+            obj.ticket_get_by_id(1)
+        self.assertIsInstance(context.exception.__cause__, requests.exceptions.ConnectionError)
+        self.assertRaises(HTTPError, obj.ticket_get_by_id, 2)
+
+        self.assertEqual(recorder.snapshot()["TicketGet"]["errors"]["count"], 2)
+
+
+class SessionRenewTests(unittest.TestCase):
+    URL = "http://fqdn/otrs/nph-genericinterface.pl/Webservice/GenericTicketConnectorREST"
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _client(self, **kwargs):
+        client = Client(baseurl="http://fqdn", username="user", password="pass",
+                        session_id_file=f"{self.tmpdir.name}/.session_id_store", **kwargs)
+        client.session_id_store.value = "expired_session_id"
+        self.addCleanup(client.close)
+        return client
+
+    def _add_expired_then_ok(self):
+        responses.add(responses.GET, f"{self.URL}/Ticket/1",
+                      json={"Error": {"ErrorCode": "TicketGet.AuthFail",
+                                      "ErrorMessage": "TicketGet: Authorization failing!"}},
+                      status=200)
+        responses.add(responses.POST, f"{self.URL}/Session",
+                      json={"AccessToken": "new_session_id"}, status=200)
+        responses.add(responses.GET, f"{self.URL}/Ticket/1",
+                      json={"Ticket": [{"TicketID": "1"}]}, status=200)
+
+    def test_init_session_refresh_invalid(self):
+        self.assertRaisesRegex(ArgumentInvalidError, 'session_refresh',
+                               Client, baseurl="http://fqdn", session_refresh=2)
+
+    @responses.activate
+    def test_ticket_get_by_id_retried_with_new_session(self):
+        client = self._client(session_retry=True)
+        self._add_expired_then_ok()
+
+        result = client.ticket_get_by_id(1)
+
+        self.assertEqual(result.tid, 1)
+        self.assertEqual(client.operation, "TicketGet")
+        self.assertEqual(client.session_id_store.value, "new_session_id")
+        self.assertEqual(client.session_id_store.read(), "new_session_id")
+        self.assertEqual(len(responses.calls), 3)
+        query = parse_qs(urlparse(responses.calls[2].request.url).query)
+        self.assertEqual(query["AccessToken"], ["new_session_id"])
+
+    @responses.activate
+    def test_execute_retried_with_new_session(self):
+        client = self._client(session_retry=True)
+        self._add_expired_then_ok()
+
+        response = client.execute("TicketGet", client._payload_ticket_get(1), 1)
+
+        self.assertEqual(response.result[0].tid, 1)
+        self.assertEqual(response.context.payload["AccessToken"], "new_session_id")
+        self.assertEqual(len(responses.calls), 3)
+
+    @responses.activate
+    def test_ticket_get_by_id_not_retried(self):
+        client = self._client()
+        self._add_expired_then_ok()
+
+        self.assertRaisesRegex(APIError, 'TicketGet.AuthFail', client.ticket_get_by_id, 1)
+        self.assertEqual(len(responses.calls), 1)
+
+    @mock.patch('pyotrs.Client.session_create', autospec=True)
+    def test_session_renew_already_renewed(self, mock_s_create):
+        client = self._client()
+        client.session_id_store.value = "renewed_session_id"
+
+        self.assertEqual(client.session_renew("expired_session_id"), "renewed_session_id")
+        self.assertEqual(mock_s_create.call_count, 0)
+
+    def test_session_refresh_thread(self):
+        client = self._client(session_refresh=0.5)
+        client.session_id_store.created = datetime.datetime.utcnow() - \
+            datetime.timedelta(seconds=client.session_timeout)
+        renewed = threading.Event()
+
+        def renew(obj):
+            obj.session_id_store.created = datetime.datetime.utcnow()
+            renewed.set()
+
+        with mock.patch('pyotrs.Client.session_renew', autospec=True, side_effect=renew):
+            self.assertTrue(client.start_session_refresh())
+            self.assertTrue(renewed.wait(5))
+            self.assertGreater(client._session_refresh_wait(), client.session_timeout * 0.4)
+            client.stop_session_refresh()
+
+        self.assertIsNone(client._session_refresh_thread)
+        self.assertFalse(self._client().start_session_refresh())
+
+    def _provider_client(self, **kwargs):
+        provider = SessionProvider(refresh_margin=60)
+        client = self._client(session_provider=provider, **kwargs)
+        self.addCleanup(provider.invalidate, client.session_id_store.file_path)
+        return client, provider
+
+    def test_session_refresh_wait_from_provider_cache(self):
+        client, provider = self._provider_client(session_refresh=0.5)
+        file_path = client.session_id_store.file_path
+        now = time.time()
+
+        provider.set(file_path, "cached_session_id", False, now + 3600,
+                     now - client.session_timeout * 0.4)
+        self.assertTrue(provider.restore_or_create(client))
+        self.assertEqual(client.session_id_store.value, "cached_session_id")
+        self.assertAlmostEqual(client._session_refresh_wait(), client.session_timeout * 0.1,
+                               delta=5)
+
+        provider.set(file_path, "cached_session_id", False, now + 3600)
+        self.assertTrue(provider.restore_or_create(client))
+        self.assertEqual(client._session_refresh_wait(), 0.0)
+
+    @mock.patch('pyotrs.Client.session_get', autospec=True)
+    @mock.patch('pyotrs.Client.session_create', autospec=True)
+    def test_session_renew_uses_session_of_other_process(self, mock_s_create, mock_s_get):
+        client, provider = self._provider_client()
+        mock_s_get.return_value = True
+        store = client.session_id_store
+        provider.set(store.file_path, "expired_session_id", False, time.time() + 3600)
+        # another process already renewed the Session ID
+        SessionStore(store.file_path, client.session_timeout).write("other_session_id")
+
+        self.assertEqual(client.session_renew("expired_session_id"), "other_session_id")
+        self.assertEqual(mock_s_create.call_count, 0)
+        self.assertEqual(provider.get(store.file_path)[0], "other_session_id")
+        self.assertIsNotNone(store.created)
+
+    @responses.activate
+    def test_session_renew_with_provider_creates_once(self):
+        client, provider = self._provider_client()
+        store = client.session_id_store
+        SessionStore(store.file_path, client.session_timeout).write("expired_session_id")
+        responses.add(responses.POST, f"{self.URL}/Session",
+                      json={"AccessToken": "new_session_id"}, status=200)
+
+        self.assertEqual(client.session_renew("expired_session_id"), "new_session_id")
+        self.assertEqual(store.read(), "new_session_id")
+        self.assertEqual(provider.get(store.file_path)[0], "new_session_id")
+
+        other = self._client(session_provider=provider)
+        self.assertEqual(other.session_renew("expired_session_id"), "new_session_id")
+        self.assertEqual(len(responses.calls), 1)
+
 
 def main():
     unittest.main()
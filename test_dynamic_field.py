@@ -6,9 +6,9 @@ Test for PyOTRS DynamicField class
 import os.path
 import sys
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
-from pyotrs import DynamicField
+from pyotrs import DynamicField, SearchQuery
 
 # make sure (early) that parent dir (main app) is in path
 current_path = os.path.dirname(os.path.realpath(__file__))
@@ -90,6 +90,55 @@ class DynamicFieldTests(unittest.TestCase):
         self.assertIsInstance(dyn2, DynamicField)
         self.assertEqual(dyn2.__repr__(), '<DynamicField: lastname: Doe>')
 
+    def test_slots(self):
+        dyn1 = DynamicField._dummy1()
+        self.assertFalse(hasattr(dyn1, "__dict__"))
+        self.assertRaises(AttributeError, setattr, dyn1, "foo", "bar")
+
+
+class SearchQueryTests(unittest.TestCase):
+    def test_init_blank(self):
+        query = SearchQuery()
+        self.assertDictEqual(query.fields, {})
+        self.assertDictEqual(query.payload(), {})
+        self.assertEqual(query.__repr__(), '<SearchQuery: >')
+
+    def test_init(self):
+        dyn1 = DynamicField(name="SomeName", search_patterns=["foo", "bar"])
+        dyn2 = DynamicField(name="SomeDate", search_patterns=[datetime(2011, 1, 1)],
+                            search_operator="GreaterThan")
+        query = SearchQuery([dyn1, dyn2], Title="Alert*")
+        self.assertDictEqual(query.fields,
+                             {"DynamicField_SomeName": {"Equals": ["foo", "bar"]},
+                              "DynamicField_SomeDate": {"GreaterThan": ["2011-01-01 00:00:00"]},
+                              "Title": "Alert*"})
+        self.assertEqual(query.__repr__(),
+                         '<SearchQuery: DynamicField_SomeName, DynamicField_SomeDate, Title>')
+
+    def test_init_single_dynamic_field(self):
+        query = SearchQuery(DynamicField(name="SomeName", search_patterns="foo"))
+        self.assertDictEqual(query.fields, {"DynamicField_SomeName": {"Equals": ["foo"]}})
+
+    def test_payload(self):
+        query = SearchQuery(Title="Alert*", StateType="open")
+        payload = query.payload(StateType="closed",
+                                TicketCreateTimeNewerDate=datetime(2011, 1, 1, 8, 30))
+        self.assertDictEqual(payload, {"Title": "Alert*",
+                                       "StateType": "closed",
+                                       "TicketCreateTimeNewerDate": "2011-01-01 08:30:00"})
+        self.assertDictEqual(query.fields, {"Title": "Alert*", "StateType": "open"})
+
+    def test_payload_aware_datetime(self):
+        query = SearchQuery()
+        utc = datetime(2011, 1, 1, 8, tzinfo=timezone.utc)
+        cet = utc.astimezone(timezone(timedelta(hours=1)))
+        self.assertEqual(query.payload(Date=utc)["Date"], "2011-01-01 08:00:00")
+        self.assertEqual(query.payload(Date=cet)["Date"], "2011-01-01 09:00:00")
+
+    def test_slots(self):
+        query = SearchQuery()
+        self.assertFalse(hasattr(query, "__dict__"))
+
 
 def main():
     unittest.main()
@@ -3,10 +3,21 @@
 Test for PyOTRS Client class
 """
 
+import os
+import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
-from pyotrs.lib import ArgumentMissingError, SessionStore
+from pyotrs.lib import (
+    ArgumentMissingError,
+    Client,
+    SessionCreateError,
+    SessionProvider,
+    SessionStore,
+)
 
 TMP_SESSION_STORE_FILE_NAME = "/tmp/.session_id_store"
 
@@ -303,6 +314,91 @@ class SessionStoreTests(unittest.TestCase):
         self.assertEqual(mock_lstat.call_count, 1)
 
 
+class SessionProviderTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.tmpdir.name, ".session_id_store")
+        self.provider = SessionProvider(refresh_margin=60)
+        self.addCleanup(self.provider.invalidate, self.file_path)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _client(self):
+        return Client(baseurl="http://fqdn", session_id_file=self.file_path,
+                      session_provider=self.provider)
+
+    def test_init_repr(self):
+        self.assertEqual(SessionProvider().lock_timeout, 60)
+        self.assertRegex(repr(self.provider), r"<SessionProvider: \d+ cached>")
+
+    @mock.patch('pyotrs.Client.session_create', autospec=True)
+    def test_create_and_cache(self, mock_s_create):
+        def create(client):
+            client.session_id_store.value = "new_session_id"
+            client.result_json = {client._session_key: "new_session_id"}
+            return True
+        mock_s_create.side_effect = create
+
+        client = self._client()
+        self.assertTrue(client.session_restore_or_create())
+
+        self.assertEqual(client.session_id_store.value, "new_session_id")
+        self.assertEqual(SessionStore(self.file_path, 600).read(), "new_session_id")
+        self.assertTrue(os.path.isfile(f"{self.file_path}.lock"))
+
+        # a second client uses the cached Session ID: no file read, no HTTP request
+        other = self._client()
+        with mock.patch('pyotrs.SessionStore.read', autospec=True) as mock_read, \
+                mock.patch('pyotrs.Client.session_get', autospec=True) as mock_s_get:
+            self.assertTrue(other.session_restore_or_create())
+        self.assertEqual(other.session_id_store.value, "new_session_id")
+        self.assertEqual(mock_read.call_count, 0)
+        self.assertEqual(mock_s_get.call_count, 0)
+        self.assertEqual(mock_s_create.call_count, 1)
+
+    @mock.patch('pyotrs.Client.session_get', autospec=True)
+    def test_restore_validates_once(self, mock_s_get):
+        mock_s_get.return_value = True
+        SessionStore(self.file_path, 28800).write("stored_session_id")
+
+        for _ in range(3):
+            client = self._client()
+            self.assertTrue(client.session_restore_or_create())
+            self.assertEqual(client.session_id_store.value, "stored_session_id")
+
+        self.assertEqual(mock_s_get.call_count, 1)
+
+    @mock.patch('pyotrs.Client.session_create', autospec=True)
+    @mock.patch('pyotrs.Client.session_get', autospec=True)
+    def test_expiring_entry_is_refreshed(self, mock_s_get, mock_s_create):
+        mock_s_create.return_value = False
+        self.provider.set(self.file_path, "old_session_id", False, time.time() + 30)
+
+        self.assertIsNone(self.provider.get(self.file_path))
+        self.assertRaisesRegex(SessionCreateError,
+                               'Failed to create a Session ID!',
+                               self._client().session_restore_or_create)
+        self.assertEqual(mock_s_get.call_count, 0)
+        self.assertEqual(mock_s_create.call_count, 1)
+
+    def test_invalidate(self):
+        self.provider.set(self.file_path, "some_session_id", True, time.time() + 3600)
+        self.assertEqual(self.provider.get(self.file_path)[:2], ("some_session_id", True))
+
+        self.provider.invalidate(self.file_path)
+        self.assertIsNone(self.provider.get(self.file_path))
+
+    def test_path_lock_shared_by_threads(self):
+        barrier = threading.Barrier(8)
+
+        def get_lock(_num):
+            barrier.wait()
+            return SessionProvider._path_lock(self.file_path)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            locks = list(executor.map(get_lock, range(8)))
+        self.assertEqual(len({id(lock) for lock in locks}), 1)
+
+
 def main():
     unittest.main()
 
@@ -5,13 +5,17 @@ Test for PyOTRS Ticket class
 
 import unittest
 from datetime import datetime
+from unittest import mock
 
 from pyotrs.lib import (
     ArgumentInvalidError,
     ArgumentMissingError,
     Article,
+    CompactArticle,
+    CompactTicket,
     DynamicField,
     Ticket,
+    _IndexedList,
 )
 
 
@@ -653,6 +657,148 @@ class TicketTests(unittest.TestCase):
                                          'Service': 'Ticket-Service',
                                          'OtrsField': 'Some OTRS field'}})
 
+    def test_init_lazy_articles_and_dynamic_fields(self):
+        """Articles and DynamicFields are only parsed on first access"""
+        dct = {"TicketID": "1",
+               "Article": [{"ArticleID": "2"}, {"ArticleID": "3"}],
+               "DynamicField": [{"Name": "firstname", "Value": "Jane"}]}
+
+        with mock.patch('pyotrs.lib.Article', wraps=Article) as mock_article:
+            tic = Ticket(dct)
+            self.assertEqual(tic.field_get("TicketID"), "1")
+            self.assertEqual(mock_article.call_count, 0)
+
+            self.assertEqual([art.aid for art in tic.articles], [2, 3])
+            self.assertIs(tic.articles, tic.articles)
+            self.assertEqual(mock_article.call_count, 2)
+
+        self.assertEqual(tic.dynamic_field_get("firstname").value, "Jane")
+        self.assertNotIn("Article", tic.fields)
+        self.assertNotIn("DynamicField", tic.fields)
+
+    def test_articles_setter(self):
+        tic = Ticket({"TicketID": "1", "Article": [{"ArticleID": "2"}]})
+        tic.articles = [Article({"ArticleID": "5"})]
+        self.assertEqual(tic.article_get(5).aid, 5)
+        self.assertIsNone(tic.article_get(2))
+
+    def test_dynamic_field_get_index_follows_mutations(self):
+        tic = Ticket({"TicketID": "1",
+                      "DynamicField": [{"Name": "firstname", "Value": "Jane"},
+                                       {"Name": "firstname", "Value": "John"}]})
+
+        self.assertEqual(tic.dynamic_field_get("firstname").value, "Jane")
+        self.assertIsNone(tic.dynamic_field_get("lastname"))
+
+        tic.dynamic_fields.append(DynamicField("lastname", "Doe"))
+        self.assertEqual(tic.dynamic_field_get("lastname").value, "Doe")
+
+        del tic.dynamic_fields[0]
+        self.assertEqual(tic.dynamic_field_get("firstname").value, "John")
+
+        tic.dynamic_fields[0].name = "nickname"
+        self.assertIsNone(tic.dynamic_field_get("firstname"))
+        self.assertEqual(tic.dynamic_field_get("nickname").value, "John")
+
+    def test_dynamic_field_get_index_follows_rename_on_miss(self):
+        tic = Ticket({"TicketID": "1", "DynamicField": [{"Name": "a", "Value": "Jane"}]})
+
+        self.assertEqual(tic.dynamic_field_get("a").value, "Jane")
+        tic.dynamic_fields[0].name = "b"
+        self.assertEqual(tic.dynamic_field_get("b").value, "Jane")
+        self.assertIsNone(tic.dynamic_field_get("a"))
+
+    def test_dynamic_field_get_miss_does_not_rebuild_index(self):
+        tic = Ticket({"TicketID": "1", "DynamicField": [{"Name": "a", "Value": "Jane"}]})
+        self.assertIsNone(tic.dynamic_field_get("X"))
+
+        with mock.patch.object(_IndexedList, '_build_index', autospec=True,
+                               side_effect=_IndexedList._build_index) as mock_build:
+            for _ in range(10):
+                self.assertIsNone(tic.dynamic_field_get("X"))
+            self.assertEqual(mock_build.call_count, 0)
+
+            DynamicField("created", "not renamed")
+            tic.dynamic_fields[0].name = "b"
+            self.assertEqual(tic.dynamic_field_get("b").value, "Jane")
+            self.assertIsNone(tic.dynamic_field_get("X"))
+            self.assertEqual(mock_build.call_count, 1)
+
+    def test_article_get_index_follows_mutations(self):
+        tic = Ticket({"TicketID": "1", "Article": [{"ArticleID": "2"}]})
+
+        self.assertEqual(tic.article_get(2).aid, 2)
+        tic.articles.insert(0, Article({"ArticleID": "7"}))
+        self.assertEqual(tic.article_get("7").aid, 7)
+        tic.articles.clear()
+        self.assertIsNone(tic.article_get(2))
+
+    def test_compact_ticket_same_api(self):
+        dct = {"TicketID": "1", "State": "open", "Custom": "foo",
+               "Article": [{"ArticleID": "2", "Subject": "bar", "X-Custom": "baz",
+                            "Attachment": [{"Filename": "a.txt", "Content": "YmFyCg=="}]}],
+               "DynamicField": [{"Name": "firstname", "Value": "Jane"}]}
+
+        tic = Ticket(dict(dct))
+        compact = CompactTicket(dict(dct))
+
+        self.assertIsInstance(compact, Ticket)
+        self.assertEqual(compact.__repr__(), "<CompactTicket: 1>")
+        self.assertEqual(compact.field_get("State"), "open")
+        self.assertEqual(compact.field_get("Custom"), "foo")
+        self.assertIsNone(compact.field_get("Title"))
+        self.assertDictEqual(compact.to_dct(), tic.to_dct())
+        self.assertIsInstance(compact.article_get(2), CompactArticle)
+        self.assertEqual(compact.article_get(2).field_get("X-Custom"), "baz")
+        self.assertEqual(compact.article_get(2).attachment_get("a.txt").Filename, "a.txt")
+        self.assertEqual(compact.dynamic_field_get("firstname").value, "Jane")
+
+    def test_compact_ticket_fields_mapping(self):
+        compact = CompactTicket.create_basic(Title="foobar", QueueID="1", State="open",
+                                             PriorityID="5", CustomerUser="root@localhost")
+        self.assertIsInstance(compact, CompactTicket)
+
+        compact.field_add(SLA="1h", OtrsField="Some OTRS field")
+        self.assertEqual(len(compact.fields), 7)
+        self.assertEqual(compact.fields, {"Title": "foobar", "QueueID": "1", "State": "open",
+                                          "PriorityID": "5", "CustomerUser": "root@localhost",
+                                          "SLA": "1h", "OtrsField": "Some OTRS field"})
+
+        del compact.fields["SLA"]
+        del compact.fields["OtrsField"]
+        self.assertNotIn("SLA", compact.fields)
+        self.assertRaises(KeyError, compact.fields.__delitem__, "SLA")
+        self.assertRaises(KeyError, compact.fields.__delitem__, "OtrsField")
+
+    def test_compact_ticket_interns_values(self):
+        first = CompactTicket({"TicketID": "1", "State": "".join(["op", "en"])})
+        second = CompactTicket({"TicketID": "2", "State": "".join(["o", "pen"])})
+        self.assertIs(first.field_get("State"), second.field_get("State"))
+
+    def test_to_dct_lazy_same_as_parsed(self):
+        def dct():
+            return {"TicketID": "1",
+                    "DynamicField": [{"Name": "firstname", "Value": "Jane"}],
+                    "Article": [{"ArticleID": "2",
+                                 "DynamicField": [{"Name": "lastname", "Value": "Doe"}],
+                                 "Attachment": [{"Filename": "a.txt", "Content": "YmFyCg==",
+                                                 "ContentType": "text/plain"}]}]}
+
+        lazy = Ticket(dct())
+        parsed = Ticket(dct())
+        parsed.articles[0].attachments  # noqa: B018
+        parsed.dynamic_fields  # noqa: B018
+
+        for kwargs in ({}, {"article_attachment_cont": False},
+                       {"article_attachments": False, "article_dynamic_fields": False},
+                       {"articles": False, "dynamic_fields": False}):
+            self.assertEqual(lazy.to_dct(**kwargs), parsed.to_dct(**kwargs))
+
+        self.assertIsNone(lazy._articles)
+        self.assertIsNone(lazy._dynamic_fields)
+        self.assertEqual(lazy.article_get(2).attachment_get("a.txt").Content, "YmFyCg==")
+        self.assertEqual(parsed.articles[0].attachments[0].Content, "YmFyCg==")
+
 
 def main():
     unittest.main()